@@ -1,6 +1,7 @@
 import streamlit as st
 # views 폴더에서 페이지 모듈들을 가져옵니다
-from views import league_overview, player_dashboard
+from views import admin_metrics, league_overview, player_dashboard
+from instrumentation import timed
 
 # 1. 페이지 기본 설정 (앱 전체에서 가장 먼저 실행되어야 함)
 st.set_page_config(
@@ -10,6 +11,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 숨김 관리자 페이지 (?admin=metrics)
+if st.query_params.get("admin") == "metrics":
+    admin_metrics.show_page()
+    st.stop()
+
 # 2. 사이드바 네비게이션 구성
 st.sidebar.title("Navigation")
 selection = st.sidebar.radio(
@@ -22,11 +28,13 @@ st.sidebar.markdown("---")
 # 3. 선택에 따른 페이지 라우팅
 if selection == "🏆 1. 리그 오버뷰 (팀 분석)":
     # 새로 만든 순위/히트맵 페이지 실행
-    league_overview.show_page()
+    with timed('app.league_overview'):
+        league_overview.show_page()
 
 elif selection == "🔍 2. 선수 탐색 대시보드":
     # 기존 대시보드 실행
-    player_dashboard.show_page()
+    with timed('app.player_dashboard'):
+        player_dashboard.show_page()
 
 # 공통 푸터
 st.sidebar.caption("데이터시각화 6조")
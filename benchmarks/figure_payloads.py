@@ -0,0 +1,125 @@
+"""
+Plotly 차트 전송량(payload) 측정
+
+대시보드의 각 차트(리그 히트맵, 선수 순위 차트, 선수 프로필 차트)를 실제 빌더 함수로 만들고,
+st.plotly_chart가 보내는 것과 같은 JSON 직렬화 크기를 figure_payload.compact_figure 적용 전/후로 비교하여 저장합니다.
+
+사용 예:
+    python -m benchmarks.figure_payloads --dataset dataset_new --profile-players 3 --output figure_payloads_output.json
+"""
+import argparse
+import json
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+from benchmarks.run_benchmarks import _git_commit
+from dataset_registry import DatasetRegistry
+from figure_payload import compact_figure, payload_size
+from views.league_overview import build_team_heatmap, scale_team_stats
+from views.player_dashboard import (
+    build_attribute_heatmap, build_category_bar, build_category_radar, build_key_stat_bar, build_key_stat_radar,
+    build_ranking_chart, build_score_bar,
+)
+
+# 대시보드와 같은 포지션별 핵심 스텟 (첫 번째 선수 포지션 기준)
+KEY_ATTRIBUTES = {
+    'Goalkeeper': ['Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility'],
+    'Defender': ['Marking', 'Tackling', 'Heading', 'Positioning', 'Strength', 'Pace'],
+    'Midfielder': ['Passing', 'Vision', 'Technique', 'Stamina', 'Workrate', 'FirstTouch'],
+    'Forward': ['Finishing', 'Dribbling', 'Pace', 'Acceleration', 'Composure', 'OffTheBall'],
+}
+RANKING_COLORS = ('#00CC96', '#636EFA', '#AB63FA')
+
+
+def _league_charts(registry):
+    charts = {}
+    keys = registry.team_seasons()
+    if not keys:
+        return charts
+    df_raw = registry.load_team_stats(keys[0]).copy()
+    for label, count, height in (('league_heatmap_top10', 10, 600), ('league_heatmap_all', len(df_raw), 800)):
+        charts[label] = (build_team_heatmap(scale_team_stats(df_raw.head(count)), label, height), True)
+    return charts
+
+
+def _player_charts(processor, df, top_n, profile_players):
+    charts = {}
+    df_display = processor.get_top_talents(n=top_n, age_range=(18, 25)).copy()
+    df_display['Rank'] = range(1, len(df_display) + 1)
+    df_display['Display_Name'] = [
+        f"{rank}. {name} ({int(age)}세)" for rank, name, age in zip(df_display['Rank'], df_display['Name'], df_display['Age'])
+    ]
+    colors_bar = [RANKING_COLORS[0] if age <= 21 else RANKING_COLORS[1] if age <= 24 else RANKING_COLORS[2]
+                  for age in df_display['Age']]
+    # 순위 차트는 plotly_events 컴포넌트로 그리므로 typed array 없이 축소 (대시보드와 같은 조건)
+    charts['player_ranking'] = (
+        build_ranking_chart(df_display, 'Talent_Score_Normalized', "유망주 점수", colors_bar), False
+    )
+
+    selected = df_display.head(profile_players)
+    categories = list(processor.PROFILE_COLUMNS)
+    profile_values = selected[list(processor.PROFILE_COLUMNS.values())].to_numpy(dtype=float)
+    all_player_values = [{'name': name, 'values': values.tolist()}
+                         for name, values in zip(selected['Name'], profile_values)]
+    first_position = selected.iloc[0]['Position_Category']
+    key_attrs = [a for a in KEY_ATTRIBUTES.get(first_position, KEY_ATTRIBUTES['Forward']) if a in df.columns]
+
+    charts['profile_category_radar'] = (build_category_radar(all_player_values, categories), True)
+    charts['profile_category_bar'] = (build_category_bar(all_player_values, categories), True)
+    charts['profile_key_radar'] = (build_key_stat_radar(selected, key_attrs, first_position), True)
+    charts['profile_key_bar'] = (build_key_stat_bar(selected, key_attrs, first_position), True)
+    for label, attributes in (('technical', processor.TECHNICAL_ATTRIBUTES),
+                              ('mental', processor.MENTAL_ATTRIBUTES),
+                              ('physical', processor.PHYSICAL_ATTRIBUTES)):
+        columns = [c for c in attributes if c in df.columns]
+        compare_df = selected[['Name'] + columns].set_index('Name').T.round(1)
+        charts[f'profile_{label}_heatmap'] = (build_attribute_heatmap(compare_df, 'RdBu', label, 500), True)
+    score_cols = ['Name', 'Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating',
+                  'Talent_Score_Normalized']
+    charts['profile_score_bar'] = (build_score_bar(selected[score_cols]), True)
+    return charts
+
+
+def measure(charts):
+    """차트별 축소 전/후 JSON 크기 (바이트)"""
+    results = {}
+    for label, (fig, typed_arrays) in charts.items():
+        before = payload_size(fig)
+        after = payload_size(compact_figure(fig, typed_arrays=typed_arrays))
+        results[label] = {'before_bytes': before, 'after_bytes': after, 'typed_arrays': typed_arrays,
+                          'reduction': 1 - after / before}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plotly 차트 전송량 측정 (compact_figure 적용 전/후)")
+    parser.add_argument('--data-dir', default=os.environ.get('EPL_DATA_DIR', '.'), help="앱 데이터 폴더 (EPL_DATA_DIR)")
+    parser.add_argument('--dataset', default='dataset_new', help="선수 데이터셋 이름")
+    parser.add_argument('--top-n', type=int, default=20, help="순위 차트 선수 수 (대시보드 기본값 20)")
+    parser.add_argument('--profile-players', type=int, default=3, help="프로필 비교 선수 수 (최대 5)")
+    parser.add_argument('--output', default='figure_payloads_output.json', help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    registry = DatasetRegistry(data_dir=args.data_dir)
+    with redirect_stdout(StringIO()):
+        df, processor = registry.load_players(args.dataset)
+
+    charts = _league_charts(registry)
+    charts.update(_player_charts(processor, df, args.top_n, args.profile_players))
+    results = measure(charts)
+
+    for label, item in results.items():
+        print(f"{label:<28} {item['before_bytes']:>8,} B -> {item['after_bytes']:>8,} B "
+              f"({item['reduction']:.0%} 감소)", file=sys.stderr)
+
+    report = {'commit': _git_commit(), 'dataset': args.dataset, 'top_n': args.top_n,
+              'profile_players': args.profile_players, 'charts': results}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과를 저장했습니다: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+벤치마크용 합성 선수 데이터 생성기
+FootballDataProcessor.COLUMN_MAPPING 스키마(약어 컬럼)를 따르는 선수 CSV를 생성합니다.
+
+사용 예:
+    python -m benchmarks.generate_players --rows 160000 --output benchmarks/data/players_160k.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_processor import FootballDataProcessor
+
+# 실제 데이터셋과 비슷한 분포의 Position 문자열 (문자열, 가중치)
+POSITION_STRINGS = [
+    ('GK', 0.10),
+    ('D (C)', 0.14),
+    ('D (RC)', 0.03),
+    ('D (LC)', 0.03),
+    ('D (R)', 0.04),
+    ('D (L)', 0.04),
+    ('D/WB (R)', 0.03),
+    ('D/WB (L)', 0.03),
+    ('D/WB (RL)', 0.01),
+    ('D (RLC)', 0.01),
+    ('D (C), DM', 0.03),
+    ('DM', 0.05),
+    ('DM, M (C)', 0.05),
+    ('M (C)', 0.07),
+    ('M (R)', 0.02),
+    ('M (L)', 0.02),
+    ('M/AM (C)', 0.04),
+    ('M/AM (R)', 0.01),
+    ('M/AM (L)', 0.01),
+    ('M (RLC), AM (C)', 0.02),
+    ('AM (C)', 0.04),
+    ('AM (RL)', 0.04),
+    ('AM (R), ST (C)', 0.03),
+    ('AM (L), ST (C)', 0.03),
+    ('AM (RLC), ST (C)', 0.03),
+    ('ST (C)', 0.10),
+]
+
+FIRST_NAMES = [
+    'James', 'Lucas', 'Mateo', 'José', 'João', 'Luka', 'Kai', 'Théo', 'Jérémy', 'Mohamed',
+    'Ibrahima', 'Kevin', 'Jürgen', 'Søren', 'Bruno', 'Ángel', 'Marco', 'Youssef', 'Ethan', 'Noah',
+    'Kenji', 'Min-jae', 'Heung-min', 'Dušan', 'Łukasz', 'Pierre', 'Emre', 'Antoine', 'Nicolás', 'Sergio',
+]
+
+LAST_NAMES = [
+    'Smith', 'Silva', 'Santos', 'Müller', 'García', 'Fernández', 'Rodríguez', 'Martínez', 'Rossi', 'Dubois',
+    'Kovačić', 'Nowak', 'Johansson', 'Jensen', 'Yılmaz', 'Diallo', 'Traoré', 'Kim', 'Son', 'Lee',
+    'Tanaka', 'Van Dijk', "O'Brien", 'Mbappé', 'Gonçalves', 'Schmidt', 'Petrović', 'Hernández', 'Costa', 'Walker',
+]
+
+ATTRIBUTE_COLUMNS = [
+    col for col in FootballDataProcessor.COLUMN_MAPPING
+    if col not in ('Nat', 'Left Foot', 'Right Foot')
+]
+
+CHUNK_SIZE = 100_000
+
+
+def _height_strings(rng, size):
+    """키 문자열 생성 (피트/인치, cm, 숫자 형식 혼합)"""
+    cm = rng.normal(181, 7, size).clip(160, 205)
+    total_inches = np.round(cm / 2.54).astype(int)
+    feet_inches = np.char.add(
+        np.char.add((total_inches // 12).astype(str), "'"),
+        np.char.add((total_inches % 12).astype(str), '"')
+    )
+    cm_str = np.char.add(cm.astype(int).astype(str), ' cm')
+    kind = rng.random(size)
+    return np.where(kind < 0.7, feet_inches, np.where(kind < 0.95, cm_str, cm.astype(int).astype(str)))
+
+
+def _weight_strings(rng, size):
+    """몸무게 문자열 생성 (kg, lbs 형식 혼합)"""
+    kg = rng.normal(75, 7, size).clip(55, 100)
+    kg_str = np.char.add(kg.astype(int).astype(str), ' kg')
+    lbs_str = np.char.add((kg / 0.453592).astype(int).astype(str), ' lbs')
+    return np.where(rng.random(size) < 0.8, kg_str, lbs_str)
+
+
+def generate_chunk(rng, start_uid, size):
+    """size 행의 합성 선수 DataFrame 생성"""
+    ages = rng.integers(15, 40, size)
+    birth_years = 2024 - ages
+    dob = pd.to_datetime({
+        'year': birth_years,
+        'month': rng.integers(1, 13, size),
+        'day': rng.integers(1, 29, size),
+    }).dt.strftime('%d/%m/%Y')
+
+    names = np.char.add(
+        np.char.add(rng.choice(FIRST_NAMES, size), ' '),
+        rng.choice(LAST_NAMES, size)
+    )
+
+    positions, weights = zip(*POSITION_STRINGS)
+    weights = np.asarray(weights) / np.sum(weights)
+
+    data = {
+        'UID': np.arange(start_uid, start_uid + size),
+        'Name': names,
+        'DOB': dob.values,
+        'Age': ages,
+        'Position': rng.choice(positions, size, p=weights),
+        'Height': _height_strings(rng, size),
+        'Weight': _weight_strings(rng, size),
+        'Nat': rng.integers(1, 200, size),
+        'Left Foot': rng.integers(1, 21, size),
+        'Right Foot': rng.integers(1, 21, size),
+    }
+
+    # 선수별 기본 실력에 능력치별 편차를 더해 상관관계가 있는 능력치 생성
+    base_quality = rng.normal(10, 2.5, (size, 1))
+    attributes = np.rint(base_quality + rng.normal(0, 2.5, (size, len(ATTRIBUTE_COLUMNS))))
+    attributes = attributes.clip(1, 20).astype(np.int64)
+    for idx, col in enumerate(ATTRIBUTE_COLUMNS):
+        data[col] = attributes[:, idx]
+
+    return pd.DataFrame(data)
+
+
+def generate_players_csv(output_path, rows, seed=42):
+    """
+    합성 선수 CSV 파일 생성 (CHUNK_SIZE 단위로 나누어 기록)
+
+    Args:
+        output_path: 저장할 CSV 경로
+        rows: 생성할 선수 수
+        seed: 난수 시드
+
+    Returns:
+        저장한 CSV 경로
+    """
+    rng = np.random.default_rng(seed)
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    written = 0
+    while written < rows:
+        size = min(CHUNK_SIZE, rows - written)
+        chunk = generate_chunk(rng, start_uid=written + 1, size=size)
+        chunk.to_csv(output_path, mode='w' if written == 0 else 'a', header=(written == 0), index=False)
+        written += size
+
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 선수 데이터 CSV 생성")
+    parser.add_argument('--rows', type=int, default=10_000, help="생성할 선수 수")
+    parser.add_argument('--output', default='benchmarks/data/players_10k.csv', help="저장할 CSV 경로")
+    parser.add_argument('--seed', type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    path = generate_players_csv(args.output, args.rows, seed=args.seed)
+    print(f"{args.rows:,}명의 합성 선수 데이터를 생성했습니다: {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+멀티 워커 메모리/지연 시간 부하 테스트
+
+공유 데이터셋(shared_dataset.py)을 한 번 생성한 뒤, N개의 워커 프로세스가
+- shared: 공유 데이터셋을 읽기 전용으로 연결 (멀티 워커 배포 모드)
+- copy: 같은 데이터를 각자 메모리에 복사 (기존 단일 프로세스 방식을 N개 띄운 경우)
+방식으로 데이터를 준비하고, get_top_talents / 대시보드 필터 체인 요청을 동시에 반복 실행합니다.
+워커별 RSS/PSS 합계와 요청 지연 시간(p50/p95), 처리량을 JSON으로 저장합니다.
+(PSS는 공유 페이지를 프로세스 수로 나눈 값으로, 실제 물리 메모리 사용량에 가깝습니다. Linux 전용)
+
+사용 예:
+    python -m benchmarks.multiworker_load --rows 160000 --workers 1 2 4 --output multiworker_output.json
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+from benchmarks.generate_players import generate_players_csv
+from benchmarks.run_benchmarks import DATA_DIR, FILTER_CASES, TOP_TALENT_CASES, _git_commit, _size_label
+from filter_engine import apply_filters, select_top
+from shared_dataset import attach_dataset, attach_processor, build_shared_dataset
+from data_processor import FootballDataProcessor
+
+DEFAULT_WORKERS = [1, 2, 4]
+MODES = ['shared', 'copy']
+
+
+def read_memory():
+    """현재 프로세스의 RSS/PSS (MB). PSS를 읽을 수 없으면 None"""
+    usage = {'rss_mb': None, 'pss_mb': None}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('Rss', 'Pss'):
+                    usage[f'{key.lower()}_mb'] = int(value.split()[0]) / 1024
+    except OSError:
+        import resource
+        usage['rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return usage
+
+
+def _copy_processor(shared_path):
+    """공유 데이터셋을 프로세스 전용 메모리로 복사하여 프로세서 구성 (copy 모드)"""
+    df = attach_dataset(shared_path).copy(deep=True)
+    processor = FootballDataProcessor(None)
+    processor.df = df
+    processor.processed_df = df
+    processor._build_indexes()
+    return df, processor
+
+
+def _request_plan(requests):
+    """워커가 순서대로 실행할 (종류, 케이스 이름) 목록"""
+    cases = [('top_talents', name) for name in TOP_TALENT_CASES] + [('filter_chain', name) for name in FILTER_CASES]
+    return [cases[i % len(cases)] for i in range(requests)]
+
+
+def _worker(mode, shared_path, requests, barrier, results):
+    with redirect_stdout(StringIO()):
+        if mode == 'shared':
+            df, processor = attach_processor(shared_path)
+        else:
+            df, processor = _copy_processor(shared_path)
+    ready_memory = read_memory()
+
+    # 모든 워커가 준비된 뒤 동시에 요청 시작
+    barrier.wait()
+    latencies = {}
+    start = time.perf_counter()
+    for kind, name in _request_plan(requests):
+        request_start = time.perf_counter()
+        if kind == 'top_talents':
+            processor.get_top_talents(**TOP_TALENT_CASES[name])
+        else:
+            age_range, position, stat_filters = FILTER_CASES[name]
+            select_top(apply_filters(df, age_range, position, stat_filters), 10)
+        latencies.setdefault(kind, []).append(time.perf_counter() - request_start)
+    elapsed = time.perf_counter() - start
+
+    results.put({'pid': os.getpid(), 'ready': ready_memory, 'after': read_memory(),
+                 'elapsed': elapsed, 'latencies': latencies})
+
+
+def run_load(mode, workers, shared_path, requests):
+    """N개 워커를 동시에 실행하여 메모리/지연 시간 요약 반환"""
+    ctx = mp.get_context('spawn')  # fork는 부모 메모리를 공유하므로 측정이 왜곡됨
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=_worker, args=(mode, shared_path, requests, barrier, results))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    def total(stage, key):
+        values = [r[stage][key] for r in reports]
+        return None if any(v is None for v in values) else float(sum(values))
+
+    latency_summary = {}
+    for kind in reports[0]['latencies']:
+        durations = np.concatenate([r['latencies'][kind] for r in reports])
+        latency_summary[kind] = {
+            'p50_ms': float(np.percentile(durations, 50) * 1000),
+            'p95_ms': float(np.percentile(durations, 95) * 1000),
+            'count': int(len(durations)),
+        }
+
+    return {
+        'mode': mode,
+        'workers': workers,
+        'total_rss_mb': total('ready', 'rss_mb'),
+        'total_pss_mb': total('ready', 'pss_mb'),
+        'total_rss_after_mb': total('after', 'rss_mb'),
+        'total_pss_after_mb': total('after', 'pss_mb'),
+        'throughput_rps': float(workers * requests / max(r['elapsed'] for r in reports)),
+        'latency': latency_summary,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티 워커 메모리/지연 시간 부하 테스트")
+    parser.add_argument('--rows', type=int, default=160_000, help="합성 데이터 선수 수 (--csv 미지정 시)")
+    parser.add_argument('--csv', default=None, help="사용할 선수 CSV (지정 시 합성 데이터 생성 생략)")
+    parser.add_argument('--workers', type=int, nargs='+', default=DEFAULT_WORKERS, help="워커 수 목록")
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES, help="데이터 준비 방식")
+    parser.add_argument('--requests', type=int, default=200, help="워커당 요청 수")
+    parser.add_argument('--shared-dir', default=os.path.join(DATA_DIR, 'shared'), help="공유 데이터셋 생성 폴더")
+    parser.add_argument('--output', default='multiworker_output.json', help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    csv_path = args.csv
+    if csv_path is None:
+        csv_path = os.path.join(DATA_DIR, f"players_{_size_label(args.rows)}.csv")
+        if not os.path.exists(csv_path):
+            print(f"합성 데이터 생성 중: {csv_path}", file=sys.stderr)
+            generate_players_csv(csv_path, args.rows)
+
+    # 로더: 처리 결과를 한 번만 계산하여 공유 데이터셋으로 내보내기
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    print(f"공유 데이터셋 생성 중: {name}", file=sys.stderr)
+    with redirect_stdout(StringIO()):
+        build_shared_dataset(csv_path, args.shared_dir, name=name)
+    shared_path = os.path.join(args.shared_dir, name)
+
+    runs = []
+    for mode in args.modes:
+        for workers in args.workers:
+            summary = run_load(mode, workers, shared_path, args.requests)
+            runs.append(summary)
+            pss = summary['total_pss_mb']
+            print(f"[{mode} x{workers}] RSS {summary['total_rss_mb']:.0f}MB"
+                  + (f", PSS {pss:.0f}MB" if pss is not None else "")
+                  + f", {summary['throughput_rps']:.0f} req/s", file=sys.stderr)
+
+    report = {'commit': _git_commit(), 'csv': csv_path, 'requests_per_worker': args.requests, 'runs': runs}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과를 저장했습니다: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+데이터 처리 파이프라인 및 필터/순위 경로 벤치마크
+
+합성 선수 데이터(10k/160k/1M)에 대해 load_data, process_all 각 단계,
+get_top_talents, 대시보드 필터 체인, 선수 이름 검색의 소요 시간을 측정하여 JSON으로 저장합니다.
+커밋별 결과 파일을 비교하여 성능 변화를 확인할 수 있습니다.
+
+사용 예:
+    python -m benchmarks.run_benchmarks --sizes 10000 160000 --output bench_output.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+import instrumentation
+from benchmarks.generate_players import generate_players_csv
+from data_processor import FootballDataProcessor
+from filter_engine import apply_filters, select_top
+from name_search import NameSearchIndex
+
+DEFAULT_SIZES = [10_000, 160_000, 1_000_000]
+DATA_DIR = os.path.join('benchmarks', 'data')
+
+# get_top_talents 호출 시나리오
+TOP_TALENT_CASES = {
+    'all': dict(n=50),
+    'young_forward': dict(n=50, age_range=(18, 21), position='Forward'),
+    'defender_min_rating': dict(n=50, age_range=(18, 25), position='Defender', min_rating=12),
+    'goalkeeper_top10': dict(n=10, position='Goalkeeper'),
+}
+
+# 대시보드 필터 체인 시나리오 (나이 범위, 포지션, 능력치 최소값)
+FILTER_CASES = {
+    'default': ((18, 25), 'All', {'Overall_Rating': 10.0}),
+    'fast_winger': ((18, 21), 'Forward', {'Pace': 16, 'Dribbling': 15}),
+    'strong_defender': ((18, 25), 'Defender', {'Tackling': 15, 'Strength': 15, 'Heading': 14}),
+    'passing_midfielder': ((18, 23), 'Midfielder', {'Passing': 16, 'Vision': 15, 'Technique': 15}),
+}
+
+# 선수 이름 검색 시나리오 (짧은 접두사, 악센트 없는 입력, 두 단어, 중간 일치)
+NAME_SEARCH_QUERIES = {
+    'one_letter': 'l',
+    'folded_prefix': 'lukasz',
+    'two_words': 'van dijk',
+    'infix': 'osta',
+}
+
+
+def _size_label(rows):
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1_000 and rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def _time_repeated(func, repeat):
+    """func를 repeat회 실행하여 중앙값/최솟값(초) 반환"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {'median': float(np.median(durations)), 'min': float(np.min(durations)), 'repeat': repeat}
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark_dataset(csv_path, repeat):
+    """하나의 CSV에 대해 파이프라인 및 조회 경로 측정"""
+    results = {}
+
+    # load_data 단독 측정
+    loader = FootballDataProcessor(csv_path)
+    with redirect_stdout(StringIO()):
+        results['load_data'] = _time_repeated(loader.load_data, 1)
+
+    # process_all 단계별 측정 (instrumentation 구간 재사용)
+    instrumentation.reset()
+    processor = FootballDataProcessor(csv_path)
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        df = processor.process_all()
+    results['process_all'] = {'total': time.perf_counter() - start}
+    for item in instrumentation.get_summary():
+        if item['section'].startswith('process_all.'):
+            results['process_all'][item['section'].split('.', 1)[1]] = item['last']
+
+    results['get_top_talents'] = {
+        name: _time_repeated(lambda kwargs=kwargs: processor.get_top_talents(**kwargs), repeat)
+        for name, kwargs in TOP_TALENT_CASES.items()
+    }
+
+    results['filter_chain'] = {
+        name: _time_repeated(
+            lambda case=case: select_top(apply_filters(df, *case), 10), repeat
+        )
+        for name, case in FILTER_CASES.items()
+    }
+
+    start = time.perf_counter()
+    name_index = NameSearchIndex(df['Name'], df['Talent_Score_Normalized'])
+    results['name_search'] = {'build_index': time.perf_counter() - start}
+    for name, query in NAME_SEARCH_QUERIES.items():
+        results['name_search'][name] = _time_repeated(lambda query=query: name_index.search(query), repeat)
+
+    results['rows'] = len(df)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 처리 파이프라인 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="벤치마크할 선수 수 목록")
+    parser.add_argument('--repeat', type=int, default=5, help="조회 경로 반복 측정 횟수")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="합성 데이터 CSV 저장 폴더")
+    parser.add_argument('--output', default='bench_output.json', help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'results': {},
+    }
+
+    for rows in args.sizes:
+        label = _size_label(rows)
+        csv_path = os.path.join(args.data_dir, f"players_{label}.csv")
+        if not os.path.exists(csv_path):
+            print(f"[{label}] 합성 데이터 생성 중... ({csv_path})", file=sys.stderr)
+            generate_players_csv(csv_path, rows)
+
+        print(f"[{label}] 벤치마크 실행 중...", file=sys.stderr)
+        report['results'][label] = benchmark_dataset(csv_path, args.repeat)
+        print(f"[{label}] process_all: {report['results'][label]['process_all']['total']:.2f}s", file=sys.stderr)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"결과를 저장했습니다: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+동시 대시보드 세션 부하 테스트
+
+Streamlit AppTest로 app.py를 헤드리스 실행하여 스카우트 한 명의 사용 흐름
+(페이지 이동 -> 포지션/나이 필터 조정 -> 선수 클릭 -> 선택 초기화 -> 리그 오버뷰 복귀)을
+여러 세션이 동시에 재생합니다. 세션은 같은 프로세스의 스레드로 실행되므로
+st.cache_resource(데이터셋 레지스트리)를 공유하는 실제 서버 한 대와 같은 조건입니다.
+동시 세션 수별로 처리량(상호작용/초)과 상호작용 종류별 rerun 지연 시간 p50/p95를 JSON으로 저장합니다.
+
+사용 예:
+    python -m benchmarks.session_load --concurrency 1 2 4 8 --iterations 3 --output session_load_output.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.run_benchmarks import _git_commit
+from dataset_registry import DatasetRegistry
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+DEFAULT_CONCURRENCY = [1, 2, 4, 8]
+PAGE_LEAGUE = "🏆 1. 리그 오버뷰 (팀 분석)"
+PAGE_PLAYERS = "🔍 2. 선수 탐색 대시보드"
+
+# 세션 한 번의 상호작용 순서 (종류, 값)
+SCENARIO = [
+    ('switch_page', PAGE_PLAYERS),
+    ('position', 'Forward'),
+    ('age', (18, 21)),
+    ('click_player', 0),
+    ('click_player', 1),
+    ('position', 'Defender'),
+    ('age', (19, 24)),
+    ('click_player', 2),
+    ('reset_selection', None),
+    ('switch_page', PAGE_LEAGUE),
+]
+
+
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def _interact(at, kind, value, candidates):
+    """상호작용 하나를 적용하고 rerun"""
+    if kind == 'switch_page':
+        at.sidebar.radio[0].set_value(value)
+    elif kind == 'position':
+        _widget(at.sidebar.selectbox, "⚽ 포지션 선택").set_value(value)
+    elif kind == 'age':
+        _widget(at.sidebar.slider, "📅 나이 범위").set_value(value)
+    elif kind == 'click_player':
+        # plotly_events 클릭은 AppTest에서 재현할 수 없으므로, 클릭 처리 결과(선택 목록 추가)를 그대로 적용
+        clicked = list(at.session_state['clicked_players']) if 'clicked_players' in at.session_state else []
+        clicked.append(candidates[value % len(candidates)])
+        at.session_state['clicked_players'] = clicked[-5:]
+    elif kind == 'reset_selection':
+        at.session_state['clicked_players'] = []
+    at.run()
+
+
+def _session(iterations, candidates, timeout, start_event, latencies, errors):
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    start_event.wait()
+
+    steps = [('initial_load', None)] + SCENARIO * iterations
+    for kind, value in steps:
+        start = time.perf_counter()
+        if kind == 'initial_load':
+            at.run()
+        else:
+            _interact(at, kind, value, candidates)
+        latencies.append((kind, time.perf_counter() - start))
+        if at.exception:
+            errors.append(f"{kind}: {at.exception[0].message}")
+
+
+def run_level(concurrency, iterations, candidates, timeout):
+    """동시 세션 concurrency개를 실행하여 처리량/지연 시간 요약 반환"""
+    latencies, errors = [], []
+    start_event = threading.Event()
+    threads = [
+        threading.Thread(target=_session, args=(iterations, candidates, timeout, start_event, latencies, errors))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    start_event.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    by_kind = {}
+    for kind, duration in latencies:
+        by_kind.setdefault(kind, []).append(duration)
+
+    return {
+        'concurrency': concurrency,
+        'interactions': len(latencies),
+        'elapsed': elapsed,
+        'throughput_per_s': len(latencies) / elapsed if elapsed > 0 else None,
+        'latency': {
+            kind: {
+                'p50_ms': float(np.percentile(durations, 50) * 1000),
+                'p95_ms': float(np.percentile(durations, 95) * 1000),
+                'count': len(durations),
+            }
+            for kind, durations in by_kind.items()
+        },
+        'errors': errors[:20],
+    }
+
+
+def _click_candidates(data_dir, count=10):
+    """클릭 대상 선수 UID (기본 필터 조건의 상위 유망주, 대시보드 순위 차트와 같은 후보)"""
+    registry = DatasetRegistry(data_dir=data_dir)
+    names = registry.player_datasets()
+    if not names:
+        raise SystemExit(f"선수 데이터셋이 없습니다: {data_dir}")
+    name = 'dataset_new' if 'dataset_new' in names else names[0]
+    with redirect_stdout(StringIO()):
+        _, processor = registry.load_players(name)
+    return processor.get_top_talents(n=count, age_range=(18, 25))['UID'].tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 대시보드 세션 부하 테스트 (AppTest)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=DEFAULT_CONCURRENCY, help="동시 세션 수 목록")
+    parser.add_argument('--iterations', type=int, default=2, help="세션당 시나리오 반복 횟수")
+    parser.add_argument('--data-dir', default=os.environ.get('EPL_DATA_DIR', '.'), help="앱 데이터 폴더 (EPL_DATA_DIR)")
+    parser.add_argument('--timeout', type=float, default=300, help="rerun 한 번의 최대 대기 시간(초)")
+    parser.add_argument('--output', default='session_load_output.json', help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    os.environ['EPL_DATA_DIR'] = args.data_dir
+    candidates = _click_candidates(args.data_dir)
+
+    # 첫 세션의 데이터셋 로드/처리가 측정에 섞이지 않도록 한 번 실행해 캐시를 채움
+    print("워밍업 실행 중...", file=sys.stderr)
+    with redirect_stdout(StringIO()):
+        warmup = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+        warmup.run()
+        warmup.sidebar.radio[0].set_value(PAGE_PLAYERS).run()
+
+    levels = []
+    for concurrency in args.concurrency:
+        with redirect_stdout(StringIO()):
+            summary = run_level(concurrency, args.iterations, candidates, args.timeout)
+        levels.append(summary)
+        worst_p95 = max(item['p95_ms'] for item in summary['latency'].values())
+        print(f"[{concurrency} 세션] {summary['throughput_per_s']:.1f} 상호작용/초, "
+              f"최대 p95 {worst_p95:.0f}ms, 오류 {len(summary['errors'])}건", file=sys.stderr)
+
+    report = {'commit': _git_commit(), 'data_dir': args.data_dir, 'iterations': args.iterations,
+              'scenario': [kind for kind, _ in SCENARIO], 'levels': levels}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과를 저장했습니다: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,32 @@
 데이터 전처리 및 유망주 점수 계산 모듈
 새 데이터셋 (dataset_new.csv) 및 기존 데이터셋 (dataset.csv) 지원
 """
+from functools import partial
+
 import pandas as pd
 import numpy as np
 
+from data_validation import InRange, NotNull, Parsable, ValidationReport, validate_frame, write_quarantine
+from instrumentation import timed
+from score_normalization import ScoreNormalizer
+from player_dedup import deduplicate_players
+
+
+def split_position(pos_str):
+    """새 형식 Position 문자열을 포지션 조각으로 분리 (쉼표/슬래시 구분, 예: 'M/AM (R)' -> ['M', 'AM (R)'])"""
+    return str(pos_str).replace(',', '/').split('/')
+
+
+def map_position_token(token, mapping):
+    """포지션 조각 하나를 포지션 컬럼 이름으로 변환 (정확히 일치, 없으면 부분 일치, 둘 다 없으면 None)"""
+    token = token.strip()
+    if token in mapping:
+        return mapping[token]
+    for key, value in mapping.items():
+        if key in token or token in key:
+            return value
+    return None
+
 
 class FootballDataProcessor:
     """축구 선수 데이터를 처리하고 유망주 점수를 계산하는 클래스"""
@@ -106,6 +129,72 @@ class FootballDataProcessor:
                    'Composure', 'FirstTouch', 'Technique']
     }
     
+    # 선수 프로필 5대 분류별 능력치 (프로필 차트/필터/정렬 키로 사용)
+    PROFILE_CATEGORIES = {
+        'Attacking': ['Finishing', 'LongShots', 'Heading', 'OffTheBall'],
+        'Defending': ['Marking', 'Tackling', 'Positioning', 'Anticipation'],
+        'Technical': ['Dribbling', 'Passing', 'FirstTouch', 'Technique', 'Crossing'],
+        'Mental': ['Composure', 'Vision', 'Decisions', 'Determination', 'Workrate'],
+        'Physical': ['Pace', 'Acceleration', 'Stamina', 'Strength', 'Agility']
+    }
+    PROFILE_COLUMNS = {category: f'Profile_{category}' for category in PROFILE_CATEGORIES}
+    
+    # 포지션 매핑 (새 형식 Position 문자열 -> 기존 형식 포지션 컬럼)
+    POSITION_MAPPING = {
+        'GK': 'Goalkeeper',
+        'D (C)': 'DefenderCentral',
+        'D (L)': 'DefenderLeft',
+        'D (R)': 'DefenderRight',
+        'D (LC)': 'DefenderCentral',
+        'D (RC)': 'DefenderCentral',
+        'D (RL)': 'DefenderCentral',
+        'D/WB (L)': 'WingBackLeft',
+        'D/WB (R)': 'WingBackRight',
+        'WB (L)': 'WingBackLeft',
+        'WB (R)': 'WingBackRight',
+        'DM': 'DefensiveMidfielder',
+        'DM (C)': 'DefensiveMidfielder',
+        'M (C)': 'MidfielderCentral',
+        'M (L)': 'MidfielderLeft',
+        'M (R)': 'MidfielderRight',
+        'M (LC)': 'MidfielderCentral',
+        'M (RC)': 'MidfielderCentral',
+        'M/AM (C)': 'MidfielderCentral',
+        'AM (C)': 'AttackingMidCentral',
+        'AM (L)': 'AttackingMidLeft',
+        'AM (R)': 'AttackingMidRight',
+        'AM (LC)': 'AttackingMidCentral',
+        'AM (RC)': 'AttackingMidCentral',
+        'AM (RL)': 'AttackingMidCentral',
+        'AM (RLC)': 'AttackingMidCentral',
+        'M (RLC)': 'MidfielderCentral',
+        'D (RLC)': 'DefenderCentral',
+        'WB (RL)': 'WingBackRight',
+        'ST': 'Striker',
+        'ST (C)': 'Striker',
+    }
+    
+    # 기존 형식 포지션 숙련도 컬럼
+    POSITION_COLUMNS = [
+        'Goalkeeper', 'Sweeper', 'Striker', 'AttackingMidCentral',
+        'AttackingMidLeft', 'AttackingMidRight', 'DefenderCentral',
+        'DefenderLeft', 'DefenderRight', 'DefensiveMidfielder',
+        'MidfielderCentral', 'MidfielderLeft', 'MidfielderRight',
+        'WingBackLeft', 'WingBackRight'
+    ]
+    
+    # 유망주 점수 정규화 방식 ('clip': 이상치만 잘라낸 최소/최대, 'rank': 백분위 순위)
+    SCORE_NORMALIZATION = 'clip'
+    
+    # 데이터 검증 규칙 (load_data 직후 적용, 데이터에 없는 컬럼은 건너뜀)
+    # 능력치는 1~20, 나이는 필수 (결측/범위 밖 값은 최소/최대 정규화 점수를 왜곡)
+    # Position은 포지션 컬럼 생성과 같은 분리/매칭 함수로 검사 (파서가 해석하는 값은 통과)
+    VALIDATION_RULES = (
+        [NotNull('Name'), NotNull('Age'), InRange('Age', 14, 45)] +
+        [InRange(attr, 1, 20) for attr in COLUMN_MAPPING.values() if attr != 'NationID'] +
+        [Parsable('Position', split_position, partial(map_position_token, mapping=POSITION_MAPPING))]
+    )
+    
     def __init__(self, csv_path):
         """
         데이터 프로세서 초기화
@@ -117,6 +206,21 @@ class FootballDataProcessor:
         self.df = None
         self.processed_df = None
         self.is_new_format = False  # 새 데이터셋 형식 여부
+        self.dedup_report = None  # 이름 유사도 중복 병합 결과 (load_data에서 설정)
+        self.validation_report = None  # 검증 규칙 결과 (validate_data에서 설정)
+        self.score_normalizer = None  # 유망주 점수 정규화 파라미터 (calculate_talent_score에서 학습)
+        
+        # 조회용 인덱스 (_build_indexes에서 생성)
+        self._indexed_df = None
+        self._uid_index = None
+        self._score_order = None
+        self._score_rank = None
+        self._position_orders = {}
+        self._age_order = None
+        self._sorted_ages = None
+        self._ages = None
+        self._overall = None
+        self._categories = None
         
     def load_data(self):
         """CSV 데이터 로드"""
@@ -134,6 +238,11 @@ class FootballDataProcessor:
         else:
             # UID가 없는 경우 이름+생년월일로 중복 제거 시도
             self.df = self.df.drop_duplicates(subset=['Name', 'DOB'], keep='first')
+
+        # 철자만 다른 같은 선수 병합 (생년월일 + 국적 블록 안에서 이름 유사도 비교)
+        self.df, self.dedup_report = deduplicate_players(self.df)
+        if self.dedup_report.merges > 0:
+            print(f"⚠️ 이름 표기가 다른 중복 선수 데이터 {self.dedup_report.merges}명을 병합했습니다.")
         print(f"총 {len(self.df)} 명의 선수 데이터를 로드했습니다.")
 
         # 새 데이터셋 형식인지 확인 (약어 컬럼이 있는지)
@@ -180,7 +289,7 @@ class FootballDataProcessor:
                 return int(float(height_str.lower().replace('cm', '').strip()))
             else:
                 return int(float(height_str))
-        except:
+        except (ValueError, IndexError):
             return None
     
     def _convert_weight(self, weight_str):
@@ -196,56 +305,14 @@ class FootballDataProcessor:
                 return int(lbs * 0.453592)
             else:
                 return int(float(weight_str))
-        except:
+        except (ValueError, IndexError):
             return None
     
     def _create_position_columns(self):
         """새 데이터셋의 Position 문자열에서 포지션 컬럼 생성"""
-        # 포지션 매핑 (새 형식 -> 기존 형식)
-        position_mapping = {
-            'GK': 'Goalkeeper',
-            'D (C)': 'DefenderCentral',
-            'D (L)': 'DefenderLeft',
-            'D (R)': 'DefenderRight',
-            'D (LC)': 'DefenderCentral',
-            'D (RC)': 'DefenderCentral',
-            'D (RL)': 'DefenderCentral',
-            'D/WB (L)': 'WingBackLeft',
-            'D/WB (R)': 'WingBackRight',
-            'WB (L)': 'WingBackLeft',
-            'WB (R)': 'WingBackRight',
-            'DM': 'DefensiveMidfielder',
-            'DM (C)': 'DefensiveMidfielder',
-            'M (C)': 'MidfielderCentral',
-            'M (L)': 'MidfielderLeft',
-            'M (R)': 'MidfielderRight',
-            'M (LC)': 'MidfielderCentral',
-            'M (RC)': 'MidfielderCentral',
-            'M/AM (C)': 'MidfielderCentral',
-            'AM (C)': 'AttackingMidCentral',
-            'AM (L)': 'AttackingMidLeft',
-            'AM (R)': 'AttackingMidRight',
-            'AM (LC)': 'AttackingMidCentral',
-            'AM (RC)': 'AttackingMidCentral',
-            'AM (RL)': 'AttackingMidCentral',
-            'AM (RLC)': 'AttackingMidCentral',
-            'M (RLC)': 'MidfielderCentral',
-            'D (RLC)': 'DefenderCentral',
-            'WB (RL)': 'WingBackRight',
-            'ST': 'Striker',
-            'ST (C)': 'Striker',
-        }
         
         # 모든 포지션 컬럼 초기화
-        position_cols = [
-            'Goalkeeper', 'Sweeper', 'Striker', 'AttackingMidCentral',
-            'AttackingMidLeft', 'AttackingMidRight', 'DefenderCentral',
-            'DefenderLeft', 'DefenderRight', 'DefensiveMidfielder',
-            'MidfielderCentral', 'MidfielderLeft', 'MidfielderRight',
-            'WingBackLeft', 'WingBackRight'
-        ]
-        
-        for col in position_cols:
+        for col in self.POSITION_COLUMNS:
             self.df[col] = 0
         
         # Position 문자열 파싱하여 해당 포지션에 20 부여
@@ -254,20 +321,11 @@ class FootballDataProcessor:
                 return {}
             
             result = {}
-            # 쉼표나 공백으로 분리된 포지션들 처리
-            positions = str(pos_str).replace(',', '/').split('/')
-            
-            for pos in positions:
-                pos = pos.strip()
-                if pos in position_mapping:
-                    mapped = position_mapping[pos]
+            # 쉼표나 슬래시로 분리된 포지션들 처리 (정확히 일치하지 않으면 부분 매칭)
+            for pos in split_position(pos_str):
+                mapped = map_position_token(pos, self.POSITION_MAPPING)
+                if mapped is not None:
                     result[mapped] = 20
-                else:
-                    # 부분 매칭 시도
-                    for key, value in position_mapping.items():
-                        if key in pos or pos in key:
-                            result[value] = 20
-                            break
             
             return result
         
@@ -278,6 +336,26 @@ class FootballDataProcessor:
                 if pos_col in self.df.columns:
                     self.df.at[idx, pos_col] = value
     
+    def validate_data(self):
+        """
+        검증 규칙(VALIDATION_RULES)을 통과하지 못한 행을 분리하여 격리 파일로 저장
+        
+        Returns:
+            ValidationReport
+        """
+        input_rows = len(self.df)
+        self.df, quarantined, rule_failures = validate_frame(self.df, self.VALIDATION_RULES)
+        
+        quarantine_path = None
+        if len(quarantined) > 0:
+            quarantine_path = write_quarantine(quarantined, self.csv_path)
+            print(f"⚠️ 검증 규칙을 통과하지 못한 선수 {len(quarantined)}명을 격리했습니다: {quarantine_path}")
+            for rule_name, count in rule_failures.items():
+                print(f"   - {rule_name}: {count}행")
+        
+        self.validation_report = ValidationReport(input_rows, len(self.df), rule_failures, quarantine_path)
+        return self.validation_report
+    
     def calculate_overall_rating(self):
         """종합 능력치 계산 (기술/정신/신체 능력치 평균)"""
         # 존재하는 컬럼만 사용
@@ -298,6 +376,33 @@ class FootballDataProcessor:
         
         return self.df
     
+    def calculate_profile_aggregates(self):
+        """
+        5대 분류(공격/수비/기술/정신/신체) 프로필 점수 계산
+        분류별 능력치 평균을 행렬곱 한 번으로 계산하여 float32 컬럼(Profile_*)으로 저장
+        (결측 능력치는 평균에서 제외)
+        """
+        categories = list(self.PROFILE_CATEGORIES)
+        attrs = sorted({a for attrs in self.PROFILE_CATEGORIES.values() for a in attrs if a in self.df.columns})
+        
+        # 능력치 × 분류 소속 행렬
+        membership = np.zeros((len(attrs), len(categories)), dtype=np.float32)
+        for c, category in enumerate(categories):
+            for attr in self.PROFILE_CATEGORIES[category]:
+                if attr in attrs:
+                    membership[attrs.index(attr), c] = 1
+        
+        values = self.df[attrs].to_numpy(dtype=np.float32, na_value=np.nan)
+        present = ~np.isnan(values)
+        sums = np.where(present, values, 0) @ membership
+        counts = present.astype(np.float32) @ membership
+        profile = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+        
+        for c, category in enumerate(categories):
+            self.df[self.PROFILE_COLUMNS[category]] = profile[:, c]
+        
+        return self.df
+    
     def calculate_potential_score(self):
         """
         잠재력 점수 계산
@@ -316,16 +421,8 @@ class FootballDataProcessor:
     
     def identify_primary_position(self):
         """선수의 주 포지션 식별"""
-        position_cols = [
-            'Goalkeeper', 'Sweeper', 'Striker', 'AttackingMidCentral',
-            'AttackingMidLeft', 'AttackingMidRight', 'DefenderCentral',
-            'DefenderLeft', 'DefenderRight', 'DefensiveMidfielder',
-            'MidfielderCentral', 'MidfielderLeft', 'MidfielderRight',
-            'WingBackLeft', 'WingBackRight'
-        ]
-        
         # 존재하는 포지션 컬럼만 사용
-        available_pos_cols = [col for col in position_cols if col in self.df.columns]
+        available_pos_cols = [col for col in self.POSITION_COLUMNS if col in self.df.columns]
         
         if available_pos_cols:
             # 각 선수의 최고 포지션 숙련도 찾기
@@ -392,14 +489,11 @@ class FootballDataProcessor:
             self.df['Position_Specialized_Score'] * 0.2
         )
         
-        # 정규화 (0-100 범위)
-        min_score = self.df['Talent_Score'].min()
-        max_score = self.df['Talent_Score'].max()
-        if max_score > min_score:
-            self.df['Talent_Score_Normalized'] = ((self.df['Talent_Score'] - min_score) / 
-                                                   (max_score - min_score) * 100)
-        else:
-            self.df['Talent_Score_Normalized'] = 50
+        # 정규화 (0-100 범위, 이상치 한 행이 전체 점수를 압축하지 않도록 울타리 밖 값만 잘라냄)
+        # score_normalizer가 이미 있으면 (이전 처리 결과의 파라미터) 다시 학습하지 않고 그대로 적용
+        if self.score_normalizer is None:
+            self.score_normalizer = ScoreNormalizer(self.SCORE_NORMALIZATION).fit(self.df['Talent_Score'])
+        self.df['Talent_Score_Normalized'] = self.score_normalizer.transform(self.df['Talent_Score'])
         
         return self.df
     
@@ -408,33 +502,97 @@ class FootballDataProcessor:
         print("데이터 처리를 시작합니다...")
         
         # 데이터 로드
-        self.load_data()
+        with timed('process_all.load_data'):
+            self.load_data()
+        
+        print("데이터를 검증 중...")
+        with timed('process_all.validate_data'):
+            self.validate_data()
         
         # 각 단계별 처리
         print("종합 능력치를 계산 중...")
-        self.calculate_overall_rating()
+        with timed('process_all.calculate_overall_rating'):
+            self.calculate_overall_rating()
+        
+        print("5대 분류 프로필 점수를 계산 중...")
+        with timed('process_all.calculate_profile_aggregates'):
+            self.calculate_profile_aggregates()
         
         print("잠재력 점수를 계산 중...")
-        self.calculate_potential_score()
+        with timed('process_all.calculate_potential_score'):
+            self.calculate_potential_score()
         
         print("주 포지션을 식별 중...")
-        self.identify_primary_position()
+        with timed('process_all.identify_primary_position'):
+            self.identify_primary_position()
         
         print("포지션별 특화 점수를 계산 중...")
-        self.calculate_position_specialized_score()
+        with timed('process_all.calculate_position_specialized_score'):
+            self.calculate_position_specialized_score()
         
         print("최종 유망주 점수를 계산 중...")
-        self.calculate_talent_score()
+        with timed('process_all.calculate_talent_score'):
+            self.calculate_talent_score()
         
         self.processed_df = self.df.copy()
+        
+        with timed('process_all.build_indexes'):
+            self._build_indexes()
         print("데이터 처리가 완료되었습니다!")
         
         return self.processed_df
     
+    def _build_indexes(self):
+        """
+        조회용 인덱스 생성
+        - UID -> 행 위치 해시
+        - 유망주 점수 내림차순 행 위치 (동점은 원래 순서 유지, nlargest와 동일)
+          정규화 점수는 울타리 밖 값이 모두 0/100으로 같아지므로 순서는 정규화 전 Talent_Score 기준
+        - 포지션 카테고리별 점수 내림차순 파티션
+        - 나이 오름차순 행 위치
+        """
+        df = self.processed_df
+        n_rows = len(df)
+        
+        if 'UID' in df.columns:
+            self._uid_index = dict(zip(df['UID'].tolist(), range(n_rows)))
+        else:
+            self._uid_index = None
+        
+        scores = df['Talent_Score'].to_numpy(dtype=float)
+        score_order = np.argsort(-scores, kind='stable')
+        # 점수가 없는 선수는 순위에서 제외 (nlargest와 동일)
+        self._score_order = score_order[~np.isnan(scores[score_order])]
+        self._score_rank = np.full(n_rows, n_rows, dtype=np.int64)
+        self._score_rank[self._score_order] = np.arange(len(self._score_order))
+        
+        categories = df['Position_Category'].to_numpy()
+        ordered_categories = categories[self._score_order]
+        self._position_orders = {
+            category: self._score_order[ordered_categories == category]
+            for category in pd.unique(categories)
+        }
+        
+        self._ages = df['Age'].to_numpy(dtype=float)
+        self._overall = df['Overall_Rating'].to_numpy(dtype=float)
+        self._categories = categories
+        self._age_order = np.argsort(self._ages, kind='stable')
+        self._sorted_ages = self._ages[self._age_order]
+        
+        self._indexed_df = df
+    
+    def _ensure_indexes(self):
+        """processed_df가 바뀌었으면 인덱스를 다시 생성"""
+        if self._indexed_df is not self.processed_df:
+            self._build_indexes()
+    
     def get_top_talents(self, n=50, age_range=None, position=None, min_rating=None):
         """
         상위 유망주 선수 추출
         
+        전체 데이터를 복사/정렬하지 않고, 미리 점수순으로 정렬된 후보 목록에서
+        조건을 만족하는 선수를 앞에서부터 n명 선택합니다.
+        
         Args:
             n: 반환할 선수 수
             age_range: (min_age, max_age) 튜플
@@ -444,27 +602,74 @@ class FootballDataProcessor:
         Returns:
             필터링된 상위 유망주 DataFrame
         """
-        df_filtered = self.processed_df.copy()
-        
-        # 필터 적용
-        if age_range:
-            df_filtered = df_filtered[
-                (df_filtered['Age'] >= age_range[0]) & 
-                (df_filtered['Age'] <= age_range[1])
-            ]
+        self._ensure_indexes()
         
+        # 포지션 필터: 해당 포지션의 점수순 파티션에서 출발
         if position and position != 'All':
-            df_filtered = df_filtered[df_filtered['Position_Category'] == position]
-        
-        if min_rating:
-            df_filtered = df_filtered[df_filtered['Overall_Rating'] >= min_rating]
+            candidates = self._position_orders.get(position, np.empty(0, dtype=np.int64))
+        else:
+            candidates = self._score_order
         
-        # 유망주 점수로 정렬하여 상위 n명 반환
-        return df_filtered.nlargest(n, 'Talent_Score_Normalized')
+        if age_range:
+            lo = np.searchsorted(self._sorted_ages, age_range[0], side='left')
+            hi = np.searchsorted(self._sorted_ages, age_range[1], side='right')
+            
+            # 나이 구간이 후보보다 좁으면 나이 인덱스 구간을 점수순으로 정렬하여 사용
+            if hi - lo < len(candidates):
+                in_age = self._age_order[lo:hi]
+                in_age = in_age[np.argsort(self._score_rank[in_age], kind='stable')]
+                # 점수가 없는 선수 제외
+                in_age = in_age[self._score_rank[in_age] < len(self._score_order)]
+                if position and position != 'All':
+                    in_age = in_age[self._categories[in_age] == position]
+                candidates = in_age
+                age_range = None
+        
+        def matches(rows):
+            mask = np.ones(len(rows), dtype=bool)
+            if age_range:
+                ages = self._ages[rows]
+                mask &= (ages >= age_range[0]) & (ages <= age_range[1])
+            if min_rating:
+                mask &= self._overall[rows] >= min_rating
+            return mask
+        
+        # 점수순 후보를 청크 단위로 검사하여 n명이 모이면 중단
+        selected = []
+        found = 0
+        start = 0
+        chunk_size = max(n * 4, 1024)
+        while found < n and start < len(candidates):
+            rows = candidates[start:start + chunk_size]
+            rows = rows[matches(rows)]
+            selected.append(rows[:n - found])
+            found += len(selected[-1])
+            start += chunk_size
+            chunk_size *= 2
+        
+        positions = np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+        return self.processed_df.iloc[positions]
     
     def get_player_details(self, player_uid):
         """특정 선수의 상세 정보 반환"""
-        return self.processed_df[self.processed_df['UID'] == player_uid].iloc[0]
+        self._ensure_indexes()
+        
+        if self._uid_index is None:
+            return self.processed_df[self.processed_df['UID'] == player_uid].iloc[0]
+        
+        position = self._uid_index.get(player_uid)
+        if position is None:
+            raise IndexError(f"UID {player_uid} 선수를 찾을 수 없습니다.")
+        return self.processed_df.iloc[position]
+
+    def get_players(self, player_uids):
+        """UID 목록의 선수 (요청한 순서대로, 없는 UID는 제외)"""
+        self._ensure_indexes()
+
+        if self._uid_index is None:
+            return self.processed_df.iloc[:0]  # UID 컬럼이 없는 데이터셋
+        positions = [self._uid_index[uid] for uid in player_uids if uid in self._uid_index]
+        return self.processed_df.iloc[positions]
 
 
 def load_and_process_data(csv_path):
@@ -0,0 +1,144 @@
+"""
+선수 데이터 검증 모듈
+컬럼별 규칙(결측 금지, 값 범위, 허용 값 목록)을 선언해 두고 전체 행에 대해 벡터 연산 마스크로 한 번에 평가합니다.
+규칙을 통과하지 못한 행은 점수 계산(최소/최대 정규화 등)에 들어가기 전에 분리하여 별도 CSV로 격리하고,
+규칙별 실패 수를 요약합니다.
+"""
+import os
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# 격리 파일을 저장할 폴더 (데이터 폴더에 두면 선수 데이터셋으로 인식될 수 있으므로 별도 폴더)
+DEFAULT_QUARANTINE_DIR = os.environ.get(
+    'EPL_QUARANTINE_DIR', os.path.join(tempfile.gettempdir(), 'epl-dashboard-quarantine')
+)
+ERRORS_COLUMN = 'Validation_Errors'
+
+ValidationReport = namedtuple('ValidationReport', ['input_rows', 'valid_rows', 'rule_failures', 'quarantine_path'])
+
+
+class ColumnRule:
+    """컬럼 검증 규칙 (failures가 실패한 행의 불리언 배열을 반환)"""
+
+    def __init__(self, column):
+        self.column = column
+
+    @property
+    def name(self):
+        raise NotImplementedError
+
+    def failures(self, values):
+        raise NotImplementedError
+
+
+class NotNull(ColumnRule):
+    """값이 비어 있으면 실패"""
+
+    @property
+    def name(self):
+        return f"{self.column} 결측"
+
+    def failures(self, values):
+        return values.isna().to_numpy()
+
+
+class InRange(ColumnRule):
+    """숫자가 아니거나 [low, high] 범위를 벗어나면 실패 (빈 값은 NotNull 규칙에서 검사)"""
+
+    def __init__(self, column, low, high):
+        super().__init__(column)
+        self.low = low
+        self.high = high
+
+    @property
+    def name(self):
+        return f"{self.column} 범위({self.low}~{self.high})"
+
+    def failures(self, values):
+        numeric = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            out_of_range = (numeric < self.low) | (numeric > self.high)
+        return out_of_range | (np.isnan(numeric) & values.notna().to_numpy())
+
+
+class OneOf(ColumnRule):
+    """허용 값 목록에 없는 값이 있으면 실패 (separator가 있으면 나눈 각 부분을 검사, 빈 값은 통과)"""
+
+    def __init__(self, column, allowed, separator=None):
+        super().__init__(column)
+        self.allowed = frozenset(allowed)
+        self.separator = separator
+
+    @property
+    def name(self):
+        return f"{self.column} 허용 값"
+
+    def _is_allowed(self, value):
+        parts = str(value).split(self.separator) if self.separator else [str(value)]
+        return all(part.strip() in self.allowed for part in parts)
+
+    def failures(self, values):
+        # 고유 값만 검사한 뒤 전체 행에 대응 (포지션 문자열은 종류가 적음)
+        invalid = [value for value in values.dropna().unique() if not self._is_allowed(value)]
+        return values.isin(invalid).to_numpy()
+
+
+class Parsable(OneOf):
+    """
+    파서가 해석하지 못하는 조각이 있으면 실패 (빈 값은 통과)
+    split으로 나눈 각 조각을 map_token(파서와 같은 함수)으로 변환하여 None이 나오면 실패
+    """
+
+    def __init__(self, column, split, map_token):
+        super().__init__(column, ())
+        self.split = split
+        self.map_token = map_token
+
+    def _is_allowed(self, value):
+        return all(self.map_token(part) is not None for part in self.split(value))
+
+
+def validate_frame(df, rules):
+    """
+    규칙 검증 후 통과/실패 행 분리
+
+    데이터에 없는 컬럼의 규칙은 건너뜁니다. 숫자 아닌 값 때문에 문자열로 읽힌 범위 규칙 컬럼은
+    실패 행을 제외한 뒤 숫자로 변환합니다.
+
+    Returns:
+        (통과한 행 DataFrame, 실패한 행 DataFrame(Validation_Errors 컬럼 추가), {규칙 이름: 실패 행 수})
+    """
+    rules = [rule for rule in rules if rule.column in df.columns]
+    failed = np.zeros((len(rules), len(df)), dtype=bool)
+    for i, rule in enumerate(rules):
+        failed[i] = rule.failures(df[rule.column])
+
+    rule_failures = {rule.name: int(count) for rule, count in zip(rules, failed.sum(axis=1)) if count}
+    quarantined_mask = failed.any(axis=0)
+    if not quarantined_mask.any():
+        return df, df.iloc[:0], rule_failures
+
+    quarantined = df[quarantined_mask].copy()
+    rule_names = np.asarray([rule.name for rule in rules], dtype=object)
+    quarantined[ERRORS_COLUMN] = ['; '.join(rule_names[row]) for row in failed[:, quarantined_mask].T]
+
+    valid = df[~quarantined_mask]
+    numeric_columns = {rule.column for rule in rules if isinstance(rule, InRange)}
+    text_columns = [column for column in numeric_columns if not pd.api.types.is_numeric_dtype(valid[column])]
+    if text_columns:
+        valid = valid.copy()
+        for column in text_columns:
+            valid[column] = pd.to_numeric(valid[column])
+    return valid, quarantined, rule_failures
+
+
+def write_quarantine(quarantined, source_path, quarantine_dir=DEFAULT_QUARANTINE_DIR):
+    """격리된 행을 <quarantine_dir>/<원본 파일명>_quarantine.csv로 저장하고 경로 반환"""
+    os.makedirs(quarantine_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    path = os.path.join(quarantine_dir, f"{stem}_quarantine.csv")
+    quarantined.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
@@ -0,0 +1,73 @@
+"""
+데이터셋 메타데이터 모듈
+사이드바 슬라이더 범위, 포지션별 선수 수, 능력치 분포(히스토그램)를 데이터셋 버전별로 한 번만 계산하여,
+매 rerun마다 전체 DataFrame을 다시 훑지 않도록 합니다.
+"""
+import numpy as np
+
+from data_processor import FootballDataProcessor
+
+# 능력치 히스토그램 구간 (0~20, 0.5 단위: 사이드바 슬라이더 단계와 동일)
+HISTOGRAM_BIN_WIDTH = 0.5
+HISTOGRAM_EDGES = np.arange(0, 20 + 2 * HISTOGRAM_BIN_WIDTH, HISTOGRAM_BIN_WIDTH)
+
+# 히스토그램을 만들 컬럼 (개별 능력치 + 종합/5대 분류 점수)
+HISTOGRAM_COLUMNS = (
+    FootballDataProcessor.TECHNICAL_ATTRIBUTES +
+    FootballDataProcessor.MENTAL_ATTRIBUTES +
+    FootballDataProcessor.PHYSICAL_ATTRIBUTES +
+    ['Overall_Rating'] +
+    list(FootballDataProcessor.PROFILE_COLUMNS.values())
+)
+
+
+class DatasetMetadata:
+    """
+    처리된 선수 데이터셋 요약
+
+    Attributes:
+        version: 데이터셋 버전 (DatasetRegistry.dataset_version)
+        total_rows: 전체 선수 수
+        age_min, age_max: 나이 범위 (정수)
+        position_counts: {포지션 카테고리: 선수 수}
+        histograms: {컬럼: HISTOGRAM_EDGES 구간별 선수 수 배열}
+    """
+
+    def __init__(self, df, version=None, histogram_columns=HISTOGRAM_COLUMNS):
+        self.version = version
+        self.total_rows = len(df)
+
+        ages = df['Age'].to_numpy(dtype=float)
+        self.age_min = int(np.nanmin(ages))
+        self.age_max = int(np.nanmax(ages))
+
+        self.position_counts = {
+            position: int(count) for position, count in df['Position_Category'].value_counts().items()
+        }
+
+        self.histograms = {}
+        for column in histogram_columns:
+            if column not in df.columns:
+                continue
+            values = df[column].to_numpy(dtype=float)
+            values = np.clip(values[~np.isnan(values)], HISTOGRAM_EDGES[0], HISTOGRAM_EDGES[-1])
+            self.histograms[column] = np.histogram(values, bins=HISTOGRAM_EDGES)[0]
+
+    def position_count(self, position):
+        """포지션별 선수 수 ('All'이면 전체)"""
+        if position == 'All':
+            return self.total_rows
+        return self.position_counts.get(position, 0)
+
+    def count_at_least(self, column, threshold):
+        """
+        column 값이 threshold 이상인 선수 수 (히스토그램 기준, 0.5 단위 기준값에서 정확)
+
+        Returns:
+            선수 수 또는 None (히스토그램이 없는 컬럼)
+        """
+        counts = self.histograms.get(column)
+        if counts is None:
+            return None
+        start = int(np.searchsorted(HISTOGRAM_EDGES, threshold, side='left'))
+        return int(counts[start:].sum())
@@ -0,0 +1,274 @@
+"""
+시즌/리그별 데이터셋 레지스트리
+데이터 폴더에서 시즌 파일을 찾아 목록을 만들고, 각 파일은 처음 접근할 때 로드합니다.
+로드된 데이터는 크기가 제한된 LRU에 보관하여 여러 시즌을 제공하더라도
+최근에 사용한 일부만 메모리에 남도록 합니다.
+공유 데이터셋 폴더(shared_dataset.py로 생성)가 지정되면 같은 이름의 선수 데이터는
+CSV를 다시 처리하지 않고 메모리 매핑으로 연결합니다 (멀티 워커 배포).
+SQLite 데이터셋 폴더(sqlite_store.py로 생성)가 지정되면 같은 이름의 선수 데이터는
+전체를 메모리에 올리지 않고 SQLite 파일에 조건을 넘겨 조회합니다.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+from data_processor import FootballDataProcessor
+from dataset_metadata import DatasetMetadata
+from name_search import NameSearchIndex
+from recruitment_matcher import RecruitmentMatcher
+from shared_dataset import MANIFEST_FILE, attach_processor, discover_shared_datasets
+from sqlite_store import SQLitePlayerStore, discover_sqlite_datasets
+from trend_engine import build_team_trends
+
+# 파일명 패턴 (예: epl_2024_2025_full_stats.csv, epl_2024_2025_standings.csv)
+TEAM_STATS_PATTERN = re.compile(r'^(?P<league>[a-z0-9]+)_(?P<start>\d{4})_(?P<end>\d{4})_full_stats\.csv$')
+STANDINGS_PATTERN = re.compile(r'^(?P<league>[a-z0-9]+)_(?P<start>\d{4})_(?P<end>\d{4})_standings\.csv$')
+# 선수 데이터 (예: dataset_new.csv, players_epl_2024_2025.csv)
+PLAYER_PATTERN = re.compile(r'^(?:dataset_new|dataset|players_(?P<label>.+))\.csv$')
+
+DEFAULT_MAX_LOADED = 4
+
+
+class SeasonKey(namedtuple('SeasonKey', ['league', 'season'])):
+    """(리그, 시즌) 키. 예: SeasonKey('epl', '2024-2025')"""
+
+    __slots__ = ()
+
+    @property
+    def label(self):
+        return f"{self.league.upper()} {self.season}"
+
+
+class DatasetRegistry:
+    """시즌 파일을 찾아 필요할 때 로드하고, 로드 결과를 LRU로 관리하는 레지스트리"""
+
+    def __init__(self, data_dir='.', max_loaded=DEFAULT_MAX_LOADED, shared_dir=None, sqlite_dir=None):
+        """
+        Args:
+            data_dir: 데이터 파일을 찾을 폴더
+            max_loaded: 동시에 메모리에 유지할 데이터셋 수
+                (선수 데이터셋 하나와 그 메타데이터/매처, 시즌 하나의 팀 지표/순위표가 각각 한 단위)
+            shared_dir: 공유 데이터셋 상위 폴더 (None이면 사용하지 않음)
+            sqlite_dir: SQLite 데이터셋 폴더 (None이면 사용하지 않음)
+        """
+        self.data_dir = data_dir
+        self.max_loaded = max_loaded
+        self.shared_dir = shared_dir
+        self.sqlite_dir = sqlite_dir
+        self.team_stats_files = {}
+        self.standings_files = {}
+        self.player_files = {}
+        self.shared_player_dirs = {}
+        self.sqlite_player_files = {}
+
+        self._loaded = OrderedDict()  # {그룹 키: {캐시 키: 값}}, 그룹 단위 LRU
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._scanned_versions = None
+
+        self.discover()
+
+    def _directory_versions(self):
+        """데이터/공유/SQLite 폴더의 수정 시각 (폴더 안에 파일이 추가/삭제되면 바뀜)"""
+        return tuple(
+            os.stat(directory).st_mtime_ns if directory and os.path.isdir(directory) else None
+            for directory in (self.data_dir, self.shared_dir, self.sqlite_dir)
+        )
+
+    def refresh(self):
+        """마지막 스캔 이후 폴더에 파일이 추가/삭제되었으면 다시 스캔 (새 시즌/데이터셋은 재시작 없이 반영)"""
+        if self._directory_versions() != self._scanned_versions:
+            self.discover()
+
+    def discover(self):
+        """데이터 폴더를 스캔하여 시즌/선수 데이터 파일 목록 갱신"""
+        # 스캔 도중 추가된 파일도 다음 refresh에서 잡히도록 스캔 전에 기록
+        self._scanned_versions = self._directory_versions()
+        team_stats, standings, players = {}, {}, {}
+        for file_name in sorted(os.listdir(self.data_dir)):
+            path = os.path.join(self.data_dir, file_name)
+            if not os.path.isfile(path):
+                continue
+
+            match = TEAM_STATS_PATTERN.match(file_name)
+            if match:
+                team_stats[_season_key(match)] = path
+                continue
+
+            match = STANDINGS_PATTERN.match(file_name)
+            if match:
+                standings[_season_key(match)] = path
+                continue
+
+            match = PLAYER_PATTERN.match(file_name)
+            if match:
+                players[match.group('label') or os.path.splitext(file_name)[0]] = path
+
+        self.team_stats_files = team_stats
+        self.standings_files = standings
+        self.player_files = players
+        self.shared_player_dirs = discover_shared_datasets(self.shared_dir)
+        self.sqlite_player_files = discover_sqlite_datasets(self.sqlite_dir)
+
+    def team_seasons(self):
+        """팀 지표 파일이 있는 시즌 목록 (최신 시즌 우선)"""
+        self.refresh()
+        return sorted(self.team_stats_files, key=lambda k: (k.season, k.league), reverse=True)
+
+    def player_datasets(self):
+        """선수 데이터셋 이름 목록"""
+        self.refresh()
+        return sorted(set(self.player_files) | set(self.shared_player_dirs) | set(self.sqlite_player_files))
+
+    def load_team_stats(self, key):
+        """시즌별 팀 지표 DataFrame (13가지 지표, Squad 컬럼 포함)"""
+        path = self.team_stats_files[key]
+        return self._get_or_load(('team_stats', key), lambda: pd.read_csv(path), group=('season', key))
+
+    def load_standings(self, key):
+        """시즌별 순위표 DataFrame (순위표 파일이 없으면 None)"""
+        path = self.standings_files.get(key)
+        if path is None:
+            return None
+        return self._get_or_load(('standings', key), lambda: pd.read_csv(path).sort_values('rank'),
+                                 group=('season', key))
+
+    def load_team_trends(self, league):
+        """리그의 모든 시즌 팀 지표를 쌓은 추세 객체 (TeamTrends)"""
+        keys = [key for key in self.team_stats_files if key.league == league]
+
+        def loader():
+            return build_team_trends({key: self.load_team_stats(key) for key in keys})
+
+        return self._get_or_load(('team_trends', league, tuple(sorted(keys))), loader)
+
+    def dataset_version(self, name):
+        """선수 데이터셋 버전 (원본 파일 수정 시각, 공유 데이터셋은 매니페스트, SQLite는 DB 파일 기준)"""
+        if name in self.shared_player_dirs:
+            return os.stat(os.path.join(self.shared_player_dirs[name], MANIFEST_FILE)).st_mtime_ns
+        if name in self.sqlite_player_files:
+            return os.stat(self.sqlite_player_files[name]).st_mtime_ns
+        return os.stat(self.player_files[name]).st_mtime_ns
+
+    def load_players(self, name):
+        """
+        선수 데이터셋 로드 및 처리 (파일이 바뀌면 새 버전으로 다시 로드)
+
+        Returns:
+            (처리된 DataFrame, FootballDataProcessor) 튜플
+            SQLite 데이터셋은 (None, SQLitePlayerStore) 튜플 (전체 DataFrame을 만들지 않음)
+        """
+        version = self.dataset_version(name)
+
+        # 공유 데이터셋이 있으면 처리 없이 읽기 전용으로 연결
+        if name in self.shared_player_dirs:
+            shared_path = self.shared_player_dirs[name]
+            return self._get_or_load(('players', name, version), lambda: attach_processor(shared_path),
+                                     group=('players', name, version))
+
+        if name in self.sqlite_player_files:
+            sqlite_path = self.sqlite_player_files[name]
+            return self._get_or_load(('players', name, version), lambda: (None, SQLitePlayerStore(sqlite_path)),
+                                     group=('players', name, version))
+
+        path = self.player_files[name]
+
+        def loader():
+            processor = FootballDataProcessor(path)
+            return processor.process_all(), processor
+
+        return self._get_or_load(('players', name, version), loader, group=('players', name, version))
+
+    def load_metadata(self, name):
+        """선수 데이터셋 메타데이터 (나이 범위/포지션별 수/능력치 히스토그램, 버전별 1회 계산)"""
+        version = self.dataset_version(name)
+
+        def loader():
+            df, processor = self.load_players(name)
+            if df is None:
+                # SQLite 데이터셋은 적재 시 계산해 둔 메타데이터 사용
+                return processor.load_metadata(version=version)
+            return DatasetMetadata(df, version=version)
+
+        return self._get_or_load(('metadata', name, version), loader, group=('players', name, version))
+
+    def load_recruitment_matcher(self, name):
+        """선수 데이터셋 기반 영입 매처 (능력치 행렬 사전 계산)"""
+        version = self.dataset_version(name)
+
+        def loader():
+            df, processor = self.load_players(name)
+            return RecruitmentMatcher(processor.read_all() if df is None else df)
+
+        return self._get_or_load(('recruitment_matcher', name, version), loader,
+                                 group=('players', name, version))
+
+    def load_name_index(self, name):
+        """
+        선수 이름 검색 색인 (버전별 1회 생성)
+
+        결과 식별자는 메모리 데이터셋은 행 위치(df.iloc), SQLite 데이터셋은 row_id(get_rows)입니다.
+        """
+        version = self.dataset_version(name)
+
+        def loader():
+            df, processor = self.load_players(name)
+            if df is None:
+                names = processor.read_columns(['Name', 'Talent_Score'])
+                return NameSearchIndex(names['Name'], names['Talent_Score'], row_ids=names.index)
+            return NameSearchIndex(df['Name'], df['Talent_Score'])
+
+        return self._get_or_load(('name_index', name, version), loader, group=('players', name, version))
+
+    def loaded_keys(self):
+        """현재 메모리에 있는 데이터셋 키 (오래된 순)"""
+        with self._lock:
+            return [key for entries in self._loaded.values() for key in entries]
+
+    def _lookup(self, cache_key, group):
+        entries = self._loaded.get(group)
+        if entries is None or cache_key not in entries:
+            return False, None
+        self._loaded.move_to_end(group)
+        return True, entries[cache_key]
+
+    def _get_or_load(self, cache_key, loader, group=None):
+        """
+        캐시된 값을 반환하고, 없으면 loader()로 로드하여 저장
+
+        같은 group의 항목(예: 선수 데이터셋과 그 파생 객체)은 함께 LRU 순서가 갱신되고 함께 제거됩니다.
+        """
+        group = cache_key if group is None else group
+        with self._lock:
+            found, value = self._lookup(cache_key, group)
+            if found:
+                return value
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        # 같은 데이터셋을 여러 세션이 동시에 요청해도 한 번만 로드
+        with key_lock:
+            with self._lock:
+                found, value = self._lookup(cache_key, group)
+                if found:
+                    return value
+
+            try:
+                value = loader()
+
+                with self._lock:
+                    self._loaded.setdefault(group, {})[cache_key] = value
+                    self._loaded.move_to_end(group)
+                    while len(self._loaded) > self.max_loaded:
+                        self._loaded.popitem(last=False)
+            finally:
+                # 로드가 실패해도 잠금 항목을 남기지 않음 (다음 요청이 다시 로드)
+                with self._lock:
+                    self._key_locks.pop(cache_key, None)
+            return value
+
+
+def _season_key(match):
+    return SeasonKey(match.group('league'), f"{match.group('start')}-{match.group('end')}")
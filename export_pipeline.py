@@ -0,0 +1,239 @@
+"""
+선수 순위 내보내기 모듈
+현재 필터 결과 또는 get_top_talents 순위를 CSV / Parquet / XLSX 파일로 내보냅니다.
+파일은 백그라운드 작업 스레드에서 일정 행 수(chunk)씩 나누어 기록하고 진행률을 보고하며,
+완성된 파일은 (데이터셋 버전 + 조건 + 형식) 해시로 캐싱하여 같은 내보내기는 다시 만들지 않습니다.
+
+Parquet은 pyarrow(Streamlit 의존성으로 설치됨), XLSX는 openpyxl이 설치된 경우에만 사용할 수 있습니다.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_processor import FootballDataProcessor
+
+# 내보낼 컬럼 (데이터에 있는 컬럼만 사용)
+EXPORT_COLUMNS = (
+    ['UID', 'Name', 'Age', 'Position_Category', 'Overall_Rating',
+     'Technical_Rating', 'Mental_Rating', 'Physical_Rating'] +
+    list(FootballDataProcessor.PROFILE_COLUMNS.values()) +
+    ['Potential_Score', 'Position_Specialized_Score', 'Talent_Score_Normalized']
+)
+
+# 형식별 (확장자, MIME 타입, 필요한 모듈)
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv', None),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet', 'pyarrow'),
+    'xlsx': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'openpyxl'),
+}
+
+CHUNK_ROWS = 10_000
+DEFAULT_MAX_CACHED_FILES = 32
+DEFAULT_EXPORT_DIR = os.environ.get(
+    'EPL_EXPORT_DIR', os.path.join(tempfile.gettempdir(), 'epl-dashboard-exports')
+)
+
+
+def available_formats():
+    """현재 환경에서 사용할 수 있는 내보내기 형식 목록"""
+    return [fmt for fmt, (_, _, module) in EXPORT_FORMATS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def export_key(*parts):
+    """내보내기 조건으로 만든 캐시 키 (JSON 직렬화 후 SHA-1)"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:20]
+
+
+def ranking_positions(df, positions, score_column='Talent_Score'):
+    """행 위치를 점수 내림차순으로 정렬 (정규화 전 점수 기준, 동점은 원래 순서 유지)"""
+    positions = np.asarray(positions)
+    scores = df[score_column].to_numpy(dtype=float)[positions]
+    return positions[np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind='stable')]
+
+
+class ExportJob:
+    """내보내기 작업 상태 (작업 스레드가 갱신하고 화면에서 조회)"""
+
+    def __init__(self, key, fmt, total_rows, path):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.format = fmt
+        self.total_rows = total_rows
+        self.rows_written = 0
+        self.path = path
+        self.status = 'pending'  # pending -> running -> done / failed
+        self.error = None
+
+    @property
+    def progress(self):
+        if self.status == 'done':
+            return 1.0
+        return self.rows_written / self.total_rows if self.total_rows else 0.0
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed')
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def mime_type(self):
+        return EXPORT_FORMATS[self.format][1]
+
+
+class ExportManager:
+    """백그라운드 내보내기 작업 관리 및 완성 파일 캐시"""
+
+    def __init__(self, export_dir=DEFAULT_EXPORT_DIR, max_workers=1, max_cached_files=DEFAULT_MAX_CACHED_FILES):
+        self.export_dir = export_dir
+        self.max_cached_files = max_cached_files
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export')
+        self._jobs = {}
+        self._jobs_by_key = {}
+        self._lock = threading.Lock()
+
+    def submit(self, df, positions, fmt, key, file_stem='players', columns=EXPORT_COLUMNS):
+        """
+        내보내기 작업 예약 (같은 키의 파일이 있거나 진행 중이면 그 작업을 반환)
+
+        Args:
+            df: 원본 선수 DataFrame (작업 중 복사하지 않고 chunk 단위로 잘라 기록)
+            positions: 내보낼 행 위치 (기록 순서)
+            fmt: 'csv' / 'parquet' / 'xlsx'
+            key: export_key로 만든 캐시 키
+            file_stem: 파일명 앞부분
+            columns: 내보낼 컬럼 목록
+
+        Returns:
+            ExportJob
+        """
+        if fmt not in available_formats():
+            raise ValueError(f"사용할 수 없는 내보내기 형식입니다: {fmt}")
+
+        extension = EXPORT_FORMATS[fmt][0]
+        path = os.path.join(self.export_dir, f"{file_stem}_{key}{extension}")
+        positions = np.asarray(positions)
+
+        with self._lock:
+            existing = self._jobs_by_key.get(key)
+            if existing is not None and existing.status != 'failed' and (
+                    not existing.finished or os.path.exists(existing.path)):
+                return existing
+
+            job = ExportJob(key, fmt, len(positions), path)
+            if os.path.exists(path):
+                # 이전에 만든 파일 재사용 (같은 데이터셋 버전/조건/형식)
+                job.rows_written = job.total_rows
+                job.status = 'done'
+            self._jobs[job.id] = job
+            self._jobs_by_key[key] = job
+
+        if job.status != 'done':
+            columns = [column for column in columns if column in df.columns]
+            self._executor.submit(self._run, job, df, positions, columns)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, df, positions, columns):
+        os.makedirs(self.export_dir, exist_ok=True)
+        tmp_path = f"{job.path}.part-{job.id}"
+        job.status = 'running'
+        try:
+            chunks = self._iter_chunks(job, df, positions, columns)
+            if job.format == 'csv':
+                _write_csv(tmp_path, chunks)
+            elif job.format == 'parquet':
+                _write_parquet(tmp_path, chunks, _parquet_schema(df, columns))
+            else:
+                _write_xlsx(tmp_path, chunks, columns)
+            os.replace(tmp_path, job.path)
+            job.status = 'done'
+            self._prune_cache()
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _iter_chunks(job, df, positions, columns):
+        for start in range(0, len(positions), CHUNK_ROWS):
+            chunk = df.iloc[positions[start:start + CHUNK_ROWS]][columns]
+            yield chunk
+            job.rows_written = min(start + CHUNK_ROWS, len(positions))
+        if len(positions) == 0:
+            yield df.iloc[:0][columns]
+
+    def _prune_cache(self):
+        """오래된 내보내기 파일 정리 (최근 max_cached_files개 유지)"""
+        files = [os.path.join(self.export_dir, name) for name in os.listdir(self.export_dir)
+                 if '.part-' not in name]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[self.max_cached_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _write_csv(path, chunks):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=(i == 0), index=False)
+
+
+def _parquet_schema(df, columns):
+    """
+    전체 DataFrame 기준 Parquet 스키마
+    빈 DataFrame으로 형식을 정하고, 그래도 형식을 알 수 없는 object 컬럼은 첫 번째 실제 값으로 정합니다.
+    (첫 청크에서 모두 비어 있는 컬럼이 null 형식으로 고정되어 이후 청크 변환이 실패하지 않도록)
+    """
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(df[columns].head(0), preserve_index=False)
+    for i, column in enumerate(columns):
+        if pa.types.is_null(schema.field(column).type):
+            values = df[column].dropna()
+            if len(values):
+                schema = schema.set(i, schema.field(column).with_type(pa.array(values.iloc[:1]).type))
+    return schema
+
+
+def _write_parquet(path, chunks, schema):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pandas(chunk, preserve_index=False).cast(schema))
+
+
+def _write_xlsx(path, chunks, columns):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('players')
+    sheet.append(columns)
+    for chunk in chunks:
+        for row in chunk.itertuples(index=False):
+            sheet.append([None if pd.isna(value) else value for value in row])
+    workbook.save(path)
+
+
+# 프로세스 전체에서 공유하는 기본 관리자
+export_manager = ExportManager()
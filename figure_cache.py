@@ -0,0 +1,79 @@
+"""
+Plotly 차트 캐시 모듈
+선택된 선수/차트 종류/테마로만 결정되는 차트를 직렬화된 JSON으로 보관하여,
+관련 없는 위젯 변경으로 재실행될 때 같은 차트를 다시 만들지 않도록 합니다.
+보관하는 스펙은 figure_payload.compact_figure로 전송용으로 축소한 것입니다.
+"""
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from figure_payload import compact_figure
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class FigureCache:
+    """차트 키별 Plotly JSON을 보관하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, builder):
+        """
+        캐시된 차트를 반환하고, 없으면 builder()로 만들어 저장
+
+        Args:
+            key: 해시 가능한 차트 키 (예: (데이터셋, 선수 UID 튜플, 차트 종류, 테마))
+            builder: go.Figure를 반환하는 인자 없는 함수
+
+        Returns:
+            go.Figure (호출마다 새 객체이므로 수정해도 캐시에 영향 없음)
+        """
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if spec is None:
+            spec = compact_figure(builder()).to_json()
+            with self._lock:
+                self._entries[key] = spec
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        # 캐시된 JSON은 이미 검증된 스펙이므로 재검증 없이 복원
+        return go.Figure(json.loads(spec), _validate=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': sum(len(spec) for spec in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+figure_cache = FigureCache()
+
+
+def cached_figure(key, builder):
+    """기본 캐시를 사용하는 get_or_build 단축 함수"""
+    return figure_cache.get_or_build(key, builder)
@@ -0,0 +1,127 @@
+"""
+Plotly 차트 전송량(payload) 축소 모듈
+st.plotly_chart는 재실행마다 차트 전체 JSON 스펙을 웹소켓으로 보냅니다 (plotly 5.x는 숫자 배열을 전체 정밀도 숫자 목록으로 직렬화).
+전송 전에 스펙을 다음과 같이 줄입니다.
+
+- 숫자 배열(x/y/z/r, 숫자 text 등)을 표시 정밀도로 반올림
+- x/y/z/r 숫자 배열은 더 짧아지면 plotly.js typed array ({dtype, bdata, shape}, base64 이진 배열)로 변환
+  (Streamlit 프론트엔드의 plotly.js는 지원하지만, streamlit-plotly-events 컴포넌트나 HTML 리포트에 포함된
+  plotly.js는 지원하지 않으므로 그 경우 typed_arrays=False)
+- 레이아웃/템플릿의 실수 값(색상 척도 위치 등)도 같은 자릿수로 반올림
+- 모든 점이 같은 값인 호버/텍스트 배열은 값 하나로 축약
+- hovertemplate/texttemplate에서 참조하지 않는 customdata 제거
+"""
+import base64
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+DEFAULT_DECIMALS = 3
+# typed array로 보낼 수 있는 데이터 배열 속성
+TYPED_ARRAY_KEYS = ('x', 'y', 'z', 'r')
+# 점마다 같은 값이면 하나로 축약할 텍스트 속성
+TEXT_ARRAY_KEYS = ('text', 'hovertext', 'hovertemplate', 'texttemplate')
+# 정수 배열에 사용할 typed array 형식 (작은 형식부터)
+INTEGER_DTYPES = (('i1', np.int8), ('i2', np.int16), ('i4', np.int32))
+
+
+def _numeric_array(value):
+    """숫자 배열이면 float/int NumPy 배열로 반환 (문자열/불리언/혼합 배열은 None)"""
+    if isinstance(value, dict) and 'bdata' in value:
+        # 이미 typed array로 직렬화된 배열 (plotly 6 이상)
+        array = np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+        shape = value.get('shape')
+        return array.reshape([int(n) for n in str(shape).split(',')]) if shape else array
+    if isinstance(value, (str, bytes, dict)) or not hasattr(value, '__len__') or len(value) == 0:
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        return None  # 길이가 다른 중첩 목록
+    if array.dtype.kind in 'iuf':
+        return array
+    if array.dtype.kind == 'O' and all(
+            isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, bool) for v in array.flat):
+        return array.astype(float)
+    return None
+
+
+def _typed_array(array):
+    """plotly.js typed array 스펙 (정수는 값 범위에 맞는 가장 작은 형식, 실수는 float32)"""
+    finite = array[np.isfinite(array)] if array.dtype.kind == 'f' else array
+    if array.dtype.kind in 'iu' or (len(finite) == array.size and np.array_equal(finite, np.round(finite))):
+        low, high = (finite.min(), finite.max()) if finite.size else (0, 0)
+        for code, dtype in INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                break
+        else:
+            code, dtype = 'f8', np.float64
+    else:
+        code, dtype = 'f4', np.float32
+    spec = {'dtype': code, 'bdata': base64.b64encode(np.ascontiguousarray(array, dtype=dtype).tobytes()).decode('ascii')}
+    if array.ndim > 1:
+        spec['shape'] = ','.join(str(n) for n in array.shape)
+    return spec
+
+
+def _round_floats(value, decimals):
+    """중첩된 dict/list 안의 실수 값 반올림 (레이아웃/템플릿의 색상 척도 위치 등)"""
+    if isinstance(value, float):
+        return round(value, decimals)
+    if isinstance(value, dict):
+        return {key: _round_floats(item, decimals) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_round_floats(item, decimals) for item in value]
+    return value
+
+
+def _compact_trace(trace, decimals, typed_arrays):
+    templates = ' '.join(str(trace.get(key, '')) for key in ('hovertemplate', 'texttemplate'))
+    if 'customdata' in trace and 'customdata' not in templates:
+        del trace['customdata']
+
+    for key in TEXT_ARRAY_KEYS:
+        value = trace.get(key)
+        if isinstance(value, (list, tuple, np.ndarray)) and len(value) > 1 and all(
+                isinstance(v, str) and v == value[0] for v in value):
+            trace[key] = value[0]
+
+    for key, value in list(trace.items()):
+        array = _numeric_array(value)
+        if array is None:
+            continue
+        if array.dtype.kind == 'f':
+            array = np.round(array, decimals)
+        trace[key] = array.tolist()
+        if typed_arrays and key in TYPED_ARRAY_KEYS:
+            # 짧은 배열은 base64 + 형식 표기가 숫자 목록보다 길 수 있으므로 더 짧은 쪽을 사용
+            typed = _typed_array(array)
+            if len(json.dumps(typed)) < len(json.dumps(trace[key])):
+                trace[key] = typed
+    return trace
+
+
+def compact_figure(fig, decimals=DEFAULT_DECIMALS, typed_arrays=True):
+    """
+    전송용으로 축소한 새 Figure (원본은 변경하지 않음)
+
+    Args:
+        fig: go.Figure
+        decimals: 실수 배열 반올림 자릿수 (호버/축 표시 정밀도 이상으로)
+        typed_arrays: x/y/z/r 숫자 배열을 typed array로 변환할지 여부
+
+    Returns:
+        go.Figure (검증 없이 구성, st.plotly_chart / plotly_events에 그대로 전달)
+    """
+    spec = fig.to_plotly_json()
+    spec['data'] = [_compact_trace(dict(trace), decimals, typed_arrays) for trace in spec['data']]
+    spec['layout'] = _round_floats(spec['layout'], decimals)
+    return go.Figure(spec, _validate=False)
+
+
+def payload_size(fig):
+    """차트 JSON 스펙 크기 (바이트, st.plotly_chart가 보내는 것과 같은 직렬화)"""
+    return len(pio.to_json(fig, validate=False).encode('utf-8'))
@@ -0,0 +1,121 @@
+"""
+선수 탐색 필터 모듈
+대시보드 사이드바 조건(나이/포지션/능력치)을 데이터에 적용하는 필터 체인
+"""
+import numpy as np
+
+
+def apply_filters(df, age_range, position='All', stat_filters=None):
+    """
+    나이/포지션/능력치 조건으로 선수 데이터 필터링
+
+    Args:
+        df: 처리된 선수 DataFrame
+        age_range: (min_age, max_age) 튜플
+        position: 포지션 카테고리 ('All'이면 전체)
+        stat_filters: {능력치 컬럼: 최소값} 딕셔너리 (0 이하 값은 무시)
+
+    Returns:
+        필터링된 DataFrame
+    """
+    df_filtered = df.copy()
+
+    # 나이 필터 적용
+    df_filtered = df_filtered[
+        (df_filtered['Age'] >= age_range[0]) &
+        (df_filtered['Age'] <= age_range[1])
+        ]
+
+    # 포지션 필터 적용
+    if position != 'All':
+        df_filtered = df_filtered[df_filtered['Position_Category'] == position]
+
+    # 능력치 필터 적용 (포지션별 스텟 필터)
+    for stat_name, min_value in (stat_filters or {}).items():
+        if min_value > 0:  # 0보다 큰 값만 필터로 적용
+            if stat_name in df_filtered.columns:
+                df_filtered = df_filtered[df_filtered[stat_name] >= min_value]
+
+    return df_filtered
+
+
+def select_top(df_filtered, n, score_column='Talent_Score'):
+    """필터링된 선수 중 점수 상위 n명 반환 (정규화 전 점수 기준, 정규화 점수의 0/100 동점을 실제 점수로 구분)"""
+    return df_filtered.nlargest(n, score_column)
+
+
+class IncrementalFilter:
+    """
+    세션별 증분 필터
+
+    직전 조건과 결과(행 위치)를 기억해 두고, 슬라이더 하나만 바뀐 경우
+    - 기준이 엄격해지면(최소값 증가/필터 추가) 직전 결과 안에서만 바뀐 조건을 다시 검사하고
+    - 기준이 완화되면 나이/포지션만 적용된 중간 결과에서 능력치 조건을 다시 적용합니다.
+    결과는 apply_filters와 동일합니다.
+    """
+
+    def __init__(self):
+        self.full_evaluations = 0
+        self.incremental_evaluations = 0
+        self._df = None
+        self._base_key = None
+        self._base_positions = None
+        self._stat_filters = None
+        self._positions = None
+
+    def apply(self, df, age_range, position='All', stat_filters=None):
+        """apply_filters와 같은 인자/결과 (필터링된 DataFrame)"""
+        return df.iloc[self.apply_positions(df, age_range, position, stat_filters)]
+
+    def apply_positions(self, df, age_range, position='All', stat_filters=None):
+        """apply와 같은 조건의 결과 행 위치 배열"""
+        active = {
+            stat_name: min_value for stat_name, min_value in (stat_filters or {}).items()
+            if min_value > 0 and stat_name in df.columns
+        }
+        base_key = (tuple(age_range), position)
+
+        if df is not self._df or base_key != self._base_key:
+            self._base_positions = self._base_positions_for(df, base_key)
+            self._df = df
+            self._base_key = base_key
+            self._stat_filters = None
+
+        previous = self._stat_filters
+        if previous is not None and all(name in active and active[name] >= value for name, value in previous.items()):
+            # 엄격해진 경우: 직전 결과에서 바뀐 조건만 검사
+            changed = {name: value for name, value in active.items() if previous.get(name) != value}
+            positions = self._mask_positions(df, self._positions, changed)
+            self.incremental_evaluations += 1
+        else:
+            # 완화된 경우(또는 첫 계산): 나이/포지션 중간 결과에서 능력치 조건 전체 적용
+            positions = self._mask_positions(df, self._base_positions, active)
+            self.full_evaluations += 1
+
+        self._stat_filters = active
+        self._positions = positions
+        return positions
+
+    def _base_positions_for(self, df, base_key):
+        """나이/포지션 조건만 적용한 행 위치 (직전보다 좁아진 경우 직전 결과에서 계산)"""
+        (age_low, age_high), position = base_key
+        candidates = None
+        if df is self._df and self._base_key is not None:
+            (prev_low, prev_high), prev_position = self._base_key
+            if prev_low <= age_low and age_high <= prev_high and prev_position in ('All', position):
+                candidates = self._base_positions
+
+        if candidates is None:
+            candidates = np.arange(len(df))
+
+        ages = df['Age'].to_numpy()[candidates]
+        mask = (ages >= age_low) & (ages <= age_high)
+        if position != 'All':
+            mask &= df['Position_Category'].to_numpy()[candidates] == position
+        return candidates[mask]
+
+    @staticmethod
+    def _mask_positions(df, positions, conditions):
+        for stat_name, min_value in conditions.items():
+            positions = positions[df[stat_name].to_numpy()[positions] >= min_value]
+        return positions
@@ -0,0 +1,90 @@
+"""
+구간별 실행 시간 계측 모듈
+데이터 처리 단계와 각 화면 블록의 소요 시간을 프로세스 단위 링 버퍼에 모으고
+p50/p95 요약 및 Prometheus 텍스트 포맷으로 노출합니다.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# 구간별로 보관할 최근 측정값 개수
+RING_BUFFER_SIZE = 512
+
+_samples = {}
+_lock = threading.Lock()
+
+
+def record(section, seconds):
+    """구간의 측정값(초)을 링 버퍼에 추가"""
+    with _lock:
+        buffer = _samples.get(section)
+        if buffer is None:
+            buffer = deque(maxlen=RING_BUFFER_SIZE)
+            _samples[section] = buffer
+        buffer.append(seconds)
+
+
+@contextmanager
+def timed(section):
+    """
+    with 블록의 실행 시간을 측정하여 기록하는 컨텍스트 매니저
+
+    Args:
+        section: 구간 이름 (예: 'process_all.load_data')
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(section, time.perf_counter() - start)
+
+
+def get_summary():
+    """
+    구간별 측정 요약 반환
+
+    Returns:
+        구간 이름 순으로 정렬된 dict 리스트 (count, p50/p95/last/total 초 단위)
+    """
+    with _lock:
+        snapshot = {section: list(buffer) for section, buffer in _samples.items()}
+
+    summary = []
+    for section in sorted(snapshot):
+        values = np.asarray(snapshot[section], dtype=float)
+        if len(values) == 0:
+            continue
+        p50, p95 = np.percentile(values, [50, 95])
+        summary.append({
+            'section': section,
+            'count': len(values),
+            'p50': float(p50),
+            'p95': float(p95),
+            'last': float(values[-1]),
+            'total': float(values.sum()),
+        })
+    return summary
+
+
+def to_prometheus(metric_name='epl_dashboard_section_seconds'):
+    """측정 요약을 Prometheus 텍스트 포맷(summary 타입)으로 변환"""
+    lines = [
+        f"# HELP {metric_name} Section execution time over the last {RING_BUFFER_SIZE} samples.",
+        f"# TYPE {metric_name} summary",
+    ]
+    for item in get_summary():
+        label = item['section'].replace('\\', '\\\\').replace('"', '\\"')
+        lines.append(f'{metric_name}{{section="{label}",quantile="0.5"}} {item["p50"]:.6f}')
+        lines.append(f'{metric_name}{{section="{label}",quantile="0.95"}} {item["p95"]:.6f}')
+        lines.append(f'{metric_name}_sum{{section="{label}"}} {item["total"]:.6f}')
+        lines.append(f'{metric_name}_count{{section="{label}"}} {item["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """모든 측정값 초기화"""
+    with _lock:
+        _samples.clear()
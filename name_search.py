@@ -0,0 +1,131 @@
+"""
+선수 이름 검색 모듈
+데이터셋 로드 시 악센트를 제거한(accent-folded) 이름으로 트라이그램 역색인과 단어 접두사 색인을 만들어,
+입력마다 전체 이름을 훑지 않고 후보 선수만 점수화하여 순위가 매겨진 추천 목록을 반환합니다.
+('Łukasz', 'lukasz', 'LUKA' 모두 같은 선수를 찾음)
+"""
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+
+# NFKD 분해로 악센트가 분리되지 않는 문자
+SPECIAL_FOLDS = str.maketrans({
+    'ł': 'l', 'ø': 'o', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'ı': 'i',
+})
+NON_WORD = re.compile(r'[^0-9a-z]+')
+
+DEFAULT_LIMIT = 10
+# 트라이그램 검색 시 질의 트라이그램 중 이 비율 이상을 공유해야 후보로 인정
+MIN_TRIGRAM_OVERLAP = 0.5
+
+
+def fold_name(text):
+    """검색용 이름 정규화 (소문자, 악센트/특수문자 제거, 공백 하나로 구분)"""
+    text = unicodedata.normalize('NFKD', str(text).casefold().translate(SPECIAL_FOLDS))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return NON_WORD.sub(' ', text).strip()
+
+
+def trigrams(folded):
+    """정규화된 이름의 트라이그램 집합 (단어 시작을 구분하도록 앞에 공백 두 칸)"""
+    padded = f"  {folded} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameSearchIndex:
+    """
+    선수 이름 검색 색인
+
+    Args:
+        names: 선수 이름 배열 (행 순서)
+        scores: 동점 시 우선할 점수 배열 (예: Talent_Score, 없으면 행 순서)
+        row_ids: 결과로 돌려줄 행 식별자 배열 (기본값: 0부터의 행 위치)
+    """
+
+    def __init__(self, names, scores=None, row_ids=None):
+        self.names = [str(name) for name in names]
+        self.row_ids = np.arange(len(self.names)) if row_ids is None else np.asarray(row_ids)
+
+        # 점수 순위를 [0, 1) 값으로 저장 (높은 점수일수록 큼, 동점은 행 순서)
+        scores = np.zeros(len(self.names)) if scores is None else np.asarray(scores, dtype=float)
+        order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind='stable')
+        self._score_rank = np.empty(len(self.names))
+        self._score_rank[order] = 1 - np.arange(len(self.names)) / max(len(self.names), 1)
+
+        folded = [fold_name(name) for name in self.names]
+
+        # 트라이그램 -> 이름 번호 배열
+        postings = {}
+        for i, name in enumerate(folded):
+            for gram in trigrams(name):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+        # 단어 접두사 검색용 (단어, 이름 번호, 이름의 첫 단어 여부) 정렬 목록
+        tokens = sorted(
+            (token, i, position == 0) for i, name in enumerate(folded) for position, token in enumerate(name.split())
+        )
+        self._tokens = [token for token, _, _ in tokens]
+        self._token_ids = np.asarray([i for _, i, _ in tokens], dtype=np.int32)
+        self._token_first = np.asarray([first for _, _, first in tokens], dtype=bool)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefix_tiers(self, query_tokens):
+        """
+        단어 접두사 일치 등급 (이름 번호별 배열)
+        모든 질의 단어가 어떤 단어의 접두사이면 2, 그중 첫 질의 단어가 이름의 첫 단어와 일치하면 3, 아니면 0
+        """
+        matched = np.ones(len(self), dtype=bool)
+        leading = np.zeros(len(self), dtype=bool)
+        for k, token in enumerate(query_tokens):
+            lo = bisect.bisect_left(self._tokens, token)
+            hi = bisect.bisect_left(self._tokens, token + '\uffff')
+            ids = self._token_ids[lo:hi]
+            token_match = np.zeros(len(self), dtype=bool)
+            token_match[ids] = True
+            matched &= token_match
+            if k == 0:
+                leading[ids[self._token_first[lo:hi]]] = True
+        return np.where(matched, np.where(leading, 3.0, 2.0), 0.0)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        이름 검색
+
+        순위: 이름 첫 단어 접두사 일치 > 다른 단어 접두사 일치 > 트라이그램 유사도, 같은 등급에서는 점수 높은 순
+
+        Returns:
+            [(행 식별자, 이름), ...] 최대 limit개
+        """
+        folded = fold_name(query)
+        if not folded:
+            return []
+
+        # 1. 단어 접두사 일치 (짧은 입력도 처리)
+        tier = self._prefix_tiers(folded.split())
+
+        # 2. 트라이그램 유사도 (오타/중간 일치), 세 글자 이상일 때만
+        if len(folded) >= 3:
+            query_grams = trigrams(folded)
+            grams = [gram for gram in query_grams if gram in self._postings]
+            if grams:
+                overlap = np.bincount(np.concatenate([self._postings[gram] for gram in grams]),
+                                      minlength=len(self)) / len(query_grams)
+                overlap[overlap < MIN_TRIGRAM_OVERLAP] = 0
+                tier = np.maximum(tier, overlap)
+
+        ids = np.flatnonzero(tier)
+        if len(ids) == 0:
+            return []
+
+        # 등급 차이(최소 1/트라이그램 수)가 점수 순위 값(1 미만)보다 항상 우선하도록 결합
+        key = tier[ids] * 1000 + self._score_rank[ids]
+        if len(ids) > limit:
+            top = np.argpartition(-key, limit - 1)[:limit]
+            ids, key = ids[top], key[top]
+        ranked = ids[np.argsort(-key, kind='stable')]
+        return [(self.row_ids[i].item(), self.names[i]) for i in ranked]
@@ -0,0 +1,159 @@
+"""
+선수 중복 제거 모듈
+여러 출처에서 합친 데이터에는 같은 선수가 철자만 다른 이름(악센트 유무, 이름/성 순서, 오타)으로
+UID가 달리 여러 번 들어 있어 선수 수와 순위가 부풀려집니다.
+생년월일 + 국적이 같은 행끼리만 후보 블록으로 묶고(blocking), 블록 안에서만 정규화된 이름의
+트라이그램 유사도를 비교하므로 전체 쌍 비교 없이 수백만 행에도 적용할 수 있습니다.
+유사한 쌍은 union-find로 묶고, 각 묶음은 정해진 규칙으로 한 행으로 병합합니다.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from name_search import fold_name, trigrams
+
+# 블록 키로 사용할 국적 컬럼 후보 (원본 약어 / 변환 후 이름 / 기존 데이터셋)
+NATION_COLUMNS = ('Nat', 'NationID', 'Nationality')
+DOB_COLUMN = 'DOB'
+NAME_COLUMN = 'Name'
+
+# 이름 트라이그램 Dice 계수가 이 값 이상이면 같은 선수로 판단
+DEFAULT_SIMILARITY = 0.8
+# 블록이 이보다 크면 (예: 임시 생년월일 값) 이름 첫 글자로 한 번 더 나누어 비교 쌍 수 제한
+MAX_BLOCK_SIZE = 200
+
+DedupReport = namedtuple('DedupReport', ['input_rows', 'output_rows', 'merges', 'clusters', 'pairs_compared'])
+
+
+def normalize_name(name):
+    """비교용 이름 (악센트/대소문자 제거, 단어 정렬로 이름/성 순서 무시)"""
+    return ' '.join(sorted(fold_name(name).split()))
+
+
+def name_similarity(left, right):
+    """정규화된 두 이름의 트라이그램 Dice 계수 (0~1)"""
+    if left == right:
+        return 1.0
+    left_grams, right_grams = trigrams(left), trigrams(right)
+    if not left_grams or not right_grams:
+        return 0.0
+    return 2 * len(left_grams & right_grams) / (len(left_grams) + len(right_grams))
+
+
+class _UnionFind:
+    """행 번호 묶음 (작은 번호가 대표가 되도록 합쳐 결과가 입력 순서에만 의존)"""
+
+    def __init__(self, size):
+        self.parent = np.arange(size)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def _candidate_blocks(df, nation_column):
+    """
+    2행 이상인 (생년월일, 국적) 블록의 행 위치 배열 목록
+    한 행짜리 블록은 비교할 필요가 없으므로 벡터 연산으로 먼저 걸러냅니다.
+    """
+    block_ids = df.groupby([DOB_COLUMN, nation_column], sort=False, dropna=True).ngroup().to_numpy()
+    valid = block_ids >= 0  # 생년월일/국적이 비어 있는 행은 -1 (비교 제외)
+    if not valid.any():
+        return []
+    in_shared_block = valid.copy()
+    in_shared_block[valid] = np.bincount(block_ids[valid])[block_ids[valid]] > 1
+    candidates = np.flatnonzero(in_shared_block)
+    if len(candidates) == 0:
+        return []
+    candidates = candidates[np.argsort(block_ids[candidates], kind='stable')]
+    return np.split(candidates, np.flatnonzero(np.diff(block_ids[candidates])) + 1)
+
+
+def _split_large_block(block, names):
+    """너무 큰 블록은 정규화된 이름의 첫 글자별로 나눔"""
+    if len(block) <= MAX_BLOCK_SIZE:
+        return [block]
+    groups = {}
+    for position in block:
+        groups.setdefault(names[position][:1], []).append(position)
+    return [np.asarray(group) for group in groups.values() if len(group) > 1]
+
+
+def _survivor_order(df, positions):
+    """
+    묶음 안의 병합 순서 (첫 행이 남는 행)
+    채워진 컬럼이 많은 행 우선, 같으면 UID가 작은 행, 그다음 원래 행 순서
+    """
+    subset = df.iloc[positions]
+    keys = [positions, -subset.notna().sum(axis=1).to_numpy()]
+    if 'UID' in df.columns:
+        keys.insert(1, pd.to_numeric(subset['UID'], errors='coerce').fillna(np.inf).to_numpy())
+    return positions[np.lexsort(keys)]
+
+
+def deduplicate_players(df, similarity=DEFAULT_SIMILARITY):
+    """
+    생년월일 + 국적 블록 안에서 이름이 비슷한 선수 행을 병합
+
+    남는 행은 채워진 값이 가장 많은 행(같으면 UID가 작은 행)이며, 비어 있는 값은 병합되는 행의 값으로
+    순서대로 채웁니다. 남는 행은 원래 위치를 유지하므로 같은 입력에는 항상 같은 결과가 나옵니다.
+
+    Args:
+        df: 원본 선수 DataFrame (Name, DOB, 국적 컬럼 필요, 없으면 그대로 반환)
+        similarity: 같은 선수로 볼 이름 유사도 기준 (0~1)
+
+    Returns:
+        (중복 제거된 DataFrame, DedupReport) 튜플
+    """
+    nation_column = next((column for column in NATION_COLUMNS if column in df.columns), None)
+    if nation_column is None or not {NAME_COLUMN, DOB_COLUMN} <= set(df.columns):
+        return df, DedupReport(len(df), len(df), 0, 0, 0)
+
+    blocks = _candidate_blocks(df, nation_column)
+    candidate_positions = np.concatenate(blocks) if blocks else np.zeros(0, dtype=int)
+    raw_names = df[NAME_COLUMN].to_numpy()
+    names = {position: normalize_name(raw_names[position]) for position in candidate_positions}
+
+    union_find = _UnionFind(len(df))
+    pairs_compared = 0
+    for block in blocks:
+        for sub_block in _split_large_block(block, names):
+            for i, left in enumerate(sub_block):
+                for right in sub_block[i + 1:]:
+                    pairs_compared += 1
+                    if name_similarity(names[left], names[right]) >= similarity:
+                        union_find.union(left, right)
+
+    clusters = {}
+    for position in candidate_positions:
+        clusters.setdefault(union_find.find(position), []).append(position)
+    clusters = [np.sort(members) for members in clusters.values() if len(members) > 1]
+    if not clusters:
+        return df, DedupReport(len(df), len(df), 0, 0, pairs_compared)
+
+    # 묶음별로 남는 행을 앞에 두고 groupby.first로 남는 행의 빈 값을 병합되는 행의 값으로 순서대로 채움
+    ordered = [_survivor_order(df, np.asarray(members)) for members in clusters]
+    merged_positions = np.concatenate(ordered)
+    cluster_labels = np.repeat(np.arange(len(ordered)), [len(members) for members in ordered])
+    merged = df.iloc[merged_positions].groupby(cluster_labels, sort=True).first()
+
+    survivors = [members[0] for members in ordered]
+    survivor_labels = df.index[survivors]
+    keep = np.ones(len(df), dtype=bool)
+    keep[merged_positions] = False
+    keep[survivors] = True
+    result = df[keep].copy()
+    result.loc[survivor_labels] = result.loc[survivor_labels].fillna(merged.set_axis(survivor_labels))
+    merges = len(df) - len(result)
+
+    return result, DedupReport(len(df), len(result), merges, len(clusters), pairs_compared)
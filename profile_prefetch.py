@@ -0,0 +1,117 @@
+"""
+선수 프로필 사전 계산 모듈
+순위 차트에 표시된 선수(최대 10명)는 곧 클릭될 가능성이 높으므로,
+차트를 보여주는 동안 백그라운드 스레드에서 레이더 값/기본 정보/비교 테이블 행을 미리 계산해
+세션별 캐시에 넣어 둡니다. 클릭 후 레이더 패널은 딕셔너리 조회만 수행합니다.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# 선택된 선수 비교 테이블 컬럼
+COMPARE_COLUMNS = ['Name', 'Age', 'Position_Category', 'Overall_Rating', 'Talent_Score_Normalized']
+
+DEFAULT_MAX_ENTRIES = 64
+
+# 프로세스 전체에서 공유하는 작업 스레드 (세션마다 스레드를 만들지 않도록)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='profile-prefetch')
+
+
+def build_profile_snapshot(player_row, stat_columns):
+    """
+    선수 한 명의 프로필 패널 데이터 계산
+
+    Args:
+        player_row: 처리된 DataFrame의 선수 행 (Series)
+        stat_columns: 레이더 차트에 사용할 수 있는 능력치 컬럼 목록
+
+    Returns:
+        {'age', 'position', 'talent_score', 'key_stats', 'compare_row'} 딕셔너리
+    """
+    return {
+        'age': int(player_row['Age']),
+        'position': player_row['Position_Category'],
+        'talent_score': float(player_row['Talent_Score_Normalized']),
+        # 데이터에 없는 능력치는 0 (레이더 패널과 동일)
+        'key_stats': {stat: float(player_row[stat]) if stat in player_row.index else 0 for stat in stat_columns},
+        'compare_row': {column: player_row[column] for column in COMPARE_COLUMNS},
+    }
+
+
+class ProfilePrefetchCache:
+    """세션별 선수 프로필 캐시 (백그라운드에서 채워지는 LRU)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def submit(self, dataset_key, players_df, stat_columns):
+        """
+        표시 중인 선수들의 프로필 계산을 백그라운드로 예약
+
+        Args:
+            dataset_key: (데이터셋 이름, 데이터셋 버전) (캐시 키에 포함, 파일이 바뀌면 새 키)
+            players_df: 순위 차트에 표시된 선수 DataFrame (최대 10행, UID 컬럼 필요)
+            stat_columns: 레이더 차트에 사용할 수 있는 능력치 컬럼 목록
+        """
+        with self._lock:
+            uids = [uid for uid in players_df['UID'].unique()
+                    if (dataset_key, uid) not in self._entries and (dataset_key, uid) not in self._pending]
+        if not uids:
+            return
+
+        # 작업 스레드가 원본 DataFrame을 공유하지 않도록 필요한 행만 복사해 전달
+        rows = players_df[players_df['UID'].isin(uids)].copy()
+        stat_columns = list(stat_columns)
+        with self._lock:
+            # 잠금을 잡은 채 예약하여 작업이 먼저 끝나더라도 대기 목록 정리가 뒤따르도록 함
+            future = _executor.submit(self._compute, dataset_key, rows, stat_columns)
+            for uid in uids:
+                self._pending[(dataset_key, uid)] = future
+
+    def _compute(self, dataset_key, rows, stat_columns):
+        try:
+            snapshots = {row['UID']: build_profile_snapshot(row, stat_columns) for _, row in rows.iterrows()}
+            with self._lock:
+                for uid, snapshot in snapshots.items():
+                    key = (dataset_key, uid)
+                    self._entries[key] = snapshot
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        finally:
+            # 실패한 경우에도 대기 목록에서 제거하여 호출 측이 직접 계산하도록 함
+            with self._lock:
+                for uid in rows['UID']:
+                    self._pending.pop((dataset_key, uid), None)
+
+    def get(self, dataset_key, uid):
+        """
+        캐시된 프로필 조회 (계산 중이면 완료될 때까지 대기)
+
+        Returns:
+            build_profile_snapshot 결과 또는 None (예약되지 않은 선수)
+        """
+        key = (dataset_key, uid)
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            future.exception()  # 완료 대기 (실패 시 캐시에 없으므로 None 반환)
+
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return snapshot
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'pending': len(self._pending),
+                    'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,243 @@
+"""
+헤드리스 유망주 조회 API
+Streamlit UI 없이 get_top_talents / get_player_details 결과를 HTTP/JSON으로 제공합니다.
+처리된 데이터셋은 서버 시작 시 한 번만 로드하며, 응답은 쿼리 파라미터 기준 LRU 캐시에 보관합니다.
+
+사용 예:
+    python query_api.py --csv dataset_new.csv --port 8600
+    curl "http://localhost:8600/top-talents?age_min=18&age_max=21&position=Forward&n=10"
+    curl "http://localhost:8600/players/12345"
+    python query_api.py --db data/sqlite/dataset_new.sqlite --port 8600  # SQLite 데이터셋 (처리 없이 바로 시작)
+"""
+import argparse
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from data_processor import FootballDataProcessor
+from sqlite_store import SQLitePlayerStore
+
+# 목록 조회 시 반환할 컬럼
+SUMMARY_COLUMNS = [
+    'UID', 'Name', 'Age', 'Position_Category', 'Overall_Rating',
+    'Potential_Score', 'Position_Specialized_Score', 'Talent_Score_Normalized'
+]
+
+POSITION_OPTIONS = ['All', 'Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+
+
+class QueryError(Exception):
+    """잘못된 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class LRUResponseCache:
+    """쿼리 키별 직렬화된 응답을 보관하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'max_size': self.max_size,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+class TalentQueryService:
+    """처리된 데이터셋 위에서 유망주 순위/선수 상세 조회를 수행하는 서비스"""
+
+    def __init__(self, processor, cache_size=256):
+        """
+        Args:
+            processor: process_all()이 완료된 FootballDataProcessor 또는 SQLitePlayerStore
+            cache_size: 응답 캐시 최대 항목 수
+        """
+        self.processor = processor
+        self.cache = LRUResponseCache(cache_size)
+
+    def top_talents(self, n=50, age_range=None, position=None, min_rating=None):
+        """상위 유망주 목록 (JSON 직렬화 가능한 dict 리스트)"""
+        key = ('top_talents', n, age_range, position, min_rating)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        df_top = self.processor.get_top_talents(
+            n=n, age_range=age_range, position=position, min_rating=min_rating
+        )
+        columns = [c for c in SUMMARY_COLUMNS if c in df_top.columns]
+        result = json.loads(df_top[columns].to_json(orient='records', force_ascii=False))
+        self.cache.put(key, result)
+        return result
+
+    def player_details(self, player_uid):
+        """특정 선수의 전체 능력치 (dict)"""
+        key = ('player_details', player_uid)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            player = self.processor.get_player_details(player_uid)
+        except (IndexError, KeyError):
+            raise QueryError(404, f"UID {player_uid} 선수를 찾을 수 없습니다.")
+        result = json.loads(player.to_json(force_ascii=False))
+        self.cache.put(key, result)
+        return result
+
+    def handle(self, path, query_string=''):
+        """
+        요청 경로/쿼리 문자열을 처리하여 (상태 코드, 응답 dict) 반환
+
+        HTTP 서버와 LocalClient가 공통으로 사용합니다.
+        """
+        params = {k: v[-1] for k, v in parse_qs(query_string).items()}
+        parts = [p for p in path.split('/') if p]
+
+        try:
+            if parts == ['top-talents']:
+                return 200, {'players': self.top_talents(**_parse_top_talent_params(params))}
+            if len(parts) == 2 and parts[0] == 'players':
+                return 200, {'player': self.player_details(_parse_int(parts[1], 'uid'))}
+            if parts == ['health']:
+                rows = (self.processor.row_count if isinstance(self.processor, SQLitePlayerStore)
+                        else len(self.processor.processed_df))
+                return 200, {'status': 'ok', 'rows': rows,
+                             'cache': self.cache.stats()}
+            raise QueryError(404, f"알 수 없는 경로입니다: {path}")
+        except QueryError as e:
+            return e.status, {'error': e.message}
+
+
+def _parse_int(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise QueryError(400, f"'{name}' 값은 정수여야 합니다: {value}")
+
+
+def _parse_float(value, name):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise QueryError(400, f"'{name}' 값은 숫자여야 합니다: {value}")
+
+
+def _parse_top_talent_params(params):
+    """쿼리 파라미터를 get_top_talents 인자로 정규화 (캐시 키가 같아지도록)"""
+    kwargs = {'n': _parse_int(params.get('n', 50), 'n')}
+    if kwargs['n'] <= 0:
+        raise QueryError(400, "'n' 값은 1 이상이어야 합니다.")
+
+    if 'age_min' in params or 'age_max' in params:
+        age_min = _parse_int(params.get('age_min', 0), 'age_min')
+        age_max = _parse_int(params.get('age_max', 200), 'age_max')
+        kwargs['age_range'] = (age_min, age_max)
+
+    position = params.get('position')
+    if position:
+        if position not in POSITION_OPTIONS:
+            raise QueryError(400, f"'position' 값은 {', '.join(POSITION_OPTIONS)} 중 하나여야 합니다.")
+        if position != 'All':
+            kwargs['position'] = position
+
+    if 'min_rating' in params:
+        kwargs['min_rating'] = _parse_float(params['min_rating'], 'min_rating')
+
+    return kwargs
+
+
+def make_handler(service):
+    """service를 사용하는 HTTP 요청 핸들러 클래스 생성"""
+
+    class QueryRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, payload = service.handle(url.path, url.query)
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return QueryRequestHandler
+
+
+class LocalClient:
+    """소켓 없이 서비스를 직접 호출하는 로컬(모의) 클라이언트"""
+
+    def __init__(self, service):
+        self.service = service
+
+    def get(self, url):
+        """
+        Args:
+            url: '/top-talents?position=Forward&n=5' 형태의 요청 경로
+
+        Returns:
+            (상태 코드, 응답 dict)
+        """
+        parts = urlsplit(url)
+        status, payload = self.service.handle(parts.path, parts.query)
+        # 실제 HTTP 응답과 동일하게 JSON 왕복 직렬화
+        return status, json.loads(json.dumps(payload, ensure_ascii=False))
+
+
+def create_service(csv_path, cache_size=256, db_path=None):
+    """CSV를 처리하여 조회 서비스 생성 (db_path가 있으면 SQLite 데이터셋을 바로 사용)"""
+    if db_path:
+        return TalentQueryService(SQLitePlayerStore(db_path), cache_size=cache_size)
+    processor = FootballDataProcessor(csv_path)
+    processor.process_all()
+    return TalentQueryService(processor, cache_size=cache_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 유망주 조회 API 서버")
+    parser.add_argument('--csv', default='dataset_new.csv', help="선수 데이터 CSV 경로")
+    parser.add_argument('--db', default=None, help="SQLite 데이터셋 경로 (sqlite_store.py로 생성, 지정 시 --csv 무시)")
+    parser.add_argument('--host', default='127.0.0.1', help="바인딩할 호스트")
+    parser.add_argument('--port', type=int, default=8600, help="바인딩할 포트")
+    parser.add_argument('--cache-size', type=int, default=256, help="응답 캐시 최대 항목 수")
+    args = parser.parse_args()
+
+    service = create_service(args.csv, cache_size=args.cache_size, db_path=args.db)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    print(f"조회 API 서버를 시작합니다: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
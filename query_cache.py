@@ -0,0 +1,107 @@
+"""
+필터 조회 결과 캐시 모듈
+대시보드 필터 조합(포지션, 나이 범위, 능력치 기준, 표시 인원)별 결과를 프로세스 전체에서 공유합니다.
+DataFrame 대신 행 위치 배열만 보관하므로 항목당 메모리가 작고, 여러 세션이 같은 조건을 조회해도
+필터 체인을 다시 계산하지 않습니다. 데이터셋 버전이 바뀌면 해당 데이터셋의 항목은 모두 제거됩니다.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def normalize_filter_key(position, age_range, stat_filters, top_n):
+    """
+    필터 조건을 캐시 키로 정규화 (0 이하 기준값은 apply_filters와 같이 무시, 순서 무관)
+
+    Returns:
+        (포지션, (최소 나이, 최대 나이), ((능력치, 최소값), ...), 표시 인원) 튜플
+    """
+    thresholds = tuple(sorted(
+        (stat_name, float(min_value)) for stat_name, min_value in (stat_filters or {}).items() if min_value > 0
+    ))
+    return position, (int(age_range[0]), int(age_range[1])), thresholds, int(top_n)
+
+
+class QueryResultCache:
+    """(데이터셋, 필터 키)별 행 위치 배열을 보관하는 스레드 안전 LRU 캐시 (항목 수/바이트 제한)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # {(데이터셋, 필터 키): (필터 결과 위치, 상위 n명 위치)}
+        self._bytes = 0
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def _sync_version(self, dataset, version):
+        """데이터셋 버전이 바뀌었으면 이전 버전 항목 제거 (잠금 안에서 호출)"""
+        previous = self._versions.get(dataset)
+        if previous == version:
+            return
+        if previous is not None:
+            for key in [key for key in self._entries if key[0] == dataset]:
+                self._bytes -= _entry_bytes(self._entries.pop(key))
+            self.invalidations += 1
+        self._versions[dataset] = version
+
+    def get(self, dataset, version, filter_key):
+        """
+        캐시된 결과 조회
+
+        Returns:
+            (필터 결과 행 위치 배열, 상위 n명 행 위치 배열) 또는 None
+        """
+        key = (dataset, filter_key)
+        with self._lock:
+            self._sync_version(dataset, version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, dataset, version, filter_key, positions, top_positions):
+        """결과 저장 (배열은 읽기 전용으로 바꿔 세션 간에 안전하게 공유)"""
+        positions.flags.writeable = False
+        top_positions.flags.writeable = False
+        entry = (positions, top_positions)
+        key = (dataset, filter_key)
+        with self._lock:
+            self._sync_version(dataset, version)
+            if key in self._entries:
+                self._bytes -= _entry_bytes(self._entries.pop(key))
+            self._entries[key] = entry
+            self._bytes += _entry_bytes(entry)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._bytes -= _entry_bytes(self._entries.popitem(last=False)[1])
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _entry_bytes(entry):
+    return sum(array.nbytes for array in entry)
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+query_cache = QueryResultCache()
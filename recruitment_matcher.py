@@ -0,0 +1,142 @@
+"""
+팀 약점 -> 유망주 매칭 모듈
+팀 분석의 영입 카테고리(예: '볼 위닝/수비수', '골키퍼')를 가중 능력치 프로필로 정의하고,
+선수 능력치 행렬과 한 번의 행렬곱으로 모든 카테고리 점수를 계산하여 상위 후보를 추출합니다.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# 영입 카테고리별 대상 포지션과 능력치 가중치
+CATEGORY_PROFILES = {
+    '공격수/피니셔': {
+        'positions': ['Forward'],
+        'weights': {'Finishing': 3, 'Composure': 2, 'OffTheBall': 2, 'FirstTouch': 1, 'Heading': 1, 'Anticipation': 1},
+    },
+    '플레이메이커/윙어': {
+        'positions': ['Midfielder', 'Forward'],
+        'weights': {'Vision': 3, 'Passing': 2, 'Dribbling': 2, 'Crossing': 2, 'Technique': 1, 'Flair': 1, 'Acceleration': 1},
+    },
+    '미드필더/빌드업': {
+        'positions': ['Midfielder'],
+        'weights': {'Passing': 3, 'Decisions': 2, 'FirstTouch': 2, 'Technique': 2, 'Vision': 1, 'Composure': 1, 'Stamina': 1},
+    },
+    '볼 위닝/수비수': {
+        'positions': ['Defender', 'Midfielder'],
+        'weights': {'Tackling': 3, 'Anticipation': 2, 'Positioning': 2, 'Workrate': 1, 'Aggression': 1, 'Stamina': 1},
+    },
+    '수비 조직력/CB': {
+        'positions': ['Defender'],
+        'weights': {'Marking': 3, 'Positioning': 3, 'Heading': 2, 'Concentration': 2, 'Strength': 1, 'Jumping': 1},
+    },
+    '골키퍼': {
+        'positions': ['Goalkeeper'],
+        'weights': {'Reflexes': 3, 'Handling': 2, 'OneOnOnes': 2, 'CommandOfArea': 1, 'AerialAbility': 1, 'Kicking': 1},
+    },
+    '공격 볼륨': {
+        'positions': ['Forward', 'Midfielder'],
+        'weights': {'LongShots': 3, 'Finishing': 2, 'OffTheBall': 2, 'Technique': 1, 'Acceleration': 1},
+    },
+}
+
+# 후보 목록에 표시할 컬럼
+SHORTLIST_COLUMNS = ['UID', 'Name', 'Age', 'Position_Category', 'Overall_Rating', 'Talent_Score_Normalized']
+
+DEFAULT_CACHE_SIZE = 128
+
+
+class RecruitmentMatcher:
+    """선수 능력치 행렬을 미리 만들어 두고 카테고리별 상위 후보를 빠르게 추출하는 매처"""
+
+    def __init__(self, df, profiles=CATEGORY_PROFILES, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            df: FootballDataProcessor.process_all() 결과 DataFrame
+            profiles: 카테고리별 {'positions': [...], 'weights': {능력치: 가중치}}
+            cache_size: 팀별 후보 목록 캐시 최대 항목 수
+        """
+        self.df = df
+        self.categories = list(profiles)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        attributes = sorted({attr for p in profiles.values() for attr in p['weights'] if attr in df.columns})
+        self.attributes = attributes
+
+        # 선수 × 능력치 행렬 (결측은 0)
+        matrix = np.nan_to_num(df[attributes].to_numpy(dtype=np.float32, copy=True))
+
+        # 능력치 × 카테고리 가중치 행렬 (카테고리별 합 1로 정규화)
+        weights = np.zeros((len(attributes), len(self.categories)), dtype=np.float32)
+        for c, category in enumerate(self.categories):
+            for attr, weight in profiles[category]['weights'].items():
+                if attr in attributes:
+                    weights[attributes.index(attr), c] = weight
+            total = weights[:, c].sum()
+            if total > 0:
+                weights[:, c] /= total
+
+        # 모든 카테고리 점수를 한 번에 계산 (선수 × 카테고리)
+        self.scores = matrix @ weights
+
+        positions = df['Position_Category'].to_numpy()
+        self._eligible = np.column_stack([
+            np.isin(positions, profiles[category]['positions']) for category in self.categories
+        ]) if self.categories else np.zeros((len(df), 0), dtype=bool)
+        self._ages = df['Age'].to_numpy(dtype=float)
+
+    def top_k(self, category, k=5, age_range=None):
+        """
+        카테고리 점수 상위 k명
+
+        Returns:
+            SHORTLIST_COLUMNS + 'Match_Score' 컬럼의 DataFrame (점수 내림차순)
+        """
+        c = self.categories.index(category)
+        mask = self._eligible[:, c].copy()
+        if age_range:
+            mask &= (self._ages >= age_range[0]) & (self._ages <= age_range[1])
+
+        candidates = np.flatnonzero(mask)
+        scores = self.scores[candidates, c]
+        if len(candidates) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[part], scores[part]
+        order = np.argsort(-scores, kind='stable')
+
+        columns = [col for col in SHORTLIST_COLUMNS if col in self.df.columns]
+        result = self.df.iloc[candidates[order]][columns].copy()
+        result['Match_Score'] = scores[order]
+        return result
+
+    def shortlist_for_team(self, team_key, categories, k=5, age_range=None):
+        """
+        팀의 약점 카테고리별 후보 목록 (팀 단위로 캐싱)
+
+        Args:
+            team_key: 캐시 키로 사용할 팀 식별자 (예: (시즌 키, 팀 이름))
+            categories: 영입 카테고리 목록
+            k: 카테고리별 후보 수
+            age_range: (min_age, max_age) 튜플
+
+        Returns:
+            {카테고리: 후보 DataFrame}
+        """
+        cache_key = (team_key, tuple(sorted(categories)), k, age_range)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+        shortlist = {
+            category: self.top_k(category, k=k, age_range=age_range)
+            for category in categories if category in self.categories
+        }
+
+        with self._lock:
+            self._cache[cache_key] = shortlist
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return shortlist
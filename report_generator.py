@@ -0,0 +1,261 @@
+"""
+주간 팀/포지션 리포트 일괄 생성 CLI
+시즌의 모든 팀 × 4개 포지션 조합마다 팀 지표 히트맵 행, 팀 분석 문구(analyze_team_performance),
+포지션별 상위 유망주를 담은 정적 HTML 리포트를 만듭니다.
+
+선수 데이터는 부모 프로세스에서 한 번만 처리하여 공유 데이터셋(shared_dataset.py)으로 내보내고,
+프로세스 풀의 각 워커는 이를 읽기 전용으로 연결하여 리포트를 병렬로 렌더링합니다.
+plotly.js는 출력 폴더에 한 번만 저장하고 각 리포트에서 상대 경로로 참조합니다.
+
+사용 예:
+    python report_generator.py --out-dir reports --workers 4 --timing-output report_timing.json
+"""
+import argparse
+import html
+import json
+import multiprocessing as mp
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pandas as pd
+import plotly.express as px
+from plotly.offline import get_plotlyjs
+
+from dataset_registry import DatasetRegistry
+from shared_dataset import attach_processor, export_dataset
+from views.league_overview import (
+    PROSPECT_AGE_RANGE, analyze_team_performance, build_team_heatmap, scale_team_stats
+)
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Forward']
+DEFAULT_TOP_N = 10
+PLOTLY_JS_FILE = 'plotly.min.js'
+
+PROSPECT_COLUMNS = {
+    'Name': '이름', 'Age': '나이', 'Primary_Position': '세부 포지션', 'Overall_Rating': '종합능력치',
+    'Position_Specialized_Score': '포지션 점수', 'Talent_Score_Normalized': '유망주점수',
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 24px auto; max-width: 1100px; color: #222; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 6px 8px; text-align: left; }}
+.analysis {{ background: #f5f7fa; border-radius: 8px; padding: 12px 16px; line-height: 1.6; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# 워커 프로세스 전역 상태 (_init_worker에서 한 번 설정)
+_worker = {}
+
+
+def report_file_name(team, position):
+    """리포트 파일명 (팀명의 공백/특수문자는 '_'로 치환)"""
+    return f"{re.sub(r'[^0-9A-Za-z]+', '_', team).strip('_')}_{position}.html"
+
+
+def markdown_to_html(text):
+    """analyze_team_performance 문구(굵게/줄바꿈만 사용)를 HTML로 변환"""
+    escaped = html.escape(text)
+    return re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', escaped).replace('\n', '<br>')
+
+
+def _init_worker(shared_path, team_context):
+    with redirect_stdout(StringIO()):
+        _, processor = attach_processor(shared_path)
+    _worker['processor'] = processor
+    _worker.update(team_context)
+
+
+def render_report(team, position, top_n):
+    """
+    팀/포지션 리포트 한 건을 렌더링하여 저장 (워커 프로세스에서 실행)
+
+    Returns:
+        {'team', 'position', 'file', 'prospects', 'bytes', 'seconds'} 딕셔너리
+    """
+    start = time.perf_counter()
+    df_scaled, df_raw = _worker['df_scaled'], _worker['df_raw']
+
+    # 1. 팀 지표 히트맵 행 (정규화는 리그 전체 팀 기준)
+    team_row = df_scaled[df_scaled['Squad'] == team]
+    fig_heat = build_team_heatmap(team_row, title=f"{team} 팀 지표 ({_worker['season_label']})", height=320)
+    fig_heat.update_traces(textfont_color='#333', selector=dict(type='scatter'))
+
+    # 2. 팀 분석 문구
+    message, rank_tier = analyze_team_performance(team, df_scaled, df_raw, _worker['team_trends'].get(team))
+
+    # 3. 포지션별 상위 유망주
+    prospects = _worker['processor'].get_top_talents(n=top_n, age_range=PROSPECT_AGE_RANGE, position=position)
+    columns = [c for c in PROSPECT_COLUMNS if c in prospects.columns]
+    table = prospects[columns].rename(columns=PROSPECT_COLUMNS).round(2)
+    fig_prospects = px.bar(
+        prospects, x='Name', y='Talent_Score_Normalized', color='Age',
+        labels={'Name': '선수', 'Talent_Score_Normalized': '유망주점수', 'Age': '나이'},
+        title=f"{position} 상위 유망주 ({PROSPECT_AGE_RANGE[0]}-{PROSPECT_AGE_RANGE[1]}세)"
+    )
+    fig_prospects.update_layout(height=420)
+
+    body = "\n".join([
+        f"<h1>{html.escape(team)} · {position} 리포트</h1>",
+        f"<p>{_worker['season_label']} 시즌 | 득점 순위 {rank_tier}</p>",
+        fig_heat.to_html(full_html=False, include_plotlyjs=False),
+        "<h2>팀 분석</h2>",
+        f"<div class='analysis'>{markdown_to_html(message)}</div>",
+        f"<h2>{position} 상위 유망주</h2>",
+        fig_prospects.to_html(full_html=False, include_plotlyjs=False),
+        table.to_html(index=False, border=0),
+    ])
+    page = PAGE_TEMPLATE.format(title=html.escape(f"{team} {position}"), plotly_js=PLOTLY_JS_FILE, body=body)
+
+    file_name = report_file_name(team, position)
+    with open(os.path.join(_worker['out_dir'], file_name), 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    return {'team': team, 'position': position, 'file': file_name, 'prospects': len(prospects),
+            'bytes': len(page.encode('utf-8')), 'seconds': time.perf_counter() - start}
+
+
+def _write_index(out_dir, season_label, teams, results):
+    files = {(r['team'], r['position']): r['file'] for r in results}
+    rows = "\n".join(
+        f"<tr><td>{html.escape(team)}</td>" + "".join(
+            f"<td><a href='{files[(team, position)]}'>{position}</a></td>" if (team, position) in files
+            else "<td>-</td>" for position in POSITIONS
+        ) + "</tr>"
+        for team in teams
+    )
+    body = (f"<h1>{season_label} 주간 리포트</h1>"
+            f"<table><tr><th>팀</th>{''.join(f'<th>{p}</th>' for p in POSITIONS)}</tr>\n{rows}</table>")
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(PAGE_TEMPLATE.format(title=html.escape(f"{season_label} 주간 리포트"),
+                                     plotly_js=PLOTLY_JS_FILE, body=body))
+
+
+def _team_context(registry, season_key, out_dir):
+    """워커에 전달할 시즌 팀 데이터 (히트맵 정규화/분석 문구용)"""
+    df_raw = registry.load_team_stats(season_key).copy()
+    standings = registry.load_standings(season_key)
+    team_order = standings['squad'].tolist() if standings is not None else sorted(df_raw['Squad'].unique())
+    df_raw['Squad'] = pd.Categorical(df_raw['Squad'], categories=team_order, ordered=True)
+    df_raw = df_raw.sort_values('Squad').reset_index(drop=True)
+    df_raw['Squad'] = df_raw['Squad'].astype(str)
+
+    team_trends = registry.load_team_trends(season_key.league)
+    return {
+        'season_label': season_key.label,
+        'out_dir': out_dir,
+        'df_raw': df_raw,
+        'df_scaled': scale_team_stats(df_raw),
+        'team_trends': {team: team_trends.team_trend(team, season_key) for team in df_raw['Squad']},
+    }
+
+
+def generate_reports(registry, season_key, dataset_name, out_dir, workers=4, top_n=DEFAULT_TOP_N,
+                     shared_path=None):
+    """
+    시즌의 모든 팀 × 포지션 리포트 생성
+
+    Args:
+        registry: DatasetRegistry
+        season_key: 리포트 대상 시즌 (SeasonKey)
+        dataset_name: 유망주를 뽑을 선수 데이터셋 이름
+        out_dir: 출력 폴더
+        workers: 프로세스 풀 크기
+        top_n: 포지션별 유망주 수
+        shared_path: 이미 만들어진 공유 데이터셋 폴더 (None이면 임시 폴더에 생성)
+
+    Returns:
+        리포트별 결과 목록 (render_report 반환값, 팀/포지션 순)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, PLOTLY_JS_FILE), 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+
+    context = _team_context(registry, season_key, out_dir)
+    teams = context['df_raw']['Squad'].tolist()
+    tasks = [(team, position) for team in teams for position in POSITIONS]
+
+    with tempfile.TemporaryDirectory(prefix='epl-report-') as tmp_dir:
+        if shared_path is None:
+            # 선수 데이터 처리는 부모 프로세스에서 한 번만 수행
+            df, processor = registry.load_players(dataset_name)
+            shared_path = os.path.join(tmp_dir, dataset_name)
+            export_dataset(df, shared_path, source=processor.csv_path, is_new_format=processor.is_new_format,
+                           score_normalizer=processor.score_normalizer)
+
+        ctx = mp.get_context('spawn')
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                                 initargs=(shared_path, context)) as executor:
+            futures = [executor.submit(render_report, team, position, top_n) for team, position in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                print(f"[{len(results)}/{len(tasks)}] {result['file']} {result['seconds'] * 1000:.0f}ms",
+                      file=sys.stderr)
+
+    order = {task: i for i, task in enumerate(tasks)}
+    results.sort(key=lambda r: order[(r['team'], r['position'])])
+    _write_index(out_dir, season_key.label, teams, results)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="팀 × 포지션 주간 HTML 리포트 일괄 생성")
+    parser.add_argument('--data-dir', default=os.environ.get('EPL_DATA_DIR', '.'), help="데이터 파일 폴더")
+    parser.add_argument('--season', default=None, help="시즌 (예: 2024-2025, 기본값: 최신 시즌)")
+    parser.add_argument('--dataset', default=None, help="선수 데이터셋 이름 (기본값: dataset_new)")
+    parser.add_argument('--out-dir', default='reports', help="리포트 출력 폴더")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="렌더링 프로세스 수")
+    parser.add_argument('--top-n', type=int, default=DEFAULT_TOP_N, help="포지션별 유망주 수")
+    parser.add_argument('--timing-output', default=None, help="리포트별 소요 시간 JSON 경로")
+    args = parser.parse_args()
+
+    registry = DatasetRegistry(data_dir=args.data_dir, shared_dir=os.environ.get('EPL_SHARED_DATASET_DIR'))
+    seasons = registry.team_seasons()
+    if not seasons:
+        raise SystemExit(f"팀 지표 파일을 찾을 수 없습니다: {args.data_dir}")
+    season_key = next((key for key in seasons if key.season == args.season), None) if args.season else seasons[0]
+    if season_key is None:
+        raise SystemExit(f"시즌을 찾을 수 없습니다: {args.season}")
+
+    names = registry.player_datasets()
+    if not names:
+        raise SystemExit(f"선수 데이터셋이 없습니다: {args.data_dir}")
+    dataset_name = args.dataset or ('dataset_new' if 'dataset_new' in names else names[0])
+
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        results = generate_reports(registry, season_key, dataset_name, args.out_dir, workers=args.workers,
+                                   top_n=args.top_n, shared_path=registry.shared_player_dirs.get(dataset_name))
+    elapsed = time.perf_counter() - start
+
+    seconds = [r['seconds'] for r in results]
+    print(f"리포트 {len(results)}건 생성: 전체 {elapsed:.1f}초, 리포트당 평균 {sum(seconds) / len(seconds) * 1000:.0f}ms "
+          f"(최대 {max(seconds) * 1000:.0f}ms) -> {os.path.join(args.out_dir, 'index.html')}")
+
+    if args.timing_output:
+        with open(args.timing_output, 'w', encoding='utf-8') as f:
+            json.dump({'season': season_key.label, 'dataset': dataset_name, 'workers': args.workers,
+                       'elapsed': elapsed, 'reports': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+점수 정규화 모듈
+전체 최소/최대값 기준 0-100 정규화는 값 하나만 잘못 들어와도 나머지 모든 점수가 한쪽으로 압축됩니다.
+여기서는 분위수(np.partition으로 부분 정렬하여 계산) 기반의 두 가지 방식을 제공합니다.
+
+- clip: 사분위 범위(IQR) 밖으로 크게 벗어난 값(울타리 밖)만 잘라낸 범위로 최소/최대 정규화
+        (이상치가 없으면 기존 최소/최대 정규화와 같은 결과, 순위 동점이 생기지 않음)
+- rank: 분위수 격자로 백분위 순위를 보간 (분포 모양과 무관하게 0-100에 고르게 분포)
+
+학습된 파라미터(to_dict)는 처리 결과와 함께 보관되어, 일부 행만 바뀌는 경우 전체 열을 다시 훑지 않고
+transform만으로 같은 기준의 점수를 계산할 수 있습니다.
+"""
+import numpy as np
+
+METHODS = ('clip', 'rank')
+DEFAULT_PERCENTILES = (25, 75)
+DEFAULT_FENCE = 3.0  # 울타리 = 하위 분위수 - 3×IQR ~ 상위 분위수 + 3×IQR
+DEFAULT_RANK_GRID = 1001
+CONSTANT_SCORE = 50.0  # 값이 모두 같을 때의 점수
+
+
+def quantiles(values, probabilities):
+    """
+    결측/무한대를 제외한 분위수 (선형 보간, np.quantile과 같은 값)
+    필요한 순위 위치만 np.partition으로 맞추므로 전체 정렬보다 빠릅니다.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    probabilities = np.asarray(probabilities, dtype=float)
+    if len(values) == 0:
+        return np.full(len(probabilities), np.nan)
+
+    positions = probabilities * (len(values) - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    partitioned = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (positions - lower)
+
+
+class ScoreNormalizer:
+    """
+    0-100 점수 정규화 (fit으로 파라미터 계산, transform으로 적용)
+
+    Args:
+        method: 'clip' (울타리 밖 이상치만 잘라낸 최소/최대) 또는 'rank' (백분위 순위)
+        percentiles: clip 울타리 계산에 사용할 (하위, 상위) 백분위
+        fence: clip 울타리 폭 (IQR 배수)
+        grid_size: rank 분위수 격자 점 수
+    """
+
+    def __init__(self, method='clip', percentiles=DEFAULT_PERCENTILES, fence=DEFAULT_FENCE,
+                 grid_size=DEFAULT_RANK_GRID):
+        if method not in METHODS:
+            raise ValueError(f"지원하지 않는 정규화 방식입니다: {method}")
+        self.method = method
+        self.percentiles = tuple(percentiles)
+        self.fence = fence
+        self.grid_size = grid_size
+        self.low = None
+        self.high = None
+        self.grid = None
+
+    @property
+    def fitted(self):
+        return self.low is not None
+
+    def fit(self, values):
+        """파라미터 계산 (전체 값을 한 번 훑음)"""
+        values = np.asarray(values, dtype=float)
+        if self.method == 'clip':
+            q_low, q_high = quantiles(values, np.asarray(self.percentiles) / 100)
+            spread = (q_high - q_low) * self.fence
+            self.low = float(max(np.nanmin(values), q_low - spread)) if np.isfinite(q_low) else np.nan
+            self.high = float(min(np.nanmax(values), q_high + spread)) if np.isfinite(q_high) else np.nan
+        else:
+            grid = quantiles(values, np.linspace(0, 1, self.grid_size))
+            self.low, self.high = float(grid[0]), float(grid[-1])
+            self.grid = grid
+        return self
+
+    def transform(self, values):
+        """저장된 파라미터로 0-100 점수 계산 (결측은 결측 유지, 범위 밖 값은 0/100)"""
+        if not self.fitted:
+            raise RuntimeError("fit()을 먼저 호출해야 합니다.")
+        values = np.asarray(values, dtype=float)
+        if not self.high > self.low:
+            return np.where(np.isnan(values), np.nan, CONSTANT_SCORE)
+
+        if self.method == 'clip':
+            scores = (np.clip(values, self.low, self.high) - self.low) / (self.high - self.low) * 100
+        else:
+            # 같은 값이 여러 격자 점에 걸치면 그 백분위의 평균을 사용 (np.interp는 증가하는 x 필요)
+            grid_values, inverse = np.unique(self.grid, return_inverse=True)
+            ranks = np.bincount(inverse, weights=np.linspace(0, 100, len(self.grid))) / np.bincount(inverse)
+            scores = np.interp(values, grid_values, ranks)
+        return np.where(np.isnan(values), np.nan, scores)
+
+    def fit_transform(self, values):
+        return self.fit(values).transform(values)
+
+    def to_dict(self):
+        """저장용 파라미터 (매니페스트/SQLite dataset_info에 JSON으로 기록)"""
+        return {
+            'method': self.method,
+            'percentiles': list(self.percentiles),
+            'fence': self.fence,
+            'grid_size': self.grid_size,
+            'low': self.low,
+            'high': self.high,
+            'grid': None if self.grid is None else self.grid.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, params):
+        normalizer = cls(params['method'], params['percentiles'], params['fence'], params['grid_size'])
+        normalizer.low = params['low']
+        normalizer.high = params['high']
+        normalizer.grid = None if params['grid'] is None else np.asarray(params['grid'], dtype=float)
+        return normalizer
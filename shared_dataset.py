@@ -0,0 +1,189 @@
+"""
+멀티 워커 배포용 공유 데이터셋 모듈
+로더 프로세스가 process_all() 결과를 한 번만 계산하여 메모리 매핑 가능한 NumPy 파일로 내보내고,
+각 Streamlit 워커는 이 파일을 읽기 전용으로 연결(attach)합니다.
+숫자 컬럼은 dtype별 2차원 블록 하나로 저장되어 모든 워커가 같은 물리 메모리(페이지 캐시)를 공유하며,
+문자열 등 나머지 컬럼만 워커별로 로드됩니다.
+
+사용 예:
+    python shared_dataset.py --csv dataset_new.csv --out-dir /dev/shm/epl-dashboard
+    EPL_SHARED_DATASET_DIR=/dev/shm/epl-dashboard streamlit run app.py --server.port 8501
+    EPL_SHARED_DATASET_DIR=/dev/shm/epl-dashboard streamlit run app.py --server.port 8502
+"""
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from data_processor import FootballDataProcessor
+from score_normalization import ScoreNormalizer
+
+MANIFEST_FILE = 'manifest.json'
+OBJECT_COLUMNS_FILE = 'object_columns.pkl'
+MANIFEST_VERSION = 1
+
+
+def _is_shared_dtype(dtype):
+    """메모리 매핑으로 공유할 수 있는 컬럼 dtype (NumPy 정수/실수/불리언)"""
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+
+
+def export_dataset(df, out_dir, source=None, is_new_format=False, score_normalizer=None):
+    """
+    처리된 선수 DataFrame을 공유 데이터셋 폴더로 내보내기
+
+    이미 폴더가 있으면 새 폴더를 다 쓴 뒤 교체하므로, 기존 파일을 연결 중인 워커는
+    재시작 전까지 이전 데이터를 계속 사용할 수 있습니다.
+
+    Args:
+        df: FootballDataProcessor.process_all() 결과
+        out_dir: 데이터셋 폴더 (예: /dev/shm/epl-dashboard/dataset_new)
+        source: 원본 CSV 경로 (매니페스트에 기록)
+        is_new_format: 원본이 새 데이터셋 형식인지 여부
+        score_normalizer: 유망주 점수 정규화 파라미터 (연결한 워커가 다시 계산하지 않도록 기록)
+
+    Returns:
+        매니페스트 dict
+    """
+    out_dir = os.path.abspath(out_dir)
+    tmp_dir = f"{out_dir}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    # dtype별로 숫자 컬럼을 모아 (컬럼 수, 행 수) 배열로 저장 -> 연결 시 복사 없이 DataFrame 블록이 됨
+    groups = {}
+    object_columns = []
+    for column, dtype in df.dtypes.items():
+        if _is_shared_dtype(dtype):
+            groups.setdefault(dtype.str, []).append(column)
+        else:
+            object_columns.append(column)
+
+    blocks = []
+    for i, (dtype_str, columns) in enumerate(groups.items()):
+        file_name = f"block_{i}_{np.dtype(dtype_str).name}.npy"
+        matrix = np.ascontiguousarray(df[columns].to_numpy(dtype=np.dtype(dtype_str)).T)
+        np.save(os.path.join(tmp_dir, file_name), matrix)
+        blocks.append({'file': file_name, 'dtype': dtype_str, 'columns': columns})
+
+    # 숫자가 아닌 컬럼(이름/포지션 문자열 등)과 인덱스는 pickle로 저장
+    df[object_columns].to_pickle(os.path.join(tmp_dir, OBJECT_COLUMNS_FILE))
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'rows': len(df),
+        'columns': list(df.columns),
+        'blocks': blocks,
+        'object_file': OBJECT_COLUMNS_FILE,
+        'source': source,
+        'is_new_format': bool(is_new_format),
+        'score_normalization': score_normalizer.to_dict() if score_normalizer else None,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    # 매니페스트를 마지막에 기록 (매니페스트가 있으면 완성된 데이터셋)
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    old_dir = None
+    if os.path.exists(out_dir):
+        old_dir = f"{out_dir}.old-{os.getpid()}"
+        os.rename(out_dir, old_dir)
+    os.rename(tmp_dir, out_dir)
+    if old_dir:
+        shutil.rmtree(old_dir)
+
+    return manifest
+
+
+def read_manifest(directory):
+    """데이터셋 폴더의 매니페스트 (없으면 None)"""
+    path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def attach_dataset(directory):
+    """
+    공유 데이터셋을 읽기 전용으로 연결
+
+    Returns:
+        숫자 컬럼이 메모리 매핑 배열을 그대로 사용하는 DataFrame
+        (컬럼 순서는 문자열 컬럼 다음 dtype별 숫자 컬럼 순. 재정렬하면 복사가 일어나므로 유지)
+    """
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"공유 데이터셋 매니페스트를 찾을 수 없습니다: {directory}")
+    if manifest['version'] != MANIFEST_VERSION:
+        raise ValueError(f"지원하지 않는 공유 데이터셋 버전입니다: {manifest['version']}")
+
+    object_df = pd.read_pickle(os.path.join(directory, manifest['object_file']))
+    frames = [object_df]
+    for block in manifest['blocks']:
+        matrix = np.load(os.path.join(directory, block['file']), mmap_mode='r')
+        frames.append(pd.DataFrame(matrix.T, columns=block['columns'], index=object_df.index, copy=False))
+
+    return pd.concat(frames, axis=1, copy=False)
+
+
+def attach_processor(directory):
+    """
+    공유 데이터셋을 연결하여 조회용 FootballDataProcessor 구성 (process_all 없이 인덱스만 생성)
+
+    Returns:
+        (DataFrame, FootballDataProcessor) 튜플 (DatasetRegistry.load_players와 동일한 형태)
+    """
+    manifest = read_manifest(directory)
+    df = attach_dataset(directory)
+    processor = FootballDataProcessor(manifest['source'] if manifest else None)
+    processor.is_new_format = bool(manifest and manifest.get('is_new_format'))
+    if manifest and manifest.get('score_normalization'):
+        processor.score_normalizer = ScoreNormalizer.from_dict(manifest['score_normalization'])
+    processor.df = df
+    processor.processed_df = df
+    processor._build_indexes()
+    return df, processor
+
+
+def discover_shared_datasets(shared_dir):
+    """공유 폴더 아래의 완성된 데이터셋 목록 {이름: 폴더 경로}"""
+    datasets = {}
+    if not shared_dir or not os.path.isdir(shared_dir):
+        return datasets
+    for name in sorted(os.listdir(shared_dir)):
+        path = os.path.join(shared_dir, name)
+        if '.tmp-' in name or '.old-' in name or not os.path.isdir(path):
+            continue
+        if read_manifest(path) is not None:
+            datasets[name] = path
+    return datasets
+
+
+def build_shared_dataset(csv_path, out_dir, name=None):
+    """CSV를 처리하여 out_dir/<name> 공유 데이터셋 생성 (로더 프로세스)"""
+    name = name or os.path.splitext(os.path.basename(csv_path))[0]
+    processor = FootballDataProcessor(csv_path)
+    df = processor.process_all()
+    return export_dataset(df, os.path.join(out_dir, name), source=os.path.abspath(csv_path),
+                          is_new_format=processor.is_new_format, score_normalizer=processor.score_normalizer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티 워커용 공유 데이터셋 생성 (로더)")
+    parser.add_argument('--csv', default='dataset_new.csv', help="선수 데이터 CSV 경로")
+    parser.add_argument('--out-dir', default='/dev/shm/epl-dashboard', help="공유 데이터셋 상위 폴더")
+    parser.add_argument('--name', default=None, help="데이터셋 이름 (기본값: CSV 파일명)")
+    args = parser.parse_args()
+
+    manifest = build_shared_dataset(args.csv, args.out_dir, name=args.name)
+    print(f"공유 데이터셋을 생성했습니다: {manifest['rows']:,}행, 숫자 블록 {len(manifest['blocks'])}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+"""
+SQLite 선수 데이터 저장소 모듈
+process_all() 결과를 로컬 SQLite 파일로 한 번 적재(ingest)해 두고, 앱/조회 API는 CSV를 다시 처리하지 않고
+파일을 읽기 전용으로 열어 조회합니다. get_top_talents는 조건과 ORDER BY ... LIMIT n을,
+대시보드 필터 체인은 나이/포지션/능력치 조건을 WHERE 절로 넘기므로 조건에 맞는 행만 메모리에 올라옵니다.
+
+사용 예:
+    python sqlite_store.py --csv dataset_new.csv --out-dir data/sqlite
+    EPL_SQLITE_DIR=data/sqlite streamlit run app.py
+"""
+import argparse
+import json
+import os
+import pickle
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from data_processor import FootballDataProcessor
+from dataset_metadata import DatasetMetadata
+from score_normalization import ScoreNormalizer
+
+SQLITE_EXTENSION = '.sqlite'
+PLAYERS_TABLE = 'players'
+INFO_TABLE = 'dataset_info'
+ROW_ID = 'row_id'  # 원본 DataFrame의 행 번호 (조회 결과의 인덱스)
+# 순위 정렬 컬럼 (정규화 점수는 이상치가 모두 0/100으로 같아지므로 정규화 전 점수)
+SCORE_COLUMN = 'Talent_Score'
+SCHEMA_VERSION = 1
+
+# 포지션별 핵심 능력치 (대시보드 사이드바 필터 대상): (Position_Category, 능력치) 복합 인덱스 생성
+INDEXED_ATTRIBUTES = [
+    'Overall_Rating',
+    'Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility',
+    'Marking', 'Tackling', 'Heading', 'Positioning', 'Anticipation', 'Strength', 'Pace',
+    'Passing', 'Vision', 'Technique', 'FirstTouch', 'Stamina', 'Workrate', 'Decisions',
+    'Finishing', 'Dribbling', 'Composure', 'OffTheBall', 'Acceleration',
+]
+
+INGEST_CHUNK_ROWS = 10_000
+
+
+def _quote(column):
+    """SQL 식별자 인용 (컬럼명에 공백/특수문자가 있어도 안전하게)"""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def ingest_dataset(df, db_path, source=None, is_new_format=False, score_normalizer=None):
+    """
+    처리된 선수 DataFrame을 SQLite 파일로 적재
+
+    임시 파일에 모두 기록한 뒤 교체하므로, 기존 파일을 열어 둔 프로세스는 재시작 전까지 이전 데이터를 사용합니다.
+
+    Args:
+        df: FootballDataProcessor.process_all() 결과
+        db_path: 생성할 SQLite 파일 경로
+        source: 원본 CSV 경로 (dataset_info에 기록)
+        is_new_format: 원본이 새 데이터셋 형식인지 여부
+        score_normalizer: 유망주 점수 정규화 파라미터 (dataset_info에 기록)
+
+    Returns:
+        manifest dict
+    """
+    db_path = os.path.abspath(db_path)
+    tmp_path = f"{db_path}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    table = df.reset_index(drop=True)
+    table.index.name = ROW_ID
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute('PRAGMA journal_mode=OFF')
+        conn.execute('PRAGMA synchronous=OFF')
+        table.to_sql(PLAYERS_TABLE, conn, index=True, chunksize=INGEST_CHUNK_ROWS)
+
+        indexes = {
+            'uid': ['UID'],
+            'age': ['Age'],
+            'score': [SCORE_COLUMN, ROW_ID],
+            'position_score': ['Position_Category', SCORE_COLUMN, ROW_ID],
+            'position_age': ['Position_Category', 'Age'],
+        }
+        for attribute in INDEXED_ATTRIBUTES:
+            indexes[f'position_{attribute.lower()}'] = ['Position_Category', attribute]
+        available = set(table.columns) | {ROW_ID}
+        for name, columns in indexes.items():
+            if set(columns) <= available:
+                # 점수는 내림차순 인덱스 (ORDER BY 점수 DESC LIMIT n을 인덱스 순서대로 읽음)
+                column_sql = ', '.join(_quote(c) + (' DESC' if c == SCORE_COLUMN else '') for c in columns)
+                conn.execute(f'CREATE INDEX idx_{name} ON {PLAYERS_TABLE} ({column_sql})')
+
+        manifest = {
+            'version': SCHEMA_VERSION,
+            'rows': len(table),
+            'columns': list(df.columns),
+            'source': source,
+            'is_new_format': bool(is_new_format),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }
+        # 사이드바용 메타데이터를 미리 계산해 저장 (앱 시작 시 전체 행을 읽지 않도록)
+        conn.execute(f'CREATE TABLE {INFO_TABLE} (key TEXT PRIMARY KEY, value BLOB)')
+        conn.executemany(f'INSERT INTO {INFO_TABLE} VALUES (?, ?)', [
+            ('manifest', json.dumps(manifest, ensure_ascii=False)),
+            ('metadata', pickle.dumps(DatasetMetadata(df))),
+            ('score_normalization', json.dumps(score_normalizer.to_dict() if score_normalizer else None)),
+        ])
+        conn.execute('ANALYZE')
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    return manifest
+
+
+def discover_sqlite_datasets(sqlite_dir):
+    """폴더 아래의 SQLite 데이터셋 목록 {이름: 파일 경로}"""
+    datasets = {}
+    if not sqlite_dir or not os.path.isdir(sqlite_dir):
+        return datasets
+    for file_name in sorted(os.listdir(sqlite_dir)):
+        path = os.path.join(sqlite_dir, file_name)
+        if file_name.endswith(SQLITE_EXTENSION) and os.path.isfile(path):
+            datasets[file_name[:-len(SQLITE_EXTENSION)]] = path
+    return datasets
+
+
+class SQLitePlayerStore:
+    """
+    SQLite 파일 기반 선수 조회 (FootballDataProcessor의 조회 메서드와 같은 인자/결과)
+
+    스레드마다 읽기 전용 연결을 따로 열어 사용합니다 (Streamlit 세션 스레드 간 공유 없음).
+    """
+
+    PROFILE_COLUMNS = FootballDataProcessor.PROFILE_COLUMNS
+    TECHNICAL_ATTRIBUTES = FootballDataProcessor.TECHNICAL_ATTRIBUTES
+    MENTAL_ATTRIBUTES = FootballDataProcessor.MENTAL_ATTRIBUTES
+    PHYSICAL_ATTRIBUTES = FootballDataProcessor.PHYSICAL_ATTRIBUTES
+
+    def __init__(self, db_path):
+        self.db_path = os.path.abspath(db_path)
+        self._local = threading.local()
+
+        manifest = json.loads(self._info('manifest'))
+        if manifest['version'] != SCHEMA_VERSION:
+            raise ValueError(f"지원하지 않는 SQLite 데이터셋 버전입니다: {manifest['version']}")
+        self.manifest = manifest
+        self.columns = manifest['columns']
+        self.row_count = manifest['rows']
+        self.is_new_format = manifest['is_new_format']
+        score_normalization = json.loads(self._info('score_normalization') or 'null')
+        self.score_normalizer = ScoreNormalizer.from_dict(score_normalization) if score_normalization else None
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def _info(self, key):
+        row = self._connection().execute(f'SELECT value FROM {INFO_TABLE} WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _query(self, where, params, order_by=None, limit=None):
+        sql = f'SELECT * FROM {PLAYERS_TABLE}'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        if order_by:
+            sql += f' ORDER BY {order_by}'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = params + [int(limit)]
+        return pd.read_sql_query(sql, self._connection(), params=params, index_col=ROW_ID)
+
+    @staticmethod
+    def _base_conditions(age_range, position):
+        where, params = [], []
+        if age_range:
+            where.append('Age BETWEEN ? AND ?')
+            params += [float(age_range[0]), float(age_range[1])]
+        if position and position != 'All':
+            where.append('Position_Category = ?')
+            params.append(position)
+        return where, params
+
+    def load_metadata(self, version=None):
+        """적재 시 계산해 둔 DatasetMetadata"""
+        metadata = pickle.loads(self._info('metadata'))
+        metadata.version = version
+        return metadata
+
+    def get_top_talents(self, n=50, age_range=None, position=None, min_rating=None):
+        """상위 유망주 선수 추출 (조건과 ORDER BY/LIMIT을 SQLite에서 처리)"""
+        where, params = self._base_conditions(age_range, position)
+        if min_rating is not None:
+            where.append('Overall_Rating >= ?')
+            params.append(float(min_rating))
+        return self._query(where, params, order_by=f'{SCORE_COLUMN} DESC, {ROW_ID}', limit=n)
+
+    def filter_players(self, age_range, position='All', stat_filters=None):
+        """filter_engine.apply_filters와 같은 조건의 선수 (조건에 맞는 행만 읽음, 원래 행 순서)"""
+        where, params = self._base_conditions(age_range, position)
+        for stat_name, min_value in (stat_filters or {}).items():
+            if min_value > 0 and stat_name in self.columns:
+                where.append(f'{_quote(stat_name)} >= ?')
+                params.append(float(min_value))
+        return self._query(where, params, order_by=ROW_ID)
+
+    def get_player_details(self, player_uid):
+        """특정 선수의 상세 정보 반환"""
+        # NumPy 정수(np.int64 등)는 sqlite3가 바인딩하지 못하므로 파이썬 값으로 변환
+        player_uid = player_uid.item() if hasattr(player_uid, 'item') else player_uid
+        result = self._query(['UID = ?'], [player_uid], limit=1)
+        if result.empty:
+            raise IndexError(f"UID {player_uid} 선수를 찾을 수 없습니다.")
+        return result.iloc[0]
+
+    def get_players(self, player_uids):
+        """UID 목록의 선수 (요청한 순서대로, 없는 UID는 제외)"""
+        player_uids = [uid.item() if hasattr(uid, 'item') else uid for uid in player_uids]
+        if not player_uids:
+            return self._query(['0'], [])
+        result = self._query([f"UID IN ({', '.join('?' * len(player_uids))})"], player_uids)
+        positions = dict(zip(result['UID'].tolist(), range(len(result))))
+        return result.iloc[[positions[uid] for uid in player_uids if uid in positions]]
+
+    def read_columns(self, columns):
+        """일부 컬럼만 전체 행 읽기 (이름 검색 색인 생성 등, 원래 행 순서)"""
+        column_sql = ', '.join([ROW_ID] + [_quote(column) for column in columns])
+        return pd.read_sql_query(f'SELECT {column_sql} FROM {PLAYERS_TABLE} ORDER BY {ROW_ID}',
+                                 self._connection(), index_col=ROW_ID)
+
+    def get_rows(self, row_ids):
+        """행 번호 목록의 선수 (요청한 순서대로)"""
+        row_ids = [int(row_id) for row_id in row_ids]
+        if not row_ids:
+            return self._query(['0'], [])
+        result = self._query([f"{ROW_ID} IN ({', '.join('?' * len(row_ids))})"], row_ids)
+        return result.reindex([row_id for row_id in row_ids if row_id in result.index])
+
+    def read_all(self):
+        """전체 선수 DataFrame (전체 행이 필요한 영입 매처 등에서 사용)"""
+        return self._query([], [], order_by=ROW_ID)
+
+
+def build_sqlite_dataset(csv_path, out_dir, name=None):
+    """CSV를 처리하여 out_dir/<name>.sqlite 생성"""
+    name = name or os.path.splitext(os.path.basename(csv_path))[0]
+    processor = FootballDataProcessor(csv_path)
+    df = processor.process_all()
+    os.makedirs(out_dir, exist_ok=True)
+    return ingest_dataset(df, os.path.join(out_dir, f"{name}{SQLITE_EXTENSION}"),
+                          source=os.path.abspath(csv_path), is_new_format=processor.is_new_format,
+                          score_normalizer=processor.score_normalizer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="처리된 선수 데이터를 SQLite 파일로 적재")
+    parser.add_argument('--csv', default='dataset_new.csv', help="선수 데이터 CSV 경로")
+    parser.add_argument('--out-dir', default='data/sqlite', help="SQLite 파일을 만들 폴더")
+    parser.add_argument('--name', default=None, help="데이터셋 이름 (기본값: CSV 파일명)")
+    args = parser.parse_args()
+
+    manifest = build_sqlite_dataset(args.csv, args.out_dir, name=args.name)
+    print(f"SQLite 데이터셋을 생성했습니다: {manifest['rows']:,}행, 컬럼 {len(manifest['columns'])}개")
+
+
+if __name__ == '__main__':
+    main()
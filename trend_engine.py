@@ -0,0 +1,133 @@
+"""
+시즌별 팀 지표 추세 분석 모듈
+여러 시즌의 팀 지표를 (시즌 × 팀 × 지표) 3차원 배열로 쌓고,
+전 시즌 대비 변화량 / 이동 평균 / 리그 내 z-score를 한 번에 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+# 추세를 계산할 팀 지표 (league_overview 히트맵과 동일)
+TREND_METRICS = ['Gls', 'Ast', 'G+A', 'G/SoT', 'SoT/90', 'SCA90', 'Save%',
+                 'Tkl%', 'Cmp%', 'xGA', 'Int', 'PrgDist']
+
+# 값이 낮을수록 좋은 지표
+LOWER_IS_BETTER = {'xGA'}
+
+# 의미 있는 변화로 판단할 z-score 변화량
+SIGNIFICANT_Z_CHANGE = 0.5
+
+
+class TeamTrends:
+    """
+    시즌 × 팀 × 지표 배열과 파생 지표 묶음
+
+    Attributes:
+        seasons: 시즌 키 리스트 (오래된 순)
+        teams: 팀 이름 리스트
+        metrics: 지표 컬럼 리스트
+        values: 원본 값 (S, T, M), 해당 시즌에 없는 팀은 NaN
+        deltas: 전 시즌 대비 변화량 (S, T, M), 첫 시즌은 NaN
+        rolling: 최근 window 시즌 이동 평균 (S, T, M)
+        zscores: 시즌별 리그 내 z-score (S, T, M), 낮을수록 좋은 지표는 부호 반전
+    """
+
+    def __init__(self, seasons, teams, metrics, values, window):
+        self.seasons = list(seasons)
+        self.teams = list(teams)
+        self.metrics = list(metrics)
+        self.values = values
+        self.window = window
+        self._team_index = {team: i for i, team in enumerate(self.teams)}
+        self._compute()
+
+    def _compute(self):
+        values = self.values
+        n_seasons = values.shape[0]
+
+        # 전 시즌 대비 변화량
+        self.deltas = np.full_like(values, np.nan)
+        if n_seasons > 1:
+            self.deltas[1:] = values[1:] - values[:-1]
+
+        # 이동 평균 (결측 시즌은 제외하고 평균)
+        present = ~np.isnan(values)
+        cum_sum = np.cumsum(np.where(present, values, 0.0), axis=0)
+        cum_cnt = np.cumsum(present, axis=0)
+        window_sum = cum_sum.copy()
+        window_cnt = cum_cnt.copy()
+        if n_seasons > self.window:
+            window_sum[self.window:] -= cum_sum[:-self.window]
+            window_cnt[self.window:] -= cum_cnt[:-self.window]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.rolling = np.where(window_cnt > 0, window_sum / window_cnt, np.nan)
+
+        # 시즌별 리그 내 z-score (팀 축 기준)
+        direction = np.array([-1.0 if m in LOWER_IS_BETTER else 1.0 for m in self.metrics])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nanmean(values, axis=1, keepdims=True)
+            std = np.nanstd(values, axis=1, keepdims=True)
+            self.zscores = np.where(std > 0, (values - mean) / std, 0.0) * direction
+        self.zscores[~present] = np.nan
+        self.direction = direction
+
+    def season_index(self, season_key):
+        return self.seasons.index(season_key)
+
+    def team_trend(self, team, season_key):
+        """
+        특정 팀/시즌의 지표별 추세 표
+
+        Returns:
+            index=지표, columns=[value, previous, delta, rolling, zscore, z_change, trend] DataFrame
+            (trend: 1=개선, -1=하락, 0=유지, NaN=비교 불가)
+        """
+        s = self.season_index(season_key)
+        t = self._team_index.get(team)
+        n_metrics = len(self.metrics)
+        if t is None:
+            empty = np.full(n_metrics, np.nan)
+            return pd.DataFrame({'value': empty, 'previous': empty, 'delta': empty, 'rolling': empty,
+                                 'zscore': empty, 'z_change': empty, 'trend': empty}, index=self.metrics)
+
+        previous = self.values[s - 1, t] if s > 0 else np.full(n_metrics, np.nan)
+        z_change = (self.zscores[s, t] - self.zscores[s - 1, t]) if s > 0 else np.full(n_metrics, np.nan)
+        trend = np.where(z_change >= SIGNIFICANT_Z_CHANGE, 1.0,
+                         np.where(z_change <= -SIGNIFICANT_Z_CHANGE, -1.0, 0.0))
+        trend[np.isnan(z_change)] = np.nan
+
+        return pd.DataFrame({
+            'value': self.values[s, t],
+            'previous': previous,
+            'delta': self.deltas[s, t],
+            'rolling': self.rolling[s, t],
+            'zscore': self.zscores[s, t],
+            'z_change': z_change,
+            'trend': trend,
+        }, index=self.metrics)
+
+
+def build_team_trends(season_frames, metrics=TREND_METRICS, window=3):
+    """
+    시즌별 팀 지표 DataFrame을 쌓아 추세 객체 생성
+
+    Args:
+        season_frames: {시즌 키: 'Squad' + 지표 컬럼을 가진 DataFrame} (시즌 키는 정렬 가능해야 함)
+        metrics: 사용할 지표 컬럼
+        window: 이동 평균 시즌 수
+
+    Returns:
+        TeamTrends
+    """
+    seasons = sorted(season_frames)
+    teams = sorted(set().union(*(set(df['Squad'].astype(str)) for df in season_frames.values())))
+    team_index = {team: i for i, team in enumerate(teams)}
+
+    values = np.full((len(seasons), len(teams), len(metrics)), np.nan)
+    for s, season in enumerate(seasons):
+        df = season_frames[season]
+        rows = df['Squad'].astype(str).map(team_index).to_numpy()
+        available = [m for m in metrics if m in df.columns]
+        cols = [metrics.index(m) for m in available]
+        values[s, rows[:, None], cols] = df[available].to_numpy(dtype=float)
+
+    return TeamTrends(seasons, teams, metrics, values, window)
@@ -0,0 +1,55 @@
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from figure_cache import figure_cache
+from query_cache import query_cache
+
+
+def show_page():
+    """구간별 실행 시간 요약을 보여주는 숨김 관리자 페이지 (?admin=metrics)"""
+    st.title("⏱️ 실행 시간 계측")
+    st.caption(
+        f"현재 프로세스에서 구간별 최근 {instrumentation.RING_BUFFER_SIZE}회 측정값을 기준으로 집계합니다."
+    )
+
+    summary = instrumentation.get_summary()
+    if not summary:
+        st.info("아직 측정된 구간이 없습니다. 다른 페이지를 한 번 이상 열어주세요.")
+        return
+
+    summary_df = pd.DataFrame(summary)
+    summary_df[['p50', 'p95', 'last']] = summary_df[['p50', 'p95', 'last']] * 1000
+    summary_df = summary_df[['section', 'count', 'p50', 'p95', 'last']]
+    summary_df.columns = ['구간', '측정 횟수', 'p50 (ms)', 'p95 (ms)', '최근 (ms)']
+    st.dataframe(summary_df.round(2), use_container_width=True, hide_index=True)
+
+    col_reset, col_download = st.columns([1, 1])
+    with col_reset:
+        if st.button("🔄 측정값 초기화", use_container_width=True):
+            instrumentation.reset()
+            st.rerun()
+
+    prometheus_text = instrumentation.to_prometheus()
+    with col_download:
+        st.download_button(
+            label="📥 Prometheus 포맷 다운로드",
+            data=prometheus_text,
+            file_name='metrics.prom',
+            mime='text/plain',
+            use_container_width=True
+        )
+
+    with st.expander("Prometheus 텍스트 포맷"):
+        st.code(prometheus_text, language='text')
+
+    # 프로세스 공유 캐시 현황
+    st.subheader("🗃️ 캐시")
+    cache_stats = {'필터 조회 결과': query_cache.stats(), '차트': figure_cache.stats()}
+    cache_df = pd.DataFrame([
+        {'캐시': name, '항목 수': stats['entries'], '크기 (KB)': stats['bytes'] / 1024,
+         '히트': stats['hits'], '미스': stats['misses'],
+         '히트율 (%)': stats['hits'] / (stats['hits'] + stats['misses']) * 100 if stats['hits'] + stats['misses'] else 0}
+        for name, stats in cache_stats.items()
+    ])
+    st.dataframe(cache_df.round(1), use_container_width=True, hide_index=True)
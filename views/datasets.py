@@ -0,0 +1,24 @@
+import os
+
+import streamlit as st
+
+from dataset_registry import DEFAULT_MAX_LOADED, DatasetRegistry
+
+
+@st.cache_resource
+def get_registry():
+    """
+    프로세스 전체에서 공유하는 데이터셋 레지스트리
+
+    환경 변수:
+        EPL_DATA_DIR: 데이터 파일 폴더 (기본값: 현재 폴더)
+        EPL_MAX_LOADED_DATASETS: 메모리에 유지할 데이터셋 수
+        EPL_SHARED_DATASET_DIR: 공유 데이터셋 폴더 (멀티 워커 배포 시 shared_dataset.py로 생성)
+        EPL_SQLITE_DIR: SQLite 데이터셋 폴더 (sqlite_store.py로 생성)
+    """
+    return DatasetRegistry(
+        data_dir=os.environ.get('EPL_DATA_DIR', '.'),
+        max_loaded=int(os.environ.get('EPL_MAX_LOADED_DATASETS', DEFAULT_MAX_LOADED)),
+        shared_dir=os.environ.get('EPL_SHARED_DATASET_DIR'),
+        sqlite_dir=os.environ.get('EPL_SQLITE_DIR')
+    )
@@ -7,9 +7,66 @@ import textwrap
 import os
 import toml
 import base64
+import html
 import mimetypes
-
-CSV_FILE = 'epl_2024_2025_full_stats.csv'
+import string
+from functools import lru_cache
+
+from figure_payload import compact_figure
+from instrumentation import timed
+from views.datasets import get_registry
+
+# 상단 캐러셀에 표시할 팀 수 (순위표 상위)
+CAROUSEL_TEAM_COUNT = 10
+
+# 팀 순위 카드 템플릿 (모듈 로드 시 한 번만 컴파일하고, 렌더링 시 팀별 값만 치환)
+TEAM_CARD_TEMPLATE = string.Template(textwrap.dedent("""\
+    <div class="team-card" style="background: $color;">
+        <div class="card-header">
+            <div class="rank-badge">$rank_badge</div>
+            $logo
+        </div>
+        <div class="team-name">$name</div>
+        <div class="team-points">$pts pts</div>
+        <div class="team-stats">
+            W:$w D:$d L:$l<br>
+            GF:$gf GA:$ga
+        </div>
+    </div>
+"""))
+# 로고는 화면에 보이는 카드만 디코딩하도록 지연 로딩 (크기를 지정해 로딩 전후 레이아웃 이동 방지)
+TEAM_LOGO_TEMPLATE = string.Template(
+    '<img src="$src" class="team-logo" alt="$name" width="60" height="60" loading="lazy" decoding="async">'
+)
+TEAM_LOGO_PLACEHOLDER = '<div class="team-logo-placeholder">⚽</div>'
+RANK_BADGES = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+# 약점 보완 유망주 추천 조건
+PROSPECT_AGE_RANGE = (16, 23)
+PROSPECTS_PER_CATEGORY = 5
+
+# 유망주 분석을 위한 13가지 확장 지표 (컬럼 -> 표시 이름)
+FINAL_COLS_MAP = {
+    'Gls': '득점', 'Ast': '어시스트', 'G+A': '공격 포인트', 'G/SoT': '득점 효율',
+    'SoT/90': '슈팅 집중도', 'SCA90': '기회 창출력', 'Save%': '선방률',
+    'Tkl%': '태클 성공률', 'Cmp%': '패스 성공률','xGA': '허용 기대 득점', 'Int': '인터셉트', 'PrgDist': '드리블 전진 거리'
+}
+
+# 히트맵 상단 지표 이름 툴팁 (FINAL_COLS_MAP 순서)
+METRIC_DESCRIPTIONS = [
+    "[득점]<br>경기당 득점 수",
+    "[어시스트]<br>경기당 어시스트 수",
+    "[공격포인트]<br>경기당 득점과 어시스트의 합산",
+    "[득점효율]<br>G/SoT: G는 Goal의 약자, SoT는 Shot on Targer의 약자로, PK를 제외한 유효슈팅 대비 득점 효율을 나타내는 지표. 경기당 일정 유효슈팅 수를 채운 선수만 “Goals per shot on target” 팀 효율 순위에 반영됨(경기당 최소 0.111개의 유효슈팅을 기록해야 순위에 포함).<br><br>공격수 포지션 – 침착성, 골결정력 중요",
+    "[슈팅집중도]<br>90분 기준 유효슈팅 수를 의미. 팀 내에 30분 이상 출전한 선수들 기준으로 유효슈팅을 만들어낸 기록을 90분으로 환산한 지표. 단, 패널티킥 제외<br><br>공격수 포지션 – 기술, 오프더볼",
+    "[기회창출력]<br>경기당 팀이 얼마나 자주 공격을 ‘창출’하는지를 정량적으로 보여주는 지표로 슛으로 이어지기까지 공격 흐름을 실제로 움직인 행동 전체를 기록<br><br>미드필더 공격수 포지션 – 시야, 기술, 패스, 판단력, 활동량",
+    "[선방률]<br>상대의 유효슈팅 중 골로 이어지지 않은 비율(골키퍼가 막아낸 비율)로, 페널티킥은 제외되며 수비가 막은 슈팅은 세이브로 계산되지 않음.<br><br>골키퍼 포지션 – 반사신경, 민첩성",
+    "[태클성공률]<br>경기당 최소 0.625회 이상 상대팀 드리블러에 성공한 태클 횟수를 시도한 태클 횟수로 나눈 비율<br><br>수비수 – 태클, 예측력",
+    "[패스성공률]<br>경기당 30분 이상 출전한 선수 기준으로, 인플레이상황에서 각팀별 패스 성공률<br><br>미드필더 – 패스",
+    "[허용기대득점]<br>실점 기대값(상대가 만든 기대 득점)에 대한 설명으로 팀이 상대에게 허용한 슈팅의 ‘기대 실점값’을 계산한 것으로, 수치가 높을수록 수비에서의 압박이 약하다는 의미.<br><br>수비수 – 종합평가",
+    "[인터셉트]<br>상대방 패스를 읽고 가로챈 횟수<br><br>수비수 – 예측력, 포지셔닝<br>미드필더 – 판단력",
+    "[드리블전진거리]<br>패스 없이 드리블로 전방에 얼마나 많은 거리를 가져갔는지 나타내는 지표<br><br>공격수 – 드리블<br>미드필더 – 스태미나, 기술"
+]
 
 def get_theme_colors():
     """
@@ -41,11 +98,17 @@ def get_image_base64(file_path):
     """
     로컬 이미지 파일을 읽어서 HTML에서 바로 사용할 수 있는 Base64 문자열로 변환합니다.
     SVG, WebP, PNG 등 다양한 포맷을 지원합니다.
+    인코딩 결과는 (경로, 수정 시각)별로 캐싱되어 재실행 때마다 파일을 다시 읽지 않습니다.
     """
     if not os.path.exists(file_path):
         # 파일이 없으면 빈 문자열 반환 (또는 기본 이미지 경로 설정 가능)
         return ""
 
+    return _encode_image(file_path, os.stat(file_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _encode_image(file_path, mtime_ns):
     # 파일 확장자에 따른 MIME 타입 추론 (예: image/svg+xml, image/webp)
     mime_type, _ = mimetypes.guess_type(file_path)
     if not mime_type:
@@ -58,20 +121,150 @@ def get_image_base64(file_path):
     return f"data:{mime_type};base64,{encoded}"
 
 
+def render_team_cards(teams: pd.DataFrame) -> str:
+    """
+    순위표 DataFrame을 캐러셀 카드 HTML로 변환
+    배지/로고/이름 이스케이프는 컬럼 단위로 한 번에 계산하고, 컴파일된 템플릿으로 모든 팀을 한 번에 렌더링합니다.
+    """
+    if teams.empty:
+        return ""
+
+    names = teams['name'].astype(str).map(html.escape)
+    badges = teams['rank'].map(RANK_BADGES).fillna(teams['rank'].astype(str) + 'th')
+    sources = teams['logo'].fillna('').astype(str).map(get_image_base64)
+    logos = [
+        TEAM_LOGO_TEMPLATE.substitute(src=src, name=name) if src else TEAM_LOGO_PLACEHOLDER
+        for src, name in zip(sources, names)
+    ]
+
+    cards = teams[['pts', 'w', 'd', 'l', 'gf', 'ga']].assign(
+        color=teams['color'].astype(str).map(html.escape), rank_badge=badges, logo=logos, name=names
+    )
+    return ''.join(TEAM_CARD_TEMPLATE.substitute(card) for card in cards.to_dict('records'))
+
+
 def custom_min_max_scale(series):
     min_val = series.min()
     max_val = series.max()
     if max_val == min_val:
         return series
     return (series - min_val) / (max_val - min_val)
+
+
+def scale_team_stats(df_display: pd.DataFrame):
+    """13가지 확장 지표를 표시 대상 팀 기준으로 Min-Max 정규화 (xGA는 낮을수록 좋으므로 역방향)"""
+    numeric_cols = list(FINAL_COLS_MAP.keys())
+    df_scaled = df_display[['Squad'] + numeric_cols].copy()
+    df_scaled[numeric_cols] = df_scaled[numeric_cols].apply(custom_min_max_scale)
+    df_scaled['xGA'] = 1 - df_scaled['xGA'] # 🚨 허용 기대 득점(xGA): 낮을수록 좋음 (역방향)
+    return df_scaled
+
+
+def build_team_heatmap(df_scaled: pd.DataFrame, title: str, height: int):
+    """팀 × 지표 히트맵 (df_scaled: scale_team_stats 결과, 행 순서대로 표시)"""
+    teams = df_scaled['Squad'].tolist()
+    metrics = list(FINAL_COLS_MAP.values())
+
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        z=df_scaled[list(FINAL_COLS_MAP)].values,
+        x=metrics,
+        y=teams,
+        colorscale="RdBu",
+        xgap=2,
+        ygap=2,
+        hovertemplate="<b>%{y}</b><br>%{x}: %{z:.2f}<extra></extra>",
+        showscale=True
+    ))
+
+    # 지표 이름 툴팁 행
+    y_pos = len(teams) + 2
+    fig.add_trace(go.Scatter(
+        x=metrics,
+        y=[y_pos] * len(metrics),
+        mode="text",
+        text=metrics,
+        textfont=dict(size=13, color="white"),
+        hovertext=METRIC_DESCRIPTIONS,
+        hoverinfo="text",
+        showlegend=False,
+        line=dict(width=0, color='rgba(0,0,0,0)'),
+        hoverlabel=dict(
+            bgcolor="#1E2738",
+            bordercolor="#FFB300",
+            font=dict(size=14, color="white"),
+            align="left"
+        )
+    ))
+
+    fig.update_layout(
+        title=title,
+        height=height,
+        margin=dict(l=10, r=10, t=60, b=150),
+        xaxis=dict(
+            showticklabels=False,
+            showgrid=False,
+            zeroline=False,
+            fixedrange=True
+        ),
+        yaxis=dict(
+            autorange="reversed",
+            showticklabels=True,
+            tickvals=list(range(len(teams))),  # 0부터 9까지의 틱만 표시
+            ticktext=teams,
+            range=[len(teams) - 0.5, y_pos + 0.5]
+        ),
+    )
+    return fig
     
+# ---------------------------------------------------------
+# 강점/약점 기준 및 영입 카테고리별 지표
+# ---------------------------------------------------------
+STRENGTH_THRESHOLD = 0.75 # 상위 25%
+WEAKNESS_THRESHOLD = 0.25 # 하위 25%
+
+# 포지션 및 지표 매핑 (13가지 확장 지표)
+RECRUITMENT_METRICS = {
+    '공격수/피니셔': {
+        'Gls': ('득점력', '골 결정력'), 'G/SoT': ('슈팅 효율', '슈팅 정확도')
+    },
+    '플레이메이커/윙어': {
+        'Ast': ('어시스트 능력', '어시스트 부족'), 'SCA90': ('기회 창출력', '기회 창출 부족'), 'G+A': ('공격 포인트 생산성', '공격 포인트 부족')
+    },
+    '미드필더/빌드업': {
+        'Cmp%': ('패스 성공률', '패스 정확도'), 'PrgDist': ('공격 전개 깊이', '수직 패스 부족'), 
+    },
+    '볼 위닝/수비수': {
+        'Tkl%': ('태클 성공률', '태클 실패율'), 'Int': ('수비 공간 인지력', '인터셉트 부족'),
+    },
+    '수비 조직력/CB': {
+        'xGA': ('수비 구조 안정성', '허용 기대 득점'), # NOTE: xGA는 역방향 처리되어 df_scaled에서 높은 값이 좋음
+    },
+    '골키퍼': {
+        'Save%': ('선방률', '선방 부족')
+    },
+    '공격 볼륨': { # 공격 전반의 볼륨 측정
+         'SoT/90': ('슈팅 집중도', '슈팅 볼륨 부족'),
+    }
+}
+
+
+def get_recruitment_categories(team_data_scaled: pd.Series):
+    """정규화된 팀 지표에서 하위 25% 지표가 있는 영입 카테고리 목록 반환"""
+    return [
+        category for category, metrics in RECRUITMENT_METRICS.items()
+        if any(team_data_scaled[col] <= WEAKNESS_THRESHOLD for col in metrics)
+    ]
+
 # ---------------------------------------------------------
 # 분석 함수: 선택된 팀의 강점/약점을 분석하여 문구 생성
 # ---------------------------------------------------------
-def analyze_team_performance(team_name: str, df_scaled: pd.DataFrame, df_raw: pd.DataFrame):
+def analyze_team_performance(team_name: str, df_scaled: pd.DataFrame, df_raw: pd.DataFrame,
+                             team_trend: pd.DataFrame = None):
     """
     선택된 팀의 총 득점 순위(Gls_Rank)를 기준으로 상위권/중위권/하위권을 판단하고, 
     13가지 확장 지표를 분석하여 포지션별 강점/약점 및 영입 포지션 제안 문구를 반환합니다.
+    team_trend(TeamTrends.team_trend 결과)가 주어지면 전 시즌 대비 개선/하락 지표 문구를 추가합니다.
     """
     
     # 1. 득점 순위(Rank) 부여 및 데이터 준비
@@ -93,42 +286,13 @@ def analyze_team_performance(team_name: str, df_scaled: pd.DataFrame, df_raw: pd
         rank_tier = "하위권"
         
     # 3. 상세 강점/약점 분석 및 포지션 매칭
-    STRENGTH_THRESHOLD = 0.75 # 상위 25%
-    WEAKNESS_THRESHOLD = 0.25 # 하위 25%
-
     all_strengths = []
     all_weaknesses = []
-    recruitment_recommendations = set() # 중복 방지를 위해 set 사용
-
-    # 포지션 및 지표 매핑 (13가지 확장 지표)
-    RECRUITMENT_METRICS = {
-        '공격수/피니셔': {
-            'Gls': ('득점력', '골 결정력'), 'G/SoT': ('슈팅 효율', '슈팅 정확도')
-        },
-        '플레이메이커/윙어': {
-            'Ast': ('어시스트 능력', '어시스트 부족'), 'SCA90': ('기회 창출력', '기회 창출 부족'), 'G+A': ('공격 포인트 생산성', '공격 포인트 부족')
-        },
-        '미드필더/빌드업': {
-            'Cmp%': ('패스 성공률', '패스 정확도'), 'PrgDist': ('공격 전개 깊이', '수직 패스 부족'), 
-        },
-        '볼 위닝/수비수': {
-            'Tkl%': ('태클 성공률', '태클 실패율'), 'Int': ('수비 공간 인지력', '인터셉트 부족'),
-        },
-        '수비 조직력/CB': {
-            'xGA': ('수비 구조 안정성', '허용 기대 득점'), # NOTE: xGA는 역방향 처리되어 df_scaled에서 높은 값이 좋음
-        },
-        '골키퍼': {
-            'Save%': ('선방률', '선방 부족')
-        },
-        '공격 볼륨': { # 공격 전반의 볼륨 측정
-             'SoT/90': ('슈팅 집중도', '슈팅 볼륨 부족'),
-        }
-    }
+    # 약점이 발견된 카테고리에 대해 포지션 추천 목록 (중복 방지를 위해 set 사용)
+    recruitment_recommendations = set(get_recruitment_categories(team_data_scaled))
 
     # 5가지 카테고리별로 반복하며 강점/약점 분석
     for category, metrics in RECRUITMENT_METRICS.items():
-        category_has_weakness = False
-        
         for col, (good_name, bad_name) in metrics.items():
             score = team_data_scaled[col]
             raw_value = team_data_raw[col]
@@ -140,11 +304,6 @@ def analyze_team_performance(team_name: str, df_scaled: pd.DataFrame, df_raw: pd
             # ⬇️ 약점 (파란색, 하위 25%)
             elif score <= WEAKNESS_THRESHOLD:
                 all_weaknesses.append(f"**{bad_name}** ({raw_value:.1f})")
-                category_has_weakness = True
-                
-        # 약점이 발견된 카테고리에 대해 포지션 추천 목록에 추가
-        if category_has_weakness:
-            recruitment_recommendations.add(category) # 중복 방지
 
     # 6. 최종 메시지 조합
     
@@ -176,6 +335,23 @@ def analyze_team_performance(team_name: str, df_scaled: pd.DataFrame, df_raw: pd
         f"{weakness_msg_detail}\n\n"
         f"{recommendation_msg}"
     )
+
+    # 전 시즌 대비 추세 문구
+    if team_trend is not None:
+        comparable = team_trend.dropna(subset=['trend'])
+        if comparable.empty:
+            trend_msg = "📈 **전 시즌 대비 변화:** 비교할 이전 시즌 데이터가 없습니다."
+        else:
+            improved = [f"**{FINAL_COLS_MAP.get(col, col)}** ({row['previous']:.2f} → {row['value']:.2f})"
+                        for col, row in comparable[comparable['trend'] > 0].iterrows()]
+            declined = [f"**{FINAL_COLS_MAP.get(col, col)}** ({row['previous']:.2f} → {row['value']:.2f})"
+                        for col, row in comparable[comparable['trend'] < 0].iterrows()]
+            trend_msg = (
+                "📈 **전 시즌 대비 변화 (리그 내 상대 위치 기준):**\n"
+                f" - 개선: {', '.join(improved) if improved else '두드러진 개선 지표가 없습니다.'}\n"
+                f" - 하락: {', '.join(declined) if declined else '두드러진 하락 지표가 없습니다.'}"
+            )
+        message += f"\n\n{trend_msg}"
     
     return message, rank_tier
 
@@ -185,84 +361,38 @@ def show_page():
     st.markdown("---")
 
     # ---------------------------------------------------------
-    # 1. 상단 팀 순위 카드 (가로 스크롤 캐러셀 UI)
+    # 0. 시즌 선택 (레지스트리가 처음 접근 시 로드하여 캐싱)
     # ---------------------------------------------------------
+    registry = get_registry()
+    seasons = registry.team_seasons()
+    if not seasons:
+        st.error(f"오류: '{registry.data_dir}' 폴더에서 팀 지표 파일(예: epl_2024_2025_full_stats.csv)을 찾을 수 없습니다.")
+        return
 
-    bg_color, text_color = get_theme_colors()
+    season_key = st.selectbox(
+        "📅 시즌 선택",
+        options=seasons,
+        format_func=lambda key: key.label
+    ) if len(seasons) > 1 else seasons[0]
 
-    # [데이터 준비]
-    # 확장자가 섞여 있어도 상관없습니다. 실제 파일명과 경로만 정확하면 됩니다.
-    team_rankings = [
-        {"rank": 1, "name": "Liverpool", "w": 25, "d": 9,  "l": 4,  "pts": 84, "gf": 86, "ga": 41,
-        "color": "linear-gradient(135deg, #f093fb 0%, #f5576c 100%)", "logo": "assets/logos/Liverpool_FC_logo.svg"},
-        {"rank": 2, "name": "Arsenal", "w": 20, "d": 14, "l": 4,  "pts": 74, "gf": 69, "ga": 34,
-        "color": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)", "logo": "assets/logos/Arsenal_FC_logo.svg"},
-        {"rank": 3, "name": "Manchester City", "w": 21, "d": 8,  "l": 9,  "pts": 71, "gf": 72, "ga": 44,
-        "color": "linear-gradient(135deg, #30cfd0 0%, #330867 100%)", "logo": "assets/logos/Manchester_City_2016.svg"},
-        {"rank": 4, "name": "Chelsea", "w": 20, "d": 9,  "l": 9,  "pts": 69, "gf": 64, "ga": 43,
-        "color": "linear-gradient(135deg, #209cff 0%, #68e0cf 100%)", "logo": "assets/logos/Chelsea_FC_logo.svg"},
-        {"rank": 5, "name": "Newcastle Utd", "w": 20, "d": 6,  "l": 12, "pts": 66, "gf": 68, "ga": 47,
-        "color": "linear-gradient(135deg, #a18cd1 0%, #fbc2eb 100%)", "logo": "assets/logos/Newcastle_United_FC_logo.svg"},
-        {"rank": 6, "name": "Aston Villa", "w": 19, "d": 9,  "l": 10, "pts": 66, "gf": 58, "ga": 51,
-        "color": "linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)", "logo": "assets/logos/Aston_Villa_FC_2015.webp"},
-        {"rank": 7, "name": "Nottingham Forest", "w": 19, "d": 8,  "l": 11, "pts": 65, "gf": 58, "ga": 46,
-        "color": "linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)", "logo": "assets/logos/Nottingham_Forest_FC_logo_(red,_two_stars_below).webp"},
-        {"rank": 8, "name": "Brighton", "w": 16, "d": 13, "l": 9,  "pts": 61, "gf": 66, "ga": 59,
-        "color": "linear-gradient(135deg, #89f7fe 0%, #66a6ff 100%)", "logo": "assets/logos/Brighton_&_Hove_Albion_FC_logo.svg"},
-        {"rank": 9, "name": "Bournemouth", "w": 15, "d": 11, "l": 12, "pts": 56, "gf": 58, "ga": 46,
-        "color": "linear-gradient(135deg, #fa709a 0%, #fee140 100%)", "logo": "assets/logos/AFC_Bournemouth_logo_(introduced_2013).svg"},
-        {"rank": 10, "name": "Brentford", "w": 16, "d": 8,  "l": 14, "pts": 56, "gf": 66, "ga": 57,
-        "color": "linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%)", "logo": "assets/logos/Brentford_FC_2017.webp"},
-        # {"rank": 11, "name": "Fulham", "w": 15, "d": 9,  "l": 14, "pts": 54, "gf": 54, "ga": 54,
-        #  "color": "linear-gradient(135deg, #f6d365 0%, #fda085 100%)", "logo": "assets/logos/Fulham_FC_logo.svg"},
-        # {"rank": 12, "name": "Crystal Palace", "w": 13, "d": 14, "l": 11, "pts": 53, "gf": 51, "ga": 51,
-        #  "color": "linear-gradient(135deg, #cfd9df 0%, #e2ebf0 100%)", "logo": "assets/logos/Crystal_Palace_FC_logo.svg"},
-        # {"rank": 13, "name": "Everton", "w": 11, "d": 15, "l": 12, "pts": 48, "gf": 42, "ga": 44,
-        #  "color": "linear-gradient(135deg, #74ebd5 0%, #9face6 100%)", "logo": "assets/logos/Everton_FC_logo.svg"},
-        # {"rank": 14, "name": "West Ham", "w": 11, "d": 10, "l": 17, "pts": 43, "gf": 46, "ga": 62,
-        #  "color": "linear-gradient(135deg, #fbc2eb 0%, #a6c1ee 100%)", "logo": "assets/logos/West_Ham_United_FC_logo.svg"},
-        # {"rank": 15, "name": "Manchester Utd", "w": 11, "d": 9,  "l": 18, "pts": 42, "gf": 44, "ga": 54,
-        #  "color": "linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)", "logo": "assets/logos/Manchester_United_FC_logo.svg"},
-        # {"rank": 16, "name": "Wolves", "w": 12, "d": 6,  "l": 20, "pts": 42, "gf": 54, "ga": 69,
-        #  "color": "linear-gradient(135deg, #fdcbf1 0%, #cfd9df 100%)", "logo": "assets/logos/Wolverhampton_Wanderers_FC_logo.svg"},
-        # {"rank": 17, "name": "Tottenham", "w": 11, "d": 5,  "l": 22, "pts": 38, "gf": 64, "ga": 65,
-        #  "color": "linear-gradient(135deg, #a1c4fd 0%, #c2e9fb 100%)", "logo": "assets/logos/Tottenham_Hotspur_FC_logo.svg"},
-        # {"rank": 18, "name": "Leicester City", "w": 6,  "d": 7,  "l": 25, "pts": 25, "gf": 33, "ga": 80,
-        #  "color": "linear-gradient(135deg, #f6d365 0%, #fda085 100%)", "logo": "assets/logos/Leicester_City_FC_logo.svg"},
-        # {"rank": 19, "name": "Ipswich Town", "w": 4,  "d": 10, "l": 24, "pts": 22, "gf": 36, "ga": 82,
-        #  "color": "linear-gradient(135deg, #89f7fe 0%, #66a6ff 100%)", "logo": "assets/logos/Ipswich_Town_FC_logo.svg"},
-        # {"rank": 20, "name": "Southampton", "w": 2,  "d": 6,  "l": 30, "pts": 12, "gf": 26, "ga": 86,
-        #  "color": "linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%)", "logo": "assets/logos/Southampton_FC_logo.svg"},
-    ]
+    standings = registry.load_standings(season_key)
 
-    # [HTML 생성]
-    cards_html = ""
-    for team in team_rankings:
-        rank_badge = "🥇" if team['rank'] == 1 else "🥈" if team['rank'] == 2 else "🥉" if team[
-                                                                                            'rank'] == 3 else f"{team['rank']}th"
+    # ---------------------------------------------------------
+    # 1. 상단 팀 순위 카드 (가로 스크롤 캐러셀 UI)
+    # ---------------------------------------------------------
 
-        # [핵심] 로컬 이미지를 Base64로 변환하여 HTML에 주입
-        # 파일이 존재하지 않으면 깨진 이미지 아이콘 대신 빈 공간이 나오도록 처리됨
-        img_src = get_image_base64(team['logo'])
+    bg_color, text_color = get_theme_colors()
 
-        # 이미지가 있으면 img 태그 사용, 없으면 빈 div (또는 대체 텍스트)
-        img_tag = f'<img src="{img_src}" class="team-logo" alt="{team["name"]}">' if img_src else f'<div class="team-logo-placeholder">⚽</div>'
+    # [데이터 준비] 시즌 순위표 파일 (예: epl_2024_2025_standings.csv)
+    if standings is not None:
+        teams = standings.head(CAROUSEL_TEAM_COUNT)
+    else:
+        teams = pd.DataFrame()
+        st.info(f"ℹ️ {season_key.label} 시즌 순위표 파일이 없어 팀 순위 카드를 생략합니다.")
 
-        card_snippet = f"""
-        <div class="team-card" style="background: {team['color']};">
-            <div class="card-header">
-                <div class="rank-badge">{rank_badge}</div>
-                {img_tag}
-            </div>
-            <div class="team-name">{team['name']}</div>
-            <div class="team-points">{team['pts']} pts</div>
-            <div class="team-stats">
-                W:{team['w']} D:{team['d']} L:{team['l']}<br>
-                GF:{team['gf']} GA:{team['ga']}
-            </div>
-        </div>
-        """
-        cards_html += textwrap.dedent(card_snippet)
+    # [HTML 생성] 컴파일된 카드 템플릿으로 모든 팀을 한 번에 렌더링 (로고는 Base64 캐시 사용)
+    with timed('league_overview.carousel_cards'):
+        cards_html = render_team_cards(teams)
 
     # [HTML/CSS]
     html_content = f"""
@@ -436,27 +566,30 @@ def show_page():
     </html>
     """
 
-    components.html(textwrap.dedent(html_content), height=400)
+    with timed('league_overview.carousel_html'):
+        components.html(textwrap.dedent(html_content), height=400)
 
     st.markdown("---")
     # ---------------------------------------------------------
     # 2. 팀별 지표 히트맵 (CSV 파일 사용)
     # ---------------------------------------------------------
-    team_order_list = ['Liverpool', 'Arsenal', 'Man City', 'Chelsea', 'Newcastle Utd', 
-    'Aston Villa', 'Nott\'ham Forest',  'Brighton','Bournemouth',  'Brentford',
-    'Fulham','Crystal Palace','Everton', 'West Ham', 'Man Utd', 
-    'Wolves','Tottenham', 'Leicester City', 'Ipswich Town', 'Southampton']
-    
     # --- 데이터 로딩 ---
     try:
-        df_raw = pd.read_csv(CSV_FILE)
+        with timed('league_overview.load_data'):
+            df_raw = registry.load_team_stats(season_key).copy()
     except FileNotFoundError:
-        st.error(f"오류: 데이터 파일 '{CSV_FILE}'을(를) 찾을 수 없습니다. 파일을 확인해주세요.")
+        st.error(f"오류: 데이터 파일 '{registry.team_stats_files[season_key]}'을(를) 찾을 수 없습니다. 파일을 확인해주세요.")
         return
     except Exception as e:
         st.error(f"데이터 로딩 중 오류 발생: {e}")
         return
 
+    # 히트맵 팀 순서: 순위표 순서 (순위표가 없으면 팀명 순)
+    if standings is not None:
+        team_order_list = standings['squad'].tolist()
+    else:
+        team_order_list = sorted(df_raw['Squad'].unique())
+
     # --- 필터링 로직 ---
     st.subheader("필터 설정")
     df_raw['Squad'] = pd.Categorical(df_raw['Squad'], categories=team_order_list, ordered=True)
@@ -480,26 +613,9 @@ def show_page():
 
 
     # --- 데이터 전처리 및 정규화 (13가지 확장 지표) ---
-    # 유망주 분석을 위한 13가지 확장 지표 정의
-    final_cols_map = {
-        'Gls': '득점', 'Ast': '어시스트', 'G+A': '공격 포인트', 'G/SoT': '득점 효율',
-        'SoT/90': '슈팅 집중도', 'SCA90': '기회 창출력', 'Save%': '선방률',
-        'Tkl%': '태클 성공률', 'Cmp%': '패스 성공률','xGA': '허용 기대 득점', 'Int': '인터셉트',        'PrgDist': '드리블 전진 거리'
-    }
-
-    numeric_cols = list(final_cols_map.keys())
-    df_data = df_display[['Squad'] + numeric_cols].copy()
-
-    # 1. Min-Max 정규화 적용
-    df_scaled = df_data.copy()
-    df_scaled[numeric_cols] = df_data[numeric_cols].apply(custom_min_max_scale)
-
-    # 2. 역방향 처리 (수비 지표는 낮을수록 좋음)
-    df_scaled['xGA'] = 1 - df_scaled['xGA'] # 🚨 허용 기대 득점(xGA): 낮을수록 좋음 (역방향)
+    df_scaled = scale_team_stats(df_display)
 
     teams = df_scaled['Squad'].tolist()
-    metrics = list(final_cols_map.values())
-    data_for_heatmap = df_scaled[numeric_cols].values
 
 
     # 2-1. 팀 선택 위젯 추가
@@ -513,77 +629,59 @@ def show_page():
     st.subheader("📊 팀별 세부 지표 분석 (Heatmap)")
     st.info("💡 붉은색이 진할수록 해당 지표에서 리그 상위권임을 의미합니다. 푸른색은 약점을 나타냅니다.")
 
-    fig = go.Figure()
-    fig.add_trace(go.Heatmap(
-        z=data_for_heatmap,
-        x=metrics,
-        y=teams,
-        colorscale="RdBu",
-        xgap=2,
-        ygap=2,
-        hovertemplate="<b>%{y}</b><br>%{x}: %{z:.2f}<extra></extra>",
-        showscale=True
-    ))
-
-    # Tooltip 추가
-    metric_desc = [
-        "[득점]<br>경기당 득점 수",
-        "[어시스트]<br>경기당 어시스트 수",
-        "[공격포인트]<br>경기당 득점과 어시스트의 합산",
-        "[득점효율]<br>G/SoT: G는 Goal의 약자, SoT는 Shot on Targer의 약자로, PK를 제외한 유효슈팅 대비 득점 효율을 나타내는 지표. 경기당 일정 유효슈팅 수를 채운 선수만 “Goals per shot on target” 팀 효율 순위에 반영됨(경기당 최소 0.111개의 유효슈팅을 기록해야 순위에 포함).<br><br>공격수 포지션 – 침착성, 골결정력 중요",
-        "[슈팅집중도]<br>90분 기준 유효슈팅 수를 의미. 팀 내에 30분 이상 출전한 선수들 기준으로 유효슈팅을 만들어낸 기록을 90분으로 환산한 지표. 단, 패널티킥 제외<br><br>공격수 포지션 – 기술, 오프더볼",
-        "[기회창출력]<br>경기당 팀이 얼마나 자주 공격을 ‘창출’하는지를 정량적으로 보여주는 지표로 슛으로 이어지기까지 공격 흐름을 실제로 움직인 행동 전체를 기록<br><br>미드필더 공격수 포지션 – 시야, 기술, 패스, 판단력, 활동량",
-        "[선방률]<br>상대의 유효슈팅 중 골로 이어지지 않은 비율(골키퍼가 막아낸 비율)로, 페널티킥은 제외되며 수비가 막은 슈팅은 세이브로 계산되지 않음.<br><br>골키퍼 포지션 – 반사신경, 민첩성",
-        "[태클성공률]<br>경기당 최소 0.625회 이상 상대팀 드리블러에 성공한 태클 횟수를 시도한 태클 횟수로 나눈 비율<br><br>수비수 – 태클, 예측력",
-        "[패스성공률]<br>경기당 30분 이상 출전한 선수 기준으로, 인플레이상황에서 각팀별 패스 성공률<br><br>미드필더 – 패스",
-        "[허용기대득점]<br>실점 기대값(상대가 만든 기대 득점)에 대한 설명으로 팀이 상대에게 허용한 슈팅의 ‘기대 실점값’을 계산한 것으로, 수치가 높을수록 수비에서의 압박이 약하다는 의미.<br><br>수비수 – 종합평가",
-        "[인터셉트]<br>상대방 패스를 읽고 가로챈 횟수<br><br>수비수 – 예측력, 포지셔닝<br>미드필더 – 판단력",
-        "[드리블전진거리]<br>패스 없이 드리블로 전방에 얼마나 많은 거리를 가져갔는지 나타내는 지표<br><br>공격수 – 드리블<br>미드필더 – 스태미나, 기술"
-    ]
-
-    y_pos = len(teams) + 2
-    fig.add_trace(go.Scatter(
-        x=metrics,
-        y=[y_pos] * len(metrics),
-        mode="text",
-        text=metrics,
-        textfont=dict(size=13, color="white"),
-        hovertext=metric_desc,
-        hoverinfo="text",
-        showlegend=False,
-        line=dict(width=0, color='rgba(0,0,0,0)'),
-        hoverlabel=dict(
-            bgcolor="#1E2738",
-            bordercolor="#FFB300",
-            font=dict(size=14, color="white"),
-            align="left"
-        )
-    ))
-
-    fig.update_layout(
-        title=f'EPL {filter_option} 퍼포먼스 비교 (2024-2025 시즌)',
-        height=map_height,
-        margin=dict(l=10, r=10, t=60, b=150),
-        xaxis=dict(
-            showticklabels=False,
-            showgrid=False,
-            zeroline=False,
-            fixedrange=True
-        ),
-        yaxis=dict(
-            autorange="reversed",
-            showticklabels=True,
-            tickvals=list(range(len(teams))),  # 0부터 9까지의 틱만 표시
-            ticktext=teams,
-            range=[len(teams) - 0.5, y_pos + 0.5]
-        ),
+    fig = build_team_heatmap(
+        df_scaled,
+        title=f'{season_key.league.upper()} {filter_option} 퍼포먼스 비교 ({season_key.season} 시즌)',
+        height=map_height
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    with timed('league_overview.heatmap_chart'):
+        st.plotly_chart(compact_figure(fig), use_container_width=True)
 
     # ---------------------------------------------------------
     # 3. 분석 결과 (선택된 팀 기반 동적 생성)
     # ---------------------------------------------------------
     st.subheader(f"✨ **{selected_team}** 팀 상세 분석 결과")
-    analysis_message, analysis_status = analyze_team_performance(selected_team, df_scaled, df_raw)
-    st.markdown(analysis_message)
\ No newline at end of file
+    with timed('league_overview.team_analysis'):
+        team_trends = registry.load_team_trends(season_key.league)
+        team_trend = team_trends.team_trend(selected_team, season_key)
+        analysis_message, analysis_status = analyze_team_performance(selected_team, df_scaled, df_raw, team_trend)
+    st.markdown(analysis_message)
+
+    # 시즌별 추세 상세 (이동 평균 / 리그 내 z-score)
+    if len(team_trends.seasons) > 1:
+        with st.expander(f"📈 {selected_team} 지표 추세 상세 (최근 {team_trends.window}시즌)"):
+            trend_table = team_trend[['value', 'previous', 'delta', 'rolling', 'zscore']].copy()
+            trend_table.index = [FINAL_COLS_MAP.get(col, col) for col in trend_table.index]
+            trend_table.columns = ['이번 시즌', '지난 시즌', '변화량', f'{team_trends.window}시즌 평균', '리그 내 z-score']
+            st.dataframe(trend_table.round(2), use_container_width=True)
+
+    # ---------------------------------------------------------
+    # 4. 약점 보완 유망주 추천 (선수 데이터셋 기반)
+    # ---------------------------------------------------------
+    team_data_scaled = df_scaled[df_scaled['Squad'] == selected_team].iloc[0]
+    weak_categories = get_recruitment_categories(team_data_scaled)
+    player_datasets = registry.player_datasets()
+
+    if weak_categories and player_datasets:
+        st.subheader(f"🔭 {selected_team} 약점 보완 유망주 추천")
+        st.caption(
+            f"영입 카테고리별 핵심 능력치 가중 평균 기준 상위 {PROSPECTS_PER_CATEGORY}명 "
+            f"({PROSPECT_AGE_RANGE[0]}-{PROSPECT_AGE_RANGE[1]}세)"
+        )
+        dataset_name = 'dataset_new' if 'dataset_new' in player_datasets else player_datasets[0]
+
+        with st.spinner('선수 데이터를 불러오는 중입니다...'), timed('league_overview.recruitment_shortlist'):
+            matcher = registry.load_recruitment_matcher(dataset_name)
+            shortlist = matcher.shortlist_for_team(
+                (season_key, selected_team), weak_categories,
+                k=PROSPECTS_PER_CATEGORY, age_range=PROSPECT_AGE_RANGE
+            )
+
+        prospect_cols = st.columns(min(len(shortlist), 3)) if shortlist else []
+        for idx, (category, prospects) in enumerate(shortlist.items()):
+            with prospect_cols[idx % len(prospect_cols)]:
+                st.markdown(f"**{category}**")
+                prospects_df = prospects[['Name', 'Age', 'Position_Category', 'Match_Score']].copy()
+                prospects_df.columns = ['이름', '나이', '포지션', '매칭 점수']
+                st.dataframe(prospects_df.round(2), use_container_width=True, hide_index=True)
\ No newline at end of file
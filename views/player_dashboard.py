@@ -1,23 +1,55 @@
+import os
+
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from data_processor import FootballDataProcessor
 from streamlit_plotly_events import plotly_events
+from export_pipeline import available_formats, export_key, export_manager, ranking_positions
+from figure_cache import cached_figure
+from figure_payload import compact_figure
+from filter_engine import IncrementalFilter, select_top
+from instrumentation import timed
+from query_cache import normalize_filter_key, query_cache
+from score_normalization import ScoreNormalizer
+from profile_prefetch import COMPARE_COLUMNS, ProfilePrefetchCache, build_profile_snapshot
+from views.datasets import get_registry
+
+# 5대 분류 표시 이름
+PROFILE_LABELS = {
+    'Attacking': '⚔️ 공격',
+    'Defending': '🛡️ 수비',
+    'Technical': '⚙️ 기술',
+    'Mental': '🧠 정신',
+    'Physical': '💪 신체'
+}
 
 def show_page():
-    # 캐싱을 통한 데이터 로드 최적화
-    @st.cache_data
-    def load_data():
-        """데이터 로드 및 처리 (캐싱)"""
-        processor = FootballDataProcessor('dataset_new.csv')
-        df = processor.process_all()
-        return df, processor
+    # 데이터셋 선택 (레지스트리가 처음 접근 시 로드/처리하여 캐싱)
+    registry = get_registry()
+    dataset_names = registry.player_datasets()
+    if not dataset_names:
+        st.error(f"오류: '{registry.data_dir}' 폴더에서 선수 데이터 파일(dataset_new.csv 등)을 찾을 수 없습니다.")
+        return
+
+    if len(dataset_names) > 1:
+        selected_dataset = st.sidebar.selectbox(
+            "📂 선수 데이터셋",
+            options=dataset_names,
+            index=dataset_names.index('dataset_new') if 'dataset_new' in dataset_names else 0
+        )
+    else:
+        selected_dataset = dataset_names[0]
 
     # 데이터 로드
-    with st.spinner('데이터를 로딩 중입니다...'):
-        df, processor = load_data()
+    with st.spinner('데이터를 로딩 중입니다...'), timed('player_dashboard.load_data'):
+        df, processor = registry.load_players(selected_dataset)
+        dataset_version = registry.dataset_version(selected_dataset)
+        # 슬라이더 범위/포지션별 선수 수/능력치 분포 (데이터셋 버전별 1회 계산)
+        metadata = registry.load_metadata(selected_dataset)
+        # 선수 이름 검색 색인 (데이터셋 버전별 1회 생성)
+        name_index = registry.load_name_index(selected_dataset)
 
     # 타이틀
     st.title("⚽ 선수 탐색 대시보드")
@@ -39,8 +71,8 @@ def show_page():
     # 나이 범위 필터
     age_min, age_max = st.sidebar.slider(
         "📅 나이 범위",
-        min_value=int(df['Age'].min()),
-        max_value=int(df['Age'].max()),
+        min_value=metadata.age_min,
+        max_value=metadata.age_max,
         value=(18, 25),
         help="선수를 찾기 위한 나이 범위를 선택하세요"
     )
@@ -110,6 +142,12 @@ def show_page():
         }
     }
 
+    # 레이더 차트에 사용될 수 있는 능력치 (포지션별 핵심 스텟 + 포지션 미지정 시 기본값)
+    radar_stat_columns = list(dict.fromkeys(
+        [stat for stats in position_key_stats.values() for stat in stats] +
+        ['Finishing', 'Dribbling', 'Passing', 'Tackling', 'Pace', 'Stamina']
+    ))
+
     # 포지션에 따른 동적 필터 생성
     stat_filters = {}
 
@@ -141,6 +179,26 @@ def show_page():
                 help=stat_info['help']
             )
 
+    # 5대 분류 프로필 점수 필터 및 정렬 기준 (process_all에서 미리 계산된 Profile_* 컬럼)
+    profile_filters = {}
+    with st.sidebar.expander("🧭 5대 분류 필터 / 정렬"):
+        for category, column in processor.PROFILE_COLUMNS.items():
+            profile_filters[column] = st.slider(
+                f"{PROFILE_LABELS[category]} 최소 점수",
+                min_value=0.0,
+                max_value=20.0,
+                value=0.0,
+                step=0.5,
+                key=f"profile_filter_{category}"
+            )
+
+        profile_sort = st.selectbox(
+            "↕️ 순위 정렬 기준",
+            options=['Default'] + list(processor.PROFILE_COLUMNS),
+            format_func=lambda c: "기본 (유망주/필터 점수)" if c == 'Default' else PROFILE_LABELS[c],
+            help="5대 분류 중 하나를 선택하면 해당 분류 점수로 순위를 매깁니다"
+        )
+
     st.sidebar.markdown("---")
 
     # 표시할 상위 유망주 수
@@ -159,11 +217,22 @@ def show_page():
     active_filters = []
     if selected_position != 'All':
         active_filters.append(f"포지션: {selected_position}")
-    if age_min != int(df['Age'].min()) or age_max != int(df['Age'].max()):
+    if age_min != metadata.age_min or age_max != metadata.age_max:
         active_filters.append(f"나이: {age_min}-{age_max}세")
+
+    def describe_threshold(label, column, value):
+        # 능력치 분포 히스토그램으로 해당 기준을 통과하는 전체 선수 비율 표시
+        passing = metadata.count_at_least(column, value)
+        if passing is None or metadata.total_rows == 0:
+            return f"{label} ≥ {value}"
+        return f"{label} ≥ {value} (전체의 {passing / metadata.total_rows * 100:.1f}%)"
+
     for stat, val in stat_filters.items():
         if val > 0:
-            active_filters.append(f"{stat} ≥ {val}")
+            active_filters.append(describe_threshold(stat, stat, val))
+    for category, column in processor.PROFILE_COLUMNS.items():
+        if profile_filters[column] > 0:
+            active_filters.append(describe_threshold(category, column, profile_filters[column]))
 
     if active_filters:
         st.sidebar.success(f"✅ **적용된 필터**: {len(active_filters)}개")
@@ -179,33 +248,42 @@ def show_page():
     )
 
     # 데이터 필터링
-    df_filtered = df.copy()
-
-    # 나이 필터 적용
-    df_filtered = df_filtered[
-        (df_filtered['Age'] >= age_min) &
-        (df_filtered['Age'] <= age_max)
-        ]
-
-    # 포지션 필터 적용
-    if selected_position != 'All':
-        df_filtered = df_filtered[df_filtered['Position_Category'] == selected_position]
-
-    # 능력치 필터 적용 (포지션별 스텟 필터)
-    for stat_name, min_value in stat_filters.items():
-        if min_value > 0:  # 0보다 큰 값만 필터로 적용
-            if stat_name in df_filtered.columns:
-                df_filtered = df_filtered[df_filtered[stat_name] >= min_value]
+    with timed('player_dashboard.filter_chain'):
+        if df is None:
+            # SQLite 데이터셋: 조건을 WHERE 절로 넘겨 조건에 맞는 선수 행만 읽음
+            df_filtered = processor.filter_players(
+                (age_min, age_max), selected_position, {**stat_filters, **profile_filters}
+            )
+            top_talents = select_top(df_filtered, top_n_display)
+        else:
+            # 다른 세션이 같은 조건을 조회했으면 프로세스 공유 캐시의 행 위치를 그대로 사용
+            filter_key = normalize_filter_key(
+                selected_position, (age_min, age_max), {**stat_filters, **profile_filters}, top_n_display
+            )
+            cached = query_cache.get(selected_dataset, dataset_version, filter_key)
+            if cached is not None:
+                positions, top_positions = cached
+                df_filtered = df.iloc[positions]
+                top_talents = df.iloc[top_positions]
+            else:
+                # 세션별 증분 필터: 슬라이더 하나만 바뀌면 직전 결과/중간 결과에서 이어서 계산
+                if 'incremental_filter' not in st.session_state:
+                    st.session_state.incremental_filter = IncrementalFilter()
+                positions = st.session_state.incremental_filter.apply_positions(
+                    df, (age_min, age_max), selected_position, {**stat_filters, **profile_filters}
+                )
+                df_filtered = df.iloc[positions]
 
-    # 상위 유망주 추출
-    top_talents = df_filtered.nlargest(top_n_display, 'Talent_Score_Normalized')
+                # 상위 유망주 추출
+                top_talents = select_top(df_filtered, top_n_display)
+                top_positions = positions[df_filtered.index.get_indexer(top_talents.index)]
+                query_cache.put(selected_dataset, dataset_version, filter_key, positions, top_positions)
 
     # 메트릭 표시
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
-        original_count = len(df) if selected_position == 'All' else len(
-            df[df['Position_Category'] == selected_position])
+        original_count = metadata.position_count(selected_position)
         filter_ratio = (len(df_filtered) / original_count * 100) if original_count > 0 else 0
         st.metric(
             "필터링된 선수 수",
@@ -261,1020 +339,951 @@ def show_page():
 
     st.markdown("---")
 
-    # 탭 구성
-    tab1, tab4 = st.tabs([
-        "🎯 선수 발굴 (Scatter)",
-        # "📊 선수 비교 (Parallel)",
-        # "🏆 상위 유망주",
-        "👤 선수 프로필"
-    ])
-
-    # 탭 1: 선수 발굴 (Scatter Plot)
-    with tab1:
-        if len(df_filtered) == 0:
-            st.warning("⚠️ 필터 조건에 맞는 선수가 없습니다. 필터를 조정해주세요.")
-        else:
-            st.header("🎯 선수 발굴 - 차트에서 클릭하여 분석")
-
-            # 세션 스테이트 초기화 (선수 선택 저장용)
-            if 'clicked_players' not in st.session_state:
-                st.session_state.clicked_players = []
+    # 세션별 선수 프로필 사전 계산 캐시
+    if 'profile_prefetch' not in st.session_state:
+        st.session_state.profile_prefetch = ProfilePrefetchCache()
+    profile_prefetch = st.session_state.profile_prefetch
+
+    def search_result_rows(row_ids):
+        """이름 검색 결과 행 (색인의 행 식별자 기준, 필터와 무관하게 전체 데이터셋에서)"""
+        if df is None:
+            return processor.get_rows(row_ids)
+        return df.iloc[row_ids]
+
+    def player_snapshot(player_uid):
+        """선택된 선수 프로필 (순위 차트 표시 시 미리 계산된 값, 없으면 전체 데이터에서 직접 계산)"""
+        snapshot = profile_prefetch.get((selected_dataset, dataset_version), player_uid)
+        if snapshot is None:
+            player_rows = processor.get_players([player_uid])
+            if len(player_rows) == 0:
+                return None
+            snapshot = build_profile_snapshot(player_rows.iloc[0], radar_stat_columns)
+        return snapshot
+
+    # 활성화된 필터의 능력치들만 사용하여 점수 계산
+    active_stats = [k for k, v in stat_filters.items() if v > 0 and k != 'Overall_Rating']
+
+    def ranking_table():
+        """
+        순위 차트에 표시할 상위 N명 (표시 점수 컬럼, 점수 이름과 함께 반환)
 
-            # 필터 요약 및 리셋 버튼
-            col_info, col_reset = st.columns([4, 1])
+        df_score 계산과 정렬은 데이터셋/필터/정렬 조건이 바뀔 때만 다시 하고 세션에 조건 키와 함께 저장하므로,
+        차트 클릭으로 다시 실행될 때는 저장된 결과를 그대로 사용합니다.
+        """
+        ranking_key = (selected_dataset, dataset_version, profile_sort, normalize_filter_key(
+            selected_position, (age_min, age_max), {**stat_filters, **profile_filters}, top_n_display
+        ))
+        cached = st.session_state.get('ranking_table')
+        if cached is not None and cached[0] == ranking_key:
+            return cached[1]
+
+        # 필터 기반 점수 계산 (동등 가중치)
+        df_score = df_filtered.copy()
+
+        if profile_sort != 'Default':
+            # 5대 분류 점수 기준 정렬 (0-100 정규화)
+            profile_column = processor.PROFILE_COLUMNS[profile_sort]
+            df_score['Display_Score'] = ScoreNormalizer().fit_transform(df_score[profile_column])
+            rank_column = profile_column
+            score_label = f"{profile_sort} 프로필 점수"
+        elif active_stats and selected_position != 'All':
+            # 각 능력치의 실제 값을 사용하여 평균 계산 (동등 가중치)
+            # 슬라이더 값은 필터링에만 사용되고, 점수는 실제 능력치 값의 평균으로 계산
+            available_active_stats = [s for s in active_stats if s in df_score.columns]
+            if available_active_stats:
+                df_score['Filter_Score'] = df_score[available_active_stats].mean(axis=1)
+            else:
+                df_score['Filter_Score'] = df_score['Overall_Rating']
+
+            # 나이 가중치 적용
+            # age_weight = np.where(df_score['Age'] <= 21, 1.2,
+            #                       np.where(df_score['Age'] <= 24, 1.0, 0.8))
+            age_weight = 1.0
+            df_score['Filter_Score'] = df_score['Filter_Score'] * age_weight
+
+            # 0-100 정규화 (이상치만 잘라낸 범위 기준)
+            df_score['Display_Score'] = ScoreNormalizer().fit_transform(df_score['Filter_Score'])
+            rank_column = 'Filter_Score'
+            score_label = "필터 기반 점수"
+        else:
+            # 기본 유망주 점수 사용
+            df_score['Display_Score'] = df_score['Talent_Score_Normalized']
+            rank_column = 'Talent_Score'
+            score_label = "유망주 점수"
+
+        # 상위 N명 표시 (사이드바 슬라이더로 조절)
+        # 순서는 정규화 전 점수 기준 (0-100 점수는 표시용, 울타리 밖 이상치는 모두 0/100으로 같아짐)
+        df_display = df_score.nlargest(top_n_display, rank_column).copy()
+        df_display['Rank'] = range(1, len(df_display) + 1)
+        df_display['Display_Name'] = df_display.apply(
+            lambda x: f"{x['Rank']}. {x['Name']} ({int(x['Age'])}세)", axis=1
+        )
 
-            with col_info:
-                if selected_position != 'All':
-                    st.info(
-                        f"📌 **{selected_position}** 포지션 {len(df_filtered):,}명 | 💡 **왼쪽 차트에서 선수를 클릭**하면 오른쪽에 능력치가 표시됩니다!")
+        # 표시된 선수들의 프로필을 클릭 전에 백그라운드에서 미리 계산 (순위가 바뀔 때만 제출)
+        profile_prefetch.submit((selected_dataset, dataset_version), df_display, radar_stat_columns)
+
+        st.session_state.ranking_table = (ranking_key, (df_display, 'Display_Score', score_label))
+        return df_display, 'Display_Score', score_label
+
+    def selected_snapshots():
+        """선택된 선수 프로필 (선택 목록은 UID, 동명이인 구분)"""
+        return {uid: player_snapshot(uid) for uid in st.session_state.clicked_players}
+
+    # 순위 차트, 레이더/비교 패널, 프로필 탭은 각각 fragment로 분리하고 선택 상태는 st.session_state로 공유
+    # - 순위 fragment: 점수 계산/정렬은 ranking_table()에 저장된 결과를 사용하고 막대 색상만 다시 그림
+    # - 레이더/비교 fragment: 미리 계산된 선수 프로필(profile_prefetch)만 조회
+    # - 프로필 탭 fragment: 선수 조합별로 캐시된 Figure(figure_cache) 사용
+    @st.fragment
+    def ranking_panel():
+        with timed('player_dashboard.ranking_chart'):
+            st.subheader("🏆 선수 순위 (필터 기준)")
+
+            df_display, score_column, score_label = ranking_table()
+
+            if profile_sort != 'Default':
+                st.caption(f"📊 정렬: {PROFILE_LABELS[profile_sort]} 점수 (0-100 정규화)")
+            elif active_stats and selected_position != 'All':
+                # 어떤 능력치가 적용되었는지 표시 + 계산 방식 설명
+                applied_stats = [position_key_stats[selected_position][s]['label'] for s in active_stats if
+                                 s in position_key_stats.get(selected_position, {})]
+                stat_values = {s: stat_filters[s] for s in active_stats if s in stat_filters}
+
+                if applied_stats:
+                    # 계산 방식 상세 표시
+                    with st.expander(f"📊 점수 계산 방식 상세 (클릭하여 확인)", expanded=False):
+                        st.markdown(f"""
+                            **✅ 적용된 능력치 및 최소 기준**:
+                            """)
+                        for stat, label in zip(active_stats, applied_stats):
+                            min_val = stat_values.get(stat, 0)
+                            st.write(f"- **{label}**: 최소 {min_val} 이상 (실제 값 사용)")
+
+                        st.markdown(f"""
+                            ---
+
+                            **📐 계산 공식**:
+                            1. **필터링**: 슬라이더 값 이상인 선수만 선택
+                            2. **점수 계산**: 선택된 능력치들의 **실제 값 평균** (동등 가중치)
+                               - 예: 골결정력 15, 스피드 14, 드리블 13 → (15+14+13)/3 = 14.0
+                            3. **나이 가중치**:
+                               - 18-21세: ×1.2 (젊을수록 유리)
+                               - 22-24세: ×1.0
+                               - 25세 이상: ×0.8
+                            4. **정규화**: 0-100 범위로 변환
+
+                            **💡 예시**:
+                            - 선수 A (20세): 골결정력 15, 스피드 14, 드리블 13
+                              - 평균: 14.0
+                              - 나이 가중치: 14.0 × 1.2 = **16.8**
+                            - 선수 B (23세): 골결정력 16, 스피드 15, 드리블 14
+                              - 평균: 15.0
+                              - 나이 가중치: 15.0 × 1.0 = **15.0**
+                            - → 선수 A가 더 높은 점수! (젊은 나이 보너스)
+
+                            **🎯 핵심**: 슬라이더는 **최소 기준**만 설정하고, 
+                            실제 점수는 **능력치 값의 평균**으로 계산됩니다.
+                            """)
+
+                    # 슬라이더 값 요약
+                    slider_summary = ', '.join([f"{label}≥{stat_values.get(stat, 0)}"
+                                                for stat, label in zip(active_stats, applied_stats)])
+                    st.caption(f"📊 필터: {slider_summary} | 점수 = (능력치 평균) × 나이가중치")
                 else:
-                    st.info(f"📌 전체 포지션 {len(df_filtered):,}명 | 💡 **왼쪽 차트에서 선수를 클릭**하면 오른쪽에 능력치가 표시됩니다!")
-
-            with col_reset:
-                if st.button("🔄 선택 초기화", use_container_width=True):
-                    st.session_state.clicked_players = []
-                    st.rerun()
-
-            st.markdown("---")
-
-            # 메인 레이아웃: 왼쪽 순위 바 차트, 오른쪽 레이더 차트 (동일 비율)
-            col_ranking, col_radar = st.columns([1, 1])
-
-            # 왼쪽: 실시간 순위 바 차트
-            with col_ranking:
-                st.subheader("🏆 선수 순위 (필터 기준)")
-
-                # 필터 기반 점수 계산 (동등 가중치)
-                df_score = df_filtered.copy()
-
-                # 활성화된 필터의 능력치들만 사용하여 점수 계산
-                active_stats = [k for k, v in stat_filters.items() if v > 0 and k != 'Overall_Rating']
+                    st.caption("💡 슬라이더를 조정하면 순위가 실시간 변경됩니다")
+            else:
+                st.caption("💡 능력치 슬라이더를 조정하면 순위가 실시간 변경됩니다")
 
-                if active_stats and selected_position != 'All':
-                    # 각 능력치의 실제 값을 사용하여 평균 계산 (동등 가중치)
-                    # 슬라이더 값은 필터링에만 사용되고, 점수는 실제 능력치 값의 평균으로 계산
-                    available_active_stats = [s for s in active_stats if s in df_score.columns]
-                    if available_active_stats:
-                        df_score['Filter_Score'] = df_score[available_active_stats].mean(axis=1)
+            # 바 차트 색상 설정
+            colors_bar = []
+            for idx, row in df_display.iterrows():
+                if row['UID'] in st.session_state.clicked_players:
+                    colors_bar.append('#FF4B4B')  # 빨간색 (선택됨)
+                else:
+                    # 나이에 따른 색상 (젊을수록 밝은 색)
+                    age = row['Age']
+                    if age <= 21:
+                        colors_bar.append('#00CC96')  # 녹색 (젊음)
+                    elif age <= 24:
+                        colors_bar.append('#636EFA')  # 파란색
                     else:
-                        df_score['Filter_Score'] = df_score['Overall_Rating']
-
-                    # 나이 가중치 적용
-                    # age_weight = np.where(df_score['Age'] <= 21, 1.2,
-                    #                       np.where(df_score['Age'] <= 24, 1.0, 0.8))
-                    age_weight = 1.0
-                    df_score['Filter_Score'] = df_score['Filter_Score'] * age_weight
-
-                    # 0-100 정규화
-                    min_score = df_score['Filter_Score'].min()
-                    max_score = df_score['Filter_Score'].max()
-                    if max_score > min_score:
-                        df_score['Display_Score'] = (
-                                (df_score['Filter_Score'] - min_score) / (max_score - min_score) * 100)
+                        colors_bar.append('#AB63FA')  # 보라색
+
+            # 수평 바 차트
+            fig_ranking = build_ranking_chart(df_display, score_column, score_label, colors_bar)
+
+            # 클릭 이벤트 캡처
+            # (클릭 컴포넌트의 plotly.js는 typed array를 지원하지 않으므로 반올림/불필요 데이터 제거만 적용)
+            clicked_points = plotly_events(
+                compact_figure(fig_ranking, typed_arrays=False),
+                click_event=True,
+                hover_event=False,
+                select_event=False,
+                key="ranking_click"
+            )
+
+            # 클릭된 선수 처리 (컴포넌트는 마지막 클릭 값을 계속 반환하므로 새 클릭만 처리)
+            if clicked_points and clicked_points != st.session_state.get('last_ranking_click'):
+                st.session_state.last_ranking_click = clicked_points
+                point_index = clicked_points[0].get('pointIndex', None)
+                if point_index is not None and point_index < len(df_display):
+                    clicked_uid = df_display['UID'].tolist()[point_index]
+                    if clicked_uid not in st.session_state.clicked_players:
+                        _add_clicked_player(clicked_uid)
+                        # 다른 fragment(레이더/비교 패널, 프로필 탭)만 골라 재실행할 수 없으므로 앱 전체를 재실행
+                        # (필터 체인은 query_cache, 순위는 ranking_table() 저장값을 사용하므로 다시 계산하지 않음)
+                        st.rerun()
+
+            # 범례 표시
+            st.markdown("""
+                <div style='font-size: 12px; margin-top: 5px;'>
+                    <span style='color: #00CC96;'>●</span> 21세 이하 &nbsp;
+                    <span style='color: #636EFA;'>●</span> 22-24세 &nbsp;
+                    <span style='color: #AB63FA;'>●</span> 25세 이상 &nbsp;
+                    <span style='color: #FF4B4B;'>●</span> 선택됨
+                </div>
+                """, unsafe_allow_html=True)
+
+            # 현재 선택된 선수 표시
+            if st.session_state.clicked_players:
+                clicked_names = [snapshot['compare_row']['Name']
+                                 for snapshot in selected_snapshots().values() if snapshot is not None]
+                st.success(f"⭐ 선택된 선수: {', '.join(clicked_names)}")
+
+    @st.fragment
+    def radar_panel():
+        with timed('player_dashboard.radar_panel'):
+            colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
+            clicked_snapshots = selected_snapshots()
+
+            if len(st.session_state.clicked_players) > 0:
+                # 가장 최근 클릭한 선수 정보
+                latest_data = clicked_snapshots[st.session_state.clicked_players[-1]]
+
+                if latest_data is not None:
+                    player_position = latest_data['position']
+                    st.subheader(f"Profile: {latest_data['compare_row']['Name']}")
+
+                    # 선수 기본 정보
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("나이", f"{latest_data['age']}세")
+                    with col2:
+                        st.metric("포지션", player_position)
+                    with col3:
+                        st.metric("유망주점수", f"{latest_data['talent_score']:.1f}")
+
+                    # 포지션별 핵심 능력치 가져오기
+                    if player_position in position_key_stats:
+                        position_stats = position_key_stats[player_position]
+                        stat_names = list(position_stats.keys())
+                        stat_labels = [position_stats[s]['label'] for s in stat_names]
                     else:
-                        df_score['Display_Score'] = df_score['Filter_Score']
-
-                    score_column = 'Display_Score'
-                    score_label = "필터 기반 점수"
-
-                    # 어떤 능력치가 적용되었는지 표시 + 계산 방식 설명
-                    applied_stats = [position_key_stats[selected_position][s]['label'] for s in active_stats if
-                                     s in position_key_stats.get(selected_position, {})]
-                    stat_values = {s: stat_filters[s] for s in active_stats if s in stat_filters}
-
-                    if applied_stats:
-                        # 계산 방식 상세 표시
-                        with st.expander(f"📊 점수 계산 방식 상세 (클릭하여 확인)", expanded=False):
-                            st.markdown(f"""
-                                **✅ 적용된 능력치 및 최소 기준**:
-                                """)
-                            for stat, label in zip(active_stats, applied_stats):
-                                min_val = stat_values.get(stat, 0)
-                                st.write(f"- **{label}**: 최소 {min_val} 이상 (실제 값 사용)")
-
-                            st.markdown(f"""
-                                ---
-
-                                **📐 계산 공식**:
-                                1. **필터링**: 슬라이더 값 이상인 선수만 선택
-                                2. **점수 계산**: 선택된 능력치들의 **실제 값 평균** (동등 가중치)
-                                   - 예: 골결정력 15, 스피드 14, 드리블 13 → (15+14+13)/3 = 14.0
-                                3. **나이 가중치**:
-                                   - 18-21세: ×1.2 (젊을수록 유리)
-                                   - 22-24세: ×1.0
-                                   - 25세 이상: ×0.8
-                                4. **정규화**: 0-100 범위로 변환
-
-                                **💡 예시**:
-                                - 선수 A (20세): 골결정력 15, 스피드 14, 드리블 13
-                                  - 평균: 14.0
-                                  - 나이 가중치: 14.0 × 1.2 = **16.8**
-                                - 선수 B (23세): 골결정력 16, 스피드 15, 드리블 14
-                                  - 평균: 15.0
-                                  - 나이 가중치: 15.0 × 1.0 = **15.0**
-                                - → 선수 A가 더 높은 점수! (젊은 나이 보너스)
-
-                                **🎯 핵심**: 슬라이더는 **최소 기준**만 설정하고, 
-                                실제 점수는 **능력치 값의 평균**으로 계산됩니다.
-                                """)
-
-                        # 슬라이더 값 요약
-                        slider_summary = ', '.join([f"{label}≥{stat_values.get(stat, 0)}"
-                                                    for stat, label in zip(active_stats, applied_stats)])
-                        st.caption(f"📊 필터: {slider_summary} | 점수 = (능력치 평균) × 나이가중치")
+                        # 기본값 (All 포지션인 경우)
+                        stat_names = ['Finishing', 'Dribbling', 'Passing', 'Tackling', 'Pace', 'Stamina']
+                        stat_labels = ['골결정력', '드리블', '패스', '태클', '스피드', '스태미나']
+
+                    st.caption(f"📊 **{player_position}** 포지션 핵심 능력치")
+
+                # 레이더 차트 생성
+                fig_radar = go.Figure()
+
+                # 첫 번째 선수의 포지션 기준으로 카테고리 설정
+                first_player_data = clicked_snapshots[st.session_state.clicked_players[0]]
+                if first_player_data is not None:
+                    base_position = first_player_data['position']
+                    if base_position in position_key_stats:
+                        position_stats = position_key_stats[base_position]
+                        stat_names = list(position_stats.keys())
+                        stat_labels = [position_stats[s]['label'] for s in stat_names]
                     else:
-                        st.caption("💡 슬라이더를 조정하면 순위가 실시간 변경됩니다")
-                else:
-                    # 기본 유망주 점수 사용
-                    df_score['Display_Score'] = df_score['Talent_Score_Normalized']
-                    score_column = 'Display_Score'
-                    score_label = "유망주 점수"
-                    st.caption("💡 능력치 슬라이더를 조정하면 순위가 실시간 변경됩니다")
-
-                # 상위 N명 표시 (사이드바 슬라이더로 조절)
-                df_display = df_score.nlargest(top_n_display, score_column).copy()
-                df_display['Rank'] = range(1, len(df_display) + 1)
-                df_display['Display_Name'] = df_display.apply(
-                    lambda x: f"{x['Rank']}. {x['Name']} ({int(x['Age'])}세)", axis=1
-                )
+                        stat_names = ['Finishing', 'Dribbling', 'Passing', 'Tackling', 'Pace', 'Stamina']
+                        stat_labels = ['골결정력', '드리블', '패스', '태클', '스피드', '스태미나']
 
-                # 선택된 선수 표시용 색상
-                df_display['Is_Selected'] = df_display['Name'].isin(st.session_state.clicked_players)
+                for idx, player_uid in enumerate(st.session_state.clicked_players):
+                    player_data = clicked_snapshots[player_uid]
+                    if player_data is not None:
+                        player_name = player_data['compare_row']['Name']
+                        # 포지션별 핵심 능력치 값 가져오기
+                        values = [player_data['key_stats'][stat] for stat in stat_names]
 
-                # 바 차트 색상 설정
-                colors_bar = []
-                for idx, row in df_display.iterrows():
-                    if row['Name'] in st.session_state.clicked_players:
-                        colors_bar.append('#FF4B4B')  # 빨간색 (선택됨)
-                    else:
-                        # 나이에 따른 색상 (젊을수록 밝은 색)
-                        age = row['Age']
-                        if age <= 21:
-                            colors_bar.append('#00CC96')  # 녹색 (젊음)
-                        elif age <= 24:
-                            colors_bar.append('#636EFA')  # 파란색
-                        else:
-                            colors_bar.append('#AB63FA')  # 보라색
-
-                # 수평 바 차트
-                fig_ranking = go.Figure()
-
-                fig_ranking.add_trace(go.Bar(
-                    y=df_display['Display_Name'],
-                    x=df_display[score_column],
-                    orientation='h',
-                    marker=dict(
-                        color=colors_bar,
-                        line=dict(width=1, color='white')
-                    ),
-                    text=df_display[score_column].round(1),
-                    textposition='inside',
-                    textfont=dict(color='white', size=11),
-                    hovertemplate=(
-                            "<b>%{y}</b><br>" +
-                            f"{score_label}: " + "%{x:.1f}<br>" +
-                            "<extra></extra>"
-                    ),
-                    customdata=df_display[['Name', 'Age', 'Position_Category', 'Overall_Rating']].values
-                ))
+                        fig_radar.add_trace(go.Scatterpolar(
+                            r=values,
+                            theta=stat_labels,
+                            fill='toself',
+                            name=f"{player_name}",
+                            line_color=colors[idx % 5],
+                            fillcolor=f'rgba{tuple(list(int(colors[idx % 5][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}',
+                            hovertemplate=f"<b>{player_name}</b><br>%{{theta}}: %{{r:.1f}}<extra></extra>"
+                        ))
 
-                fig_ranking.update_layout(
-                    height=550,
-                    margin=dict(t=10, b=50, l=180, r=20),
-                    xaxis=dict(
-                        title=score_label,
-                        range=[0, 105],
-                        showgrid=True,
-                        gridcolor='lightgray',
-                        title_standoff=10
+                fig_radar.update_layout(
+                    polar=dict(
+                        bgcolor='rgba(250,250,250,0.5)',
+                        radialaxis=dict(
+                            visible=True,
+                            range=[0, 20],
+                            tickmode='linear',
+                            tick0=0,
+                            dtick=5,
+                            gridcolor='lightgray',
+                            linecolor='lightgray'
+                        ),
+                        angularaxis=dict(
+                            gridcolor='lightgray',
+                            linecolor='lightgray'
+                        )
                     ),
-                    yaxis=dict(
-                        title="",
-                        autorange="reversed",  # 1등이 위에
-                        tickfont=dict(size=10),
-                        tickmode='array',
-                        tickvals=list(range(len(df_display))),
-                        ticktext=df_display['Display_Name'].tolist()
+                    showlegend=True if len(st.session_state.clicked_players) > 1 else False,
+                    legend=dict(
+                        orientation="h",
+                        yanchor="bottom",
+                        y=-0.15,
+                        xanchor="center",
+                        x=0.5,
+                        font=dict(size=10)
                     ),
-                    plot_bgcolor='rgba(0,0,0,0)',  # 배경 투명
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    template='plotly_dark',
-                    showlegend=False
+                    height=480,
+                    margin=dict(t=20, b=60, l=40, r=40)
                 )
 
-                # 클릭 이벤트 캡처
-                clicked_points = plotly_events(
-                    fig_ranking,
-                    click_event=True,
-                    hover_event=False,
-                    select_event=False,
-                    key="ranking_click"
-                )
-
-                # 클릭된 선수 처리
-                if clicked_points:
-                    point_index = clicked_points[0].get('pointIndex', None)
-                    if point_index is not None and point_index < len(df_display):
-                        clicked_name = df_display.iloc[point_index]['Name']
-                        if clicked_name not in st.session_state.clicked_players:
-                            if len(st.session_state.clicked_players) >= 5:
-                                st.session_state.clicked_players.pop(0)
-                            st.session_state.clicked_players.append(clicked_name)
-                            st.rerun()
-
-                # 범례 표시
-                st.markdown("""
-                    <div style='font-size: 12px; margin-top: 5px;'>
-                        <span style='color: #00CC96;'>●</span> 21세 이하 &nbsp;
-                        <span style='color: #636EFA;'>●</span> 22-24세 &nbsp;
-                        <span style='color: #AB63FA;'>●</span> 25세 이상 &nbsp;
-                        <span style='color: #FF4B4B;'>●</span> 선택됨
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                # 현재 선택된 선수 표시
-                if st.session_state.clicked_players:
-                    st.success(f"⭐ 선택된 선수: {', '.join(st.session_state.clicked_players)}")
-
-            # 오른쪽: 레이더 차트
-            with col_radar:
-                colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
+                st.plotly_chart(compact_figure(fig_radar), use_container_width=True)
 
+                # 선택된 선수들 비교 테이블
                 if len(st.session_state.clicked_players) > 0:
-                    # 가장 최근 클릭한 선수 정보
-                    latest_player = st.session_state.clicked_players[-1]
-                    latest_data = df_filtered[df_filtered['Name'] == latest_player]
-
-                    if len(latest_data) > 0:
-                        latest_data = latest_data.iloc[0]
-                        player_position = latest_data['Position_Category']
-                        st.subheader(f"Profile: {latest_player}")
-
-                        # 선수 기본 정보
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("나이", f"{int(latest_data['Age'])}세")
-                        with col2:
-                            st.metric("포지션", player_position)
-                        with col3:
-                            st.metric("유망주점수", f"{latest_data['Talent_Score_Normalized']:.1f}")
-
-                        # 포지션별 핵심 능력치 가져오기
-                        if player_position in position_key_stats:
-                            position_stats = position_key_stats[player_position]
-                            stat_names = list(position_stats.keys())
-                            stat_labels = [position_stats[s]['label'] for s in stat_names]
-                        else:
-                            # 기본값 (All 포지션인 경우)
-                            stat_names = ['Finishing', 'Dribbling', 'Passing', 'Tackling', 'Pace', 'Stamina']
-                            stat_labels = ['골결정력', '드리블', '패스', '태클', '스피드', '스태미나']
-
-                        st.caption(f"📊 **{player_position}** 포지션 핵심 능력치")
-
-                    # 레이더 차트 생성
-                    fig_radar = go.Figure()
-
-                    # 첫 번째 선수의 포지션 기준으로 카테고리 설정
-                    first_player_data = df_filtered[df_filtered['Name'] == st.session_state.clicked_players[0]]
-                    if len(first_player_data) > 0:
-                        base_position = first_player_data.iloc[0]['Position_Category']
-                        if base_position in position_key_stats:
-                            position_stats = position_key_stats[base_position]
-                            stat_names = list(position_stats.keys())
-                            stat_labels = [position_stats[s]['label'] for s in stat_names]
-                        else:
-                            stat_names = ['Finishing', 'Dribbling', 'Passing', 'Tackling', 'Pace', 'Stamina']
-                            stat_labels = ['골결정력', '드리블', '패스', '태클', '스피드', '스태미나']
-
-                    for idx, player_name in enumerate(st.session_state.clicked_players):
-                        player_data = df_filtered[df_filtered['Name'] == player_name]
-                        if len(player_data) > 0:
-                            player_data = player_data.iloc[0]
-
-                            # 포지션별 핵심 능력치 값 가져오기
-                            values = []
-                            for stat in stat_names:
-                                if stat in df_filtered.columns:
-                                    values.append(player_data[stat])
-                                else:
-                                    values.append(0)
-
-                            fig_radar.add_trace(go.Scatterpolar(
-                                r=values,
-                                theta=stat_labels,
-                                fill='toself',
-                                name=f"{player_name}",
-                                line_color=colors[idx % 5],
-                                fillcolor=f'rgba{tuple(list(int(colors[idx % 5][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}',
-                                hovertemplate=f"<b>{player_name}</b><br>%{{theta}}: %{{r:.1f}}<extra></extra>"
-                            ))
-
-                    fig_radar.update_layout(
-                        polar=dict(
-                            bgcolor='rgba(250,250,250,0.5)',
-                            radialaxis=dict(
-                                visible=True,
-                                range=[0, 20],
-                                tickmode='linear',
-                                tick0=0,
-                                dtick=5,
-                                gridcolor='lightgray',
-                                linecolor='lightgray'
-                            ),
-                            angularaxis=dict(
-                                gridcolor='lightgray',
-                                linecolor='lightgray'
-                            )
-                        ),
-                        showlegend=True if len(st.session_state.clicked_players) > 1 else False,
-                        legend=dict(
-                            orientation="h",
-                            yanchor="bottom",
-                            y=-0.15,
-                            xanchor="center",
-                            x=0.5,
-                            font=dict(size=10)
-                        ),
-                        height=480,
-                        margin=dict(t=20, b=60, l=40, r=40)
+                    st.markdown("##### 📋 선택된 선수 비교")
+                    compare_data = pd.DataFrame(
+                        [snapshot['compare_row'] for snapshot in clicked_snapshots.values() if snapshot is not None],
+                        columns=COMPARE_COLUMNS
                     )
+                    compare_data.columns = ['이름', '나이', '포지션', '종합능력', '유망주점수']
+                    compare_data = compare_data.round(2)
+                    st.dataframe(compare_data, use_container_width=True, hide_index=True, height=150)
 
-                    st.plotly_chart(fig_radar, use_container_width=True)
-
-                    # 선택된 선수들 비교 테이블
-                    if len(st.session_state.clicked_players) > 0:
-                        st.markdown("##### 📋 선택된 선수 비교")
-                        compare_data = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)][
-                            ['Name', 'Age', 'Position_Category', 'Overall_Rating', 'Talent_Score_Normalized']
-                        ].copy()
-                        compare_data.columns = ['이름', '나이', '포지션', '종합능력', '유망주점수']
-                        compare_data = compare_data.round(2)
-                        st.dataframe(compare_data, use_container_width=True, hide_index=True, height=150)
+            else:
+                st.subheader("⚡ Profile")
+                st.info("👈 왼쪽 차트에서 선수를 **클릭**하세요!")
 
+                # 포지션에 따른 빈 레이더 차트 카테고리
+                if selected_position in position_key_stats:
+                    empty_stats = position_key_stats[selected_position]
+                    empty_labels = [empty_stats[s]['label'] for s in empty_stats.keys()]
                 else:
-                    st.subheader("⚡ Profile")
-                    st.info("👈 왼쪽 차트에서 선수를 **클릭**하세요!")
+                    empty_labels = ['공격력', '수비력', '기술', '멘탈', '신체']
+
+                # 빈 레이더 차트 표시
+                fig_empty = go.Figure()
+                fig_empty.add_trace(go.Scatterpolar(
+                    r=[10] * len(empty_labels),
+                    theta=empty_labels,
+                    fill='toself',
+                    name='클릭하여 선택',
+                    line_color='lightgray',
+                    fillcolor='rgba(200, 200, 200, 0.2)'
+                ))
+                fig_empty.update_layout(
+                    polar=dict(
+                        radialaxis=dict(
+                            visible=True,
+                            range=[0, 20],
+                            tickmode='linear',
+                            tick0=0,
+                            dtick=5
+                        )
+                    ),
+                    showlegend=False,
+                    height=480,
+                    margin=dict(t=20, b=60, l=40, r=40),
+                    template='plotly_dark',
+                )
+                st.plotly_chart(compact_figure(fig_empty), use_container_width=True)
 
-                    # 포지션에 따른 빈 레이더 차트 카테고리
-                    if selected_position in position_key_stats:
-                        empty_stats = position_key_stats[selected_position]
-                        empty_labels = [empty_stats[s]['label'] for s in empty_stats.keys()]
-                    else:
-                        empty_labels = ['공격력', '수비력', '기술', '멘탈', '신체']
-
-                    # 빈 레이더 차트 표시
-                    fig_empty = go.Figure()
-                    fig_empty.add_trace(go.Scatterpolar(
-                        r=[10] * len(empty_labels),
-                        theta=empty_labels,
-                        fill='toself',
-                        name='클릭하여 선택',
-                        line_color='lightgray',
-                        fillcolor='rgba(200, 200, 200, 0.2)'
-                    ))
-                    fig_empty.update_layout(
-                        polar=dict(
-                            radialaxis=dict(
-                                visible=True,
-                                range=[0, 20],
-                                tickmode='linear',
-                                tick0=0,
-                                dtick=5
-                            )
-                        ),
-                        showlegend=False,
-                        height=480,
-                        margin=dict(t=20, b=60, l=40, r=40),
-                        template='plotly_dark',
-                    )
-                    st.plotly_chart(fig_empty, use_container_width=True)
-
-                    st.markdown("""
-                        **사용법:**
-                        1. 왼쪽 차트에서 선수 막대를 클릭
-                        2. 오른쪽에 해당 선수의 핵심 능력치 표시
-                        3. 최대 5명까지 비교 가능
-                        4. 초기화 버튼으로 리셋
-                        """)
-
-    # 탭 2: 선수 비교 (Parallel Coordinates)
-    # with tab2:
-    #     st.header("📊 선수 비교 - 평행 좌표계")
-    #
-    #     # 선택된 선수가 없으면 안내 메시지
-    #     if len(st.session_state.clicked_players) == 0:
-    #         st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
-    #         st.info("👈 **선수 발굴** 탭에서 비교할 선수를 클릭하면 여기서 비교할 수 있습니다.")
-    #     else:
-    #         # 선택된 선수들만 필터링
-    #         top_compare = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)]
-    #
-    #         if len(top_compare) == 0:
-    #             st.warning("⚠️ 선택된 선수가 현재 필터 조건에 맞지 않습니다.")
-    #         else:
-    #             st.info(
-    #                 f"💡 **선택된 {len(top_compare)}명의 선수**를 평행 좌표계로 비교합니다. "
-    #                 "각 축에서 드래그하여 범위를 지정하면 해당 조건에 맞는 선수만 필터링됩니다."
-    #             )
-    #
-    #             # 포지션별 핵심 스텟 선택
-    #             if selected_position == 'Goalkeeper':
-    #                 compare_attrs = ['Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility',
-    #                                  'Talent_Score_Normalized']
-    #             elif selected_position == 'Defender':
-    #                 compare_attrs = ['Marking', 'Tackling', 'Heading', 'Positioning', 'Pace', 'Strength',
-    #                                  'Anticipation', 'Talent_Score_Normalized']
-    #             elif selected_position == 'Midfielder':
-    #                 compare_attrs = ['Passing', 'Vision', 'Technique', 'Stamina', 'Workrate', 'Dribbling',
-    #                                  'FirstTouch', 'Talent_Score_Normalized']
-    #             elif selected_position == 'Forward':
-    #                 compare_attrs = ['Finishing', 'Dribbling', 'Pace', 'Acceleration', 'Composure', 'OffTheBall',
-    #                                  'Technique', 'Talent_Score_Normalized']
-    #             else:
-    #                 compare_attrs = ['Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating',
-    #                                  'Pace', 'Passing', 'Finishing', 'Talent_Score_Normalized']
-    #
-    #             # 존재하는 컬럼만 사용
-    #             compare_attrs = [a for a in compare_attrs if a in top_compare.columns]
-    #
-    #             # 데이터 준비
-    #             compare_data = top_compare[compare_attrs + ['Name', 'Position_Category']].copy()
-    #
-    #             # 선수별 색상 정의
-    #             player_colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
-    #
-    #             # 라인 차트 기반 평행좌표계 (hover 지원)
-    #             fig_parallel = go.Figure()
-    #
-    #             # 각 축의 범위 계산
-    #             attr_ranges = {}
-    #             for attr in compare_attrs:
-    #                 attr_ranges[attr] = {
-    #                     'min': top_compare[attr].min(),
-    #                     'max': top_compare[attr].max()
-    #                 }
-    #
-    #             # 정규화 함수 (0-1 범위로)
-    #             def normalize_value(value, attr):
-    #                 min_val = attr_ranges[attr]['min']
-    #                 max_val = attr_ranges[attr]['max']
-    #                 if max_val == min_val:
-    #                     return 0.5
-    #                 return (value - min_val) / (max_val - min_val)
-    #
-    #             # 각 선수별 라인 추가
-    #             for idx, (_, player_row) in enumerate(top_compare.iterrows()):
-    #                 player_name = player_row['Name']
-    #
-    #                 # 정규화된 y값
-    #                 y_values = [normalize_value(player_row[attr], attr) for attr in compare_attrs]
-    #
-    #                 # 실제 값 (hover용)
-    #                 actual_values = [player_row[attr] for attr in compare_attrs]
-    #
-    #                 fig_parallel.add_trace(go.Scatter(
-    #                     x=compare_attrs,
-    #                     y=y_values,
-    #                     mode='lines+markers',
-    #                     name=player_name,
-    #                     line=dict(color=player_colors[idx % len(player_colors)], width=3),
-    #                     marker=dict(size=10, color=player_colors[idx % len(player_colors)]),
-    #                     customdata=[[actual_values[i]] for i in range(len(compare_attrs))],
-    #                     hovertemplate='<b>%{customdata[0]:.1f}</b><extra></extra>'
-    #                 ))
-    #
-    #             # x축 레이블 설정
-    #             fig_parallel.update_layout(
-    #                 title=f'선택된 {len(top_compare)}명 선수 비교 - {selected_position if selected_position != "All" else "전체 포지션"}',
-    #                 height=500,
-    #                 margin=dict(l=50, r=50, t=80, b=120),
-    #                 xaxis=dict(
-    #                     tickangle=45,
-    #                     tickfont=dict(size=11)
-    #                 ),
-    #                 yaxis=dict(
-    #                     title='정규화된 값 (0-1)',
-    #                     range=[-0.05, 1.05],
-    #                     showgrid=True,
-    #                     gridcolor='lightgray'
-    #                 ),
-    #                 legend=dict(
-    #                     orientation="h",
-    #                     yanchor="top",
-    #                     y=-0.25,
-    #                     xanchor="center",
-    #                     x=0.5
-    #                 ),
-    #                 hovermode='x unified',
-    #                 hoverlabel=dict(
-    #                     bgcolor='rgba(240,240,240,0.5)',
-    #                     font_size=12,
-    #                     namelength=-1
-    #                 )
-    #             )
-    #
-    #             # 각 축에 실제 범위 표시 (상단/하단에 주석)
-    #             for i, attr in enumerate(compare_attrs):
-    #                 # 최대값 표시 (상단)
-    #                 fig_parallel.add_annotation(
-    #                     x=attr, y=1.08,
-    #                     text=f"{attr_ranges[attr]['max']:.1f}",
-    #                     showarrow=False,
-    #                     font=dict(size=9, color='gray')
-    #                 )
-    #                 # 최소값 표시 (하단)
-    #                 fig_parallel.add_annotation(
-    #                     x=attr, y=-0.08,
-    #                     text=f"{attr_ranges[attr]['min']:.1f}",
-    #                     showarrow=False,
-    #                     font=dict(size=9, color='gray')
-    #                 )
-    #
-    #             st.plotly_chart(fig_parallel, use_container_width=True)
-    #
-    #             st.caption("💡 **Tip**: 마우스를 라인 위에 올리면 선수 이름과 해당 능력치 값을 확인할 수 있습니다.")
-    #
-    #             # 비교 대상 선수 리스트
-    #             st.subheader("📋 비교 대상 선수 목록")
-    #
-    #             # 중복 컬럼 제거 (Age가 compare_attrs에 이미 포함됨)
-    #             base_cols = ['Name', 'Position_Category']
-    #             display_cols = base_cols + [col for col in compare_attrs if col not in base_cols]
-    #             display_df = top_compare[display_cols].copy()
-    #             display_df = display_df.round(2)
-    #
-    #             st.dataframe(display_df, use_container_width=True, height=300)
-    #
-    #             # 선수별 상세 비교
-    #             st.markdown("---")
-    #             st.subheader("🔍 선수별 상세 비교")
-    #
-    #             # 2-3명 선택하여 레이더 차트로 직접 비교
-    #             selected_players_tab2 = st.multiselect(
-    #                 "비교할 선수 선택 (최대 3명)",
-    #                 options=top_compare['Name'].tolist(),
-    #                 default=top_compare['Name'].tolist()[:min(3, len(top_compare))],
-    #                 max_selections=3,
-    #                 help="선택한 선수들의 능력치를 레이더 차트로 비교합니다"
-    #             )
-    #
-    #             if len(selected_players_tab2) > 0:
-    #                 col1, col2 = st.columns(2)
-    #
-    #                 with col1:
-    #                     # 5개 대분류 레이더 차트
-    #                     st.markdown("#### 능력치 프로필 비교 (5개 대분류)")
-    #
-    #                     fig_compare_radar = go.Figure()
-    #
-    #                     categories = ['공격력', '수비력', '기술', '멘탈', '신체']
-    #                     colors = ['#636EFA', '#EF553B', '#00CC96']
-    #
-    #                     for idx, player_name in enumerate(selected_players_tab2):
-    #                         player_data = top_compare[top_compare['Name'] == player_name].iloc[0]
-    #
-    #                         attacking_attrs = ['Finishing', 'LongShots', 'Heading', 'OffTheBall']
-    #                         defending_attrs = ['Marking', 'Tackling', 'Positioning', 'Anticipation']
-    #                         technical_attrs = ['Dribbling', 'Passing', 'FirstTouch', 'Technique', 'Crossing']
-    #                         mental_attrs = ['Composure', 'Vision', 'Decisions', 'Determination', 'Workrate']
-    #                         physical_attrs = ['Pace', 'Acceleration', 'Stamina', 'Strength', 'Agility']
-    #
-    #                         values = [
-    #                             player_data[[a for a in attacking_attrs if a in df_filtered.columns]].mean(),
-    #                             player_data[[a for a in defending_attrs if a in df_filtered.columns]].mean(),
-    #                             player_data[[a for a in technical_attrs if a in df_filtered.columns]].mean(),
-    #                             player_data[[a for a in mental_attrs if a in df_filtered.columns]].mean(),
-    #                             player_data[[a for a in physical_attrs if a in df_filtered.columns]].mean()
-    #                         ]
-    #
-    #                         fig_compare_radar.add_trace(go.Scatterpolar(
-    #                             r=values,
-    #                             theta=categories,
-    #                             fill='toself',
-    #                             name=player_name,
-    #                             line_color=colors[idx % 3],
-    #                             fillcolor=f'rgba{tuple(list(int(colors[idx % 3][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}'
-    #                         ))
-    #
-    #                     fig_compare_radar.update_layout(
-    #                         polar=dict(
-    #                             radialaxis=dict(
-    #                                 visible=True,
-    #                                 range=[0, 20]
-    #                             )
-    #                         ),
-    #                         height=500,
-    #                         showlegend=True
-    #                     )
-    #
-    #                     st.plotly_chart(fig_compare_radar, use_container_width=True)
-    #
-    #                 with col2:
-    #                     # 포지션별 핵심 스텟 비교 바 차트
-    #                     st.markdown("#### 핵심 스텟 비교")
-    #
-    #                     # 포지션별 핵심 스텟 3-4개 선택
-    #                     if selected_position == 'Goalkeeper':
-    #                         key_stats = ['Reflexes', 'Handling', 'OneOnOnes', 'Kicking']
-    #                     elif selected_position == 'Defender':
-    #                         key_stats = ['Marking', 'Tackling', 'Pace', 'Strength']
-    #                     elif selected_position == 'Midfielder':
-    #                         key_stats = ['Passing', 'Vision', 'Stamina', 'Technique']
-    #                     elif selected_position == 'Forward':
-    #                         key_stats = ['Finishing', 'Pace', 'Dribbling', 'Composure']
-    #                     else:
-    #                         key_stats = ['Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating']
-    #
-    #                     # 존재하는 컬럼만 사용
-    #                     key_stats = [s for s in key_stats if s in top_compare.columns]
-    #
-    #                     fig_bar_compare = go.Figure()
-    #
-    #                     for player_name in selected_players_tab2:
-    #                         player_data = top_compare[top_compare['Name'] == player_name].iloc[0]
-    #                         values = [player_data[stat] for stat in key_stats]
-    #
-    #                         fig_bar_compare.add_trace(go.Bar(
-    #                             name=player_name,
-    #                             x=key_stats,
-    #                             y=values,
-    #                             text=[f'{v:.1f}' for v in values],
-    #                             textposition='auto'
-    #                         ))
-    #
-    #                     fig_bar_compare.update_layout(
-    #                         barmode='group',
-    #                         height=500,
-    #                         yaxis=dict(range=[0, 20]),
-    #                         xaxis_title="능력치",
-    #                         yaxis_title="수치",
-    #                         showlegend=True
-    #                     )
-    #
-    #                     st.plotly_chart(fig_bar_compare, use_container_width=True)
-
-    # 탭 3: 상위 유망주
-    # with tab3:
-    #     st.header("🏆 선택된 유망주 랭킹")
-    #
-    #     # 선택된 선수가 없으면 안내 메시지
-    #     if len(st.session_state.clicked_players) == 0:
-    #         st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
-    #         st.info("👈 **선수 발굴** 탭에서 유망주를 클릭하면 여기서 상세 정보를 볼 수 있습니다.")
-    #     else:
-    #         # 선택된 선수들만 필터링
-    #         selected_talents = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)]
-    #
-    #         if len(selected_talents) == 0:
-    #             st.warning("⚠️ 선택된 선수가 현재 필터 조건에 맞지 않습니다.")
-    #         else:
-    #             st.subheader(f"선택된 {len(selected_talents)}명의 유망주")
-    #
-    #             # 선택된 선수들 바 차트
-    #             fig_bar = px.bar(
-    #                 selected_talents.sort_values('Talent_Score_Normalized', ascending=True),
-    #                 x='Talent_Score_Normalized',
-    #                 y='Name',
-    #                 orientation='h',
-    #                 color='Age',
-    #                 title='선택된 유망주 순위',
-    #                 labels={
-    #                     'Talent_Score_Normalized': '유망주 점수',
-    #                     'Name': '선수명',
-    #                     'Age': '나이'
-    #                 },
-    #                 color_continuous_scale='RdYlGn_r',
-    #                 hover_data=['Position_Category', 'Overall_Rating']
-    #             )
-    #
-    #             fig_bar.update_layout(
-    #                 height=max(300, len(selected_talents) * 50),
-    #                 yaxis={'categoryorder': 'total ascending'}
-    #             )
-    #
-    #             st.plotly_chart(fig_bar, use_container_width=True)
-    #
-    #             # 상위 유망주 테이블
-    #             st.subheader("선택된 유망주 상세 리스트")
-    #
-    #             display_cols = [
-    #                 'Name', 'Age', 'Position_Category', 'Overall_Rating',
-    #                 'Technical_Rating', 'Mental_Rating', 'Physical_Rating',
-    #                 'Talent_Score_Normalized'
-    #             ]
-    #
-    #             display_df = selected_talents[display_cols].copy()
-    #             display_df.columns = [
-    #                 '이름', '나이', '포지션', '종합능력치',
-    #                 '기술', '정신', '신체', '유망주점수'
-    #             ]
-    #
-    #             # 숫자 포맷팅
-    #             for col in ['종합능력치', '기술', '정신', '신체', '유망주점수']:
-    #                 display_df[col] = display_df[col].round(2)
-    #
-    #             st.dataframe(
-    #                 display_df.sort_values('유망주점수', ascending=False),
-    #                 use_container_width=True,
-    #                 height=400
-    #             )
-    #
-    #             # CSV 다운로드
-    #             csv = selected_talents.to_csv(index=False).encode('utf-8-sig')
-    #             st.download_button(
-    #                 label="📥 선택된 유망주 데이터 다운로드 (CSV)",
-    #                 data=csv,
-    #                 file_name='selected_talents.csv',
-    #                 mime='text/csv',
-    #             )
-
-    # 탭 4: 선수 프로필 (상세 분석)
-    with tab4:
-        st.header("👤 선수 프로필 - 상세 비교 분석")
-
-        # 선택된 선수가 없으면 안내 메시지
-        if len(st.session_state.clicked_players) == 0:
-            st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
-            st.info("👈 **선수 발굴** 탭에서 선수를 클릭하면 여기서 상세 프로필을 비교할 수 있습니다.")
-        else:
-            # 선택된 선수들만 필터링
-            selected_for_profile = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)]
-            
-            if len(selected_for_profile) == 0:
-                st.warning("⚠️ 선택된 선수가 현재 필터 조건에 맞지 않습니다.")
+                st.markdown("""
+                    **사용법:**
+                    1. 왼쪽 차트에서 선수 막대를 클릭
+                    2. 오른쪽에 해당 선수의 핵심 능력치 표시
+                    3. 최대 5명까지 비교 가능
+                    4. 초기화 버튼으로 리셋
+                    """)
+
+    @st.fragment
+    def profile_panel():
+        with timed('player_dashboard.profile_tab'):
+            st.header("👤 선수 프로필 - 상세 비교 분석")
+
+            # 선택된 선수가 없으면 안내 메시지
+            if len(st.session_state.clicked_players) == 0:
+                st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
+                st.info("👈 **선수 발굴** 탭에서 선수를 클릭하면 여기서 상세 프로필을 비교할 수 있습니다.")
             else:
-                st.info(f"💡 선택된 **{len(selected_for_profile)}명**의 선수를 비교 분석합니다.")
+                # 선택된 선수들 (이름 검색으로 추가한 필터 밖의 선수 포함)
+                selected_for_profile = processor.get_players(st.session_state.clicked_players)
+            
+                if len(selected_for_profile) == 0:
+                    st.warning("⚠️ 선택된 선수를 데이터셋에서 찾을 수 없습니다.")
+                else:
+                    st.info(f"💡 선택된 **{len(selected_for_profile)}명**의 선수를 비교 분석합니다.")
 
-                # 선수 기본 정보 비교 테이블
-                st.subheader("📋 선수 기본 정보 비교")
+                    # 선수 기본 정보 비교 테이블
+                    st.subheader("📋 선수 기본 정보 비교")
                 
-                basic_info_cols = ['Name', 'Age', 'Position_Category', 'Overall_Rating', 'Talent_Score_Normalized']
-                basic_df = selected_for_profile[basic_info_cols].copy()
-                basic_df.columns = ['선수명', '나이', '포지션', '종합능력', '유망주점수']
-                basic_df = basic_df.round(2)
-                st.dataframe(basic_df, use_container_width=True, hide_index=True)
-
-                st.markdown("---")
+                    basic_info_cols = ['Name', 'Age', 'Position_Category', 'Overall_Rating', 'Talent_Score_Normalized']
+                    basic_df = selected_for_profile[basic_info_cols].copy()
+                    basic_df.columns = ['선수명', '나이', '포지션', '종합능력', '유망주점수']
+                    basic_df = basic_df.round(2)
+                    st.dataframe(basic_df, use_container_width=True, hide_index=True)
+
+                    st.markdown("---")
+
+                    # 같은 선수 조합/테마의 차트는 캐시된 Figure를 재사용 (데이터셋 파일이 바뀌면 새 키)
+                    profile_uid_column = 'UID' if 'UID' in selected_for_profile.columns else 'Name'
+                    profile_key = (
+                        selected_dataset,
+                        dataset_version,
+                        tuple(selected_for_profile[profile_uid_column].tolist()),
+                        st.get_option("theme.base"),
+                    )
 
-                # 5개 대분류 레이더 차트 비교
-                st.subheader("🕸️ 5대 분류 능력치 비교")
+                    # 5개 대분류 레이더 차트 비교
+                    st.subheader("🕸️ 5대 분류 능력치 비교")
                 
-                categories = ['Attacking', 'Defending', 'Technical', 'Mental', 'Physical']
-                attacking_attrs = ['Finishing', 'LongShots', 'Heading', 'OffTheBall']
-                defending_attrs = ['Marking', 'Tackling', 'Positioning', 'Anticipation']
-                technical_attrs = ['Dribbling', 'Passing', 'FirstTouch', 'Technique', 'Crossing']
-                mental_attrs = ['Composure', 'Vision', 'Decisions', 'Determination', 'Workrate']
-                physical_attrs = ['Pace', 'Acceleration', 'Stamina', 'Strength', 'Agility']
+                    # 5대 분류 점수는 process_all에서 미리 계산된 컬럼을 그대로 조회
+                    categories = list(processor.PROFILE_COLUMNS)
+                    profile_values = selected_for_profile[list(processor.PROFILE_COLUMNS.values())].to_numpy(dtype=float)
+                    all_player_values = [
+                        {'name': name, 'values': values.tolist()}
+                        for name, values in zip(selected_for_profile['Name'], profile_values)
+                    ]
                 
-                colors_profile = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
+                    col_radar, col_bar = st.columns([1, 1])
                 
-                col_radar, col_bar = st.columns([1, 1])
-                
-                with col_radar:
-                    fig_radar_compare = go.Figure()
-                    
-                    all_player_values = []
-                    for idx, (_, player_row) in enumerate(selected_for_profile.iterrows()):
-                        values = [
-                            player_row[[a for a in attacking_attrs if a in df_filtered.columns]].mean(),
-                            player_row[[a for a in defending_attrs if a in df_filtered.columns]].mean(),
-                            player_row[[a for a in technical_attrs if a in df_filtered.columns]].mean(),
-                            player_row[[a for a in mental_attrs if a in df_filtered.columns]].mean(),
-                            player_row[[a for a in physical_attrs if a in df_filtered.columns]].mean()
-                        ]
-                        all_player_values.append({'name': player_row['Name'], 'values': values})
-                        
-                        fig_radar_compare.add_trace(go.Scatterpolar(
-                            r=values,
-                            theta=categories,
-                            fill='toself',
-                            name=player_row['Name'],
-                            line_color=colors_profile[idx % 5],
-                            fillcolor=f'rgba{tuple(list(int(colors_profile[idx % 5][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}',
-                            line_width=2
-                        ))
-                    
-                    fig_radar_compare.update_layout(
-                        polar=dict(
-                            bgcolor='rgba(240,240,240,0.5)',
-                            radialaxis=dict(
-                                visible=True,
-                                range=[0, 20],
-                                tickmode='linear',
-                                tick0=0,
-                                dtick=5
-                            )
-                        ),
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
-                        height=450,
-                        title="5대 분류 레이더 차트"
-                    )
-                    
-                    st.plotly_chart(fig_radar_compare, use_container_width=True)
+                    with col_radar:
+                        fig_radar_compare = cached_figure(
+                            profile_key + ('category_radar',),
+                            lambda: build_category_radar(all_player_values, categories)
+                        )
+                        st.plotly_chart(fig_radar_compare, use_container_width=True)
                 
-                with col_bar:
-                    # 그룹 바 차트로 5대 분류 비교
-                    fig_bar_5cat = go.Figure()
-                    
-                    for pv in all_player_values:
-                        fig_bar_5cat.add_trace(go.Bar(
-                            name=pv['name'],
-                            x=categories,
-                            y=pv['values'],
-                            text=[f'{v:.1f}' for v in pv['values']],
-                            textposition='auto'
-                        ))
-                    
-                    fig_bar_5cat.update_layout(
-                        barmode='group',
-                        height=450,
-                        yaxis=dict(range=[0, 20], title="점수"),
-                        xaxis_title="분류",
-                        title="5대 분류 바 차트 비교",
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5)
-                    )
-                    
-                    st.plotly_chart(fig_bar_5cat, use_container_width=True)
-
-                st.markdown("---")
-
-                # 포지션별 핵심 스텟 비교
-                st.subheader("🎯 핵심 스텟 비교")
+                    with col_bar:
+                        # 그룹 바 차트로 5대 분류 비교
+                        fig_bar_5cat = cached_figure(
+                            profile_key + ('category_bar',),
+                            lambda: build_category_bar(all_player_values, categories)
+                        )
+                        st.plotly_chart(fig_bar_5cat, use_container_width=True)
+
+                    st.markdown("---")
+
+                    # 포지션별 핵심 스텟 비교
+                    st.subheader("🎯 핵심 스텟 비교")
                 
-                # 첫 번째 선수의 포지션 기준으로 핵심 스텟 결정
-                first_position = selected_for_profile.iloc[0]['Position_Category']
+                    # 첫 번째 선수의 포지션 기준으로 핵심 스텟 결정
+                    first_position = selected_for_profile.iloc[0]['Position_Category']
                 
-                if first_position == 'Goalkeeper':
-                    key_attrs = ['Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility']
-                elif first_position == 'Defender':
-                    key_attrs = ['Marking', 'Tackling', 'Heading', 'Positioning', 'Strength', 'Pace']
-                elif first_position == 'Midfielder':
-                    key_attrs = ['Passing', 'Vision', 'Technique', 'Stamina', 'Workrate', 'FirstTouch']
-                else:  # Forward
-                    key_attrs = ['Finishing', 'Dribbling', 'Pace', 'Acceleration', 'Composure', 'OffTheBall']
+                    if first_position == 'Goalkeeper':
+                        key_attrs = ['Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility']
+                    elif first_position == 'Defender':
+                        key_attrs = ['Marking', 'Tackling', 'Heading', 'Positioning', 'Strength', 'Pace']
+                    elif first_position == 'Midfielder':
+                        key_attrs = ['Passing', 'Vision', 'Technique', 'Stamina', 'Workrate', 'FirstTouch']
+                    else:  # Forward
+                        key_attrs = ['Finishing', 'Dribbling', 'Pace', 'Acceleration', 'Composure', 'OffTheBall']
                 
-                key_attrs = [a for a in key_attrs if a in df_filtered.columns]
+                    key_attrs = [a for a in key_attrs if a in df_filtered.columns]
                 
-                col_key_radar, col_key_bar = st.columns([1, 1])
+                    col_key_radar, col_key_bar = st.columns([1, 1])
                 
-                with col_key_radar:
-                    fig_key_radar = go.Figure()
-                    
-                    for idx, (_, player_row) in enumerate(selected_for_profile.iterrows()):
-                        key_values = [player_row[attr] for attr in key_attrs]
-                        
-                        fig_key_radar.add_trace(go.Scatterpolar(
-                            r=key_values,
-                            theta=key_attrs,
-                            fill='toself',
-                            name=player_row['Name'],
-                            line_color=colors_profile[idx % 5],
-                            fillcolor=f'rgba{tuple(list(int(colors_profile[idx % 5][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}',
-                            line_width=2
-                        ))
-                    
-                    fig_key_radar.update_layout(
-                        polar=dict(
-                            bgcolor='rgba(240,240,240,0.5)',
-                            radialaxis=dict(visible=True, range=[0, 20])
-                        ),
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
-                        height=450,
-                        title=f"{first_position} 핵심 스텟 레이더"
-                    )
-                    
-                    st.plotly_chart(fig_key_radar, use_container_width=True)
+                    with col_key_radar:
+                        fig_key_radar = cached_figure(
+                            profile_key + ('key_radar',),
+                            lambda: build_key_stat_radar(selected_for_profile, key_attrs, first_position)
+                        )
+                        st.plotly_chart(fig_key_radar, use_container_width=True)
                 
-                with col_key_bar:
-                    fig_key_bar = go.Figure()
-                    
-                    for idx, (_, player_row) in enumerate(selected_for_profile.iterrows()):
-                        key_values = [player_row[attr] for attr in key_attrs]
-                        
-                        fig_key_bar.add_trace(go.Bar(
-                            name=player_row['Name'],
-                            x=key_attrs,
-                            y=key_values,
-                            text=[f'{v:.1f}' for v in key_values],
-                            textposition='auto'
-                        ))
-                    
-                    fig_key_bar.update_layout(
-                        barmode='group',
-                        height=450,
-                        yaxis=dict(range=[0, 20], title="점수"),
-                        xaxis_title="능력치",
-                        title=f"{first_position} 핵심 스텟 바 차트",
-                        showlegend=True,
-                        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5)
-                    )
-                    
-                    st.plotly_chart(fig_key_bar, use_container_width=True)
+                    with col_key_bar:
+                        fig_key_bar = cached_figure(
+                            profile_key + ('key_bar',),
+                            lambda: build_key_stat_bar(selected_for_profile, key_attrs, first_position)
+                        )
+                        st.plotly_chart(fig_key_bar, use_container_width=True)
 
-                st.markdown("---")
+                    st.markdown("---")
 
-                # 상세 능력치 비교 테이블
-                st.subheader("📊 상세 능력치 비교")
+                    # 상세 능력치 비교 테이블
+                    st.subheader("📊 상세 능력치 비교")
                 
-                tab_tech, tab_mental, tab_phys = st.tabs(["⚙️ 기술 능력치", "🧠 정신 능력치", "💪 신체 능력치"])
+                    tab_tech, tab_mental, tab_phys = st.tabs(["⚙️ 기술 능력치", "🧠 정신 능력치", "💪 신체 능력치"])
                 
-                with tab_tech:
-                    tech_cols = [c for c in processor.TECHNICAL_ATTRIBUTES if c in df_filtered.columns]
-                    tech_compare_df = selected_for_profile[['Name'] + tech_cols].copy()
-                    tech_compare_df = tech_compare_df.set_index('Name').T
-                    tech_compare_df = tech_compare_df.round(1)
-                    tech_compare_df.index.name = '능력치'
-                    st.dataframe(tech_compare_df, use_container_width=True, height=400)
+                    with tab_tech:
+                        tech_cols = [c for c in processor.TECHNICAL_ATTRIBUTES if c in df_filtered.columns]
+                        tech_compare_df = selected_for_profile[['Name'] + tech_cols].copy()
+                        tech_compare_df = tech_compare_df.set_index('Name').T
+                        tech_compare_df = tech_compare_df.round(1)
+                        tech_compare_df.index.name = '능력치'
+                        st.dataframe(tech_compare_df, use_container_width=True, height=400)
                     
-                    # 기술 능력치 히트맵
-                    fig_tech_heat = px.imshow(
-                        tech_compare_df.values,
-                        labels=dict(x="선수", y="능력치", color="점수"),
-                        x=tech_compare_df.columns.tolist(),
-                        y=tech_compare_df.index.tolist(),
-                        color_continuous_scale='RdBu',
-                        title="기술 능력치 히트맵"
-                    )
-                    fig_tech_heat.update_layout(height=500)
-                    st.plotly_chart(fig_tech_heat, use_container_width=True)
+                        # 기술 능력치 히트맵
+                        fig_tech_heat = cached_figure(
+                            profile_key + ('technical_heatmap',),
+                            lambda: build_attribute_heatmap(tech_compare_df, 'RdBu', "기술 능력치 히트맵", 500)
+                        )
+                        st.plotly_chart(fig_tech_heat, use_container_width=True)
                 
-                with tab_mental:
-                    mental_cols = [c for c in processor.MENTAL_ATTRIBUTES if c in df_filtered.columns]
-                    mental_compare_df = selected_for_profile[['Name'] + mental_cols].copy()
-                    mental_compare_df = mental_compare_df.set_index('Name').T
-                    mental_compare_df = mental_compare_df.round(1)
-                    mental_compare_df.index.name = '능력치'
-                    st.dataframe(mental_compare_df, use_container_width=True, height=400)
+                    with tab_mental:
+                        mental_cols = [c for c in processor.MENTAL_ATTRIBUTES if c in df_filtered.columns]
+                        mental_compare_df = selected_for_profile[['Name'] + mental_cols].copy()
+                        mental_compare_df = mental_compare_df.set_index('Name').T
+                        mental_compare_df = mental_compare_df.round(1)
+                        mental_compare_df.index.name = '능력치'
+                        st.dataframe(mental_compare_df, use_container_width=True, height=400)
                     
-                    # 정신 능력치 히트맵
-                    fig_mental_heat = px.imshow(
-                        mental_compare_df.values,
-                        labels=dict(x="선수", y="능력치", color="점수"),
-                        x=mental_compare_df.columns.tolist(),
-                        y=mental_compare_df.index.tolist(),
-                        color_continuous_scale='RdYlGn',
-                        title="정신 능력치 히트맵"
-                    )
-                    fig_mental_heat.update_layout(height=500)
-                    st.plotly_chart(fig_mental_heat, use_container_width=True)
+                        # 정신 능력치 히트맵
+                        fig_mental_heat = cached_figure(
+                            profile_key + ('mental_heatmap',),
+                            lambda: build_attribute_heatmap(mental_compare_df, 'RdYlGn', "정신 능력치 히트맵", 500)
+                        )
+                        st.plotly_chart(fig_mental_heat, use_container_width=True)
                 
-                with tab_phys:
-                    phys_cols = [c for c in processor.PHYSICAL_ATTRIBUTES if c in df_filtered.columns]
-                    phys_compare_df = selected_for_profile[['Name'] + phys_cols].copy()
-                    phys_compare_df = phys_compare_df.set_index('Name').T
-                    phys_compare_df = phys_compare_df.round(1)
-                    phys_compare_df.index.name = '능력치'
-                    st.dataframe(phys_compare_df, use_container_width=True, height=300)
+                    with tab_phys:
+                        phys_cols = [c for c in processor.PHYSICAL_ATTRIBUTES if c in df_filtered.columns]
+                        phys_compare_df = selected_for_profile[['Name'] + phys_cols].copy()
+                        phys_compare_df = phys_compare_df.set_index('Name').T
+                        phys_compare_df = phys_compare_df.round(1)
+                        phys_compare_df.index.name = '능력치'
+                        st.dataframe(phys_compare_df, use_container_width=True, height=300)
                     
-                    # 신체 능력치 히트맵
-                    fig_phys_heat = px.imshow(
-                        phys_compare_df.values,
-                        labels=dict(x="선수", y="능력치", color="점수"),
-                        x=phys_compare_df.columns.tolist(),
-                        y=phys_compare_df.index.tolist(),
-                        color_continuous_scale='RdYlGn',
-                        title="신체 능력치 히트맵"
-                    )
-                    fig_phys_heat.update_layout(height=400)
-                    st.plotly_chart(fig_phys_heat, use_container_width=True)
+                        # 신체 능력치 히트맵
+                        fig_phys_heat = cached_figure(
+                            profile_key + ('physical_heatmap',),
+                            lambda: build_attribute_heatmap(phys_compare_df, 'RdYlGn', "신체 능력치 히트맵", 400)
+                        )
+                        st.plotly_chart(fig_phys_heat, use_container_width=True)
 
-                st.markdown("---")
+                    st.markdown("---")
 
-                # 종합 점수 비교 바 차트
-                st.subheader("🏆 종합 점수 비교")
-                
-                score_cols = ['Name', 'Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating', 'Talent_Score_Normalized']
-                score_df = selected_for_profile[score_cols].copy()
-                
-                fig_score = go.Figure()
+                    # 종합 점수 비교 바 차트
+                    st.subheader("🏆 종합 점수 비교")
                 
-                for _, row in score_df.iterrows():
-                    fig_score.add_trace(go.Bar(
-                        name=row['Name'],
-                        x=['종합능력', '기술', '정신', '신체', '유망주점수'],
-                        y=[row['Overall_Rating'], row['Technical_Rating'], row['Mental_Rating'], 
-                           row['Physical_Rating'], row['Talent_Score_Normalized'] / 5],  # 유망주점수 스케일 조정
-                        text=[f'{row["Overall_Rating"]:.1f}', f'{row["Technical_Rating"]:.1f}', 
-                              f'{row["Mental_Rating"]:.1f}', f'{row["Physical_Rating"]:.1f}',
-                              f'{row["Talent_Score_Normalized"]:.1f}'],
-                        textposition='auto'
-                    ))
+                    score_cols = ['Name', 'Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating', 'Talent_Score_Normalized']
+                    score_df = selected_for_profile[score_cols].copy()
                 
-                fig_score.update_layout(
-                    barmode='group',
-                    height=500,
-                    margin=dict(t=30, b=120, l=50, r=50),
-                    yaxis=dict(range=[0, 25], title="점수"),
-                    xaxis_title="분류",
-                    showlegend=True,
-                    legend=dict(orientation="h", yanchor="top", y=-0.15, xanchor="center", x=0.5)
-                )
-                
-                st.plotly_chart(fig_score, use_container_width=True)
-                st.caption("※ 유망주점수는 0-100 범위를 0-20 스케일로 조정하여 표시")
+                    fig_score = cached_figure(profile_key + ('score_bar',), lambda: build_score_bar(score_df))
+                    st.plotly_chart(fig_score, use_container_width=True)
+                    st.caption("※ 유망주점수는 0-100 범위를 0-20 스케일로 조정하여 표시")
+
+    # 검색/탭 영역도 fragment로 감싸 검색·선택 추가·선택 초기화 시 사이드바·필터 체인·메트릭은 다시 실행하지 않고
+    # 이 영역(안쪽 fragment 포함)만 재실행 (df_filtered 등 입력은 마지막 전체 실행 결과를 그대로 사용)
+    @st.fragment
+    def player_panels():
+        # 세션 스테이트 초기화 (선수 선택 저장용)
+        if 'clicked_players' not in st.session_state:
+            st.session_state.clicked_players = []
+
+        # 이름 검색 (필터 밖의 선수도 찾아 선택 목록에 추가)
+        col_query, col_match, col_add = st.columns([2, 3, 1], vertical_alignment='bottom')
+        with col_query:
+            query = st.text_input("🔎 선수 이름 검색", key='name_search_query',
+                                  placeholder="예: lukasz, Son, van dijk", on_change=_reset_name_search_match)
+        with timed('player_dashboard.name_search'):
+            matches = search_result_rows([row_id for row_id, _ in name_index.search(query)]) if query else None
+        # 동명이인도 구분되도록 UID로 선택하고 나이/포지션을 함께 표시
+        suggestions = {} if matches is None else {
+            uid: f"{name} ({int(age)}세, {position})"
+            for uid, name, age, position in zip(matches['UID'].tolist(), matches['Name'], matches['Age'],
+                                                matches['Position_Category'])
+        }
+        with col_match:
+            match_uid = st.selectbox("검색 결과", options=list(suggestions), format_func=suggestions.get,
+                                     key='name_search_match', disabled=not suggestions,
+                                     placeholder="검색 결과 없음" if query else "이름을 입력하세요")
+        with col_add:
+            st.button("➕ 선택에 추가", use_container_width=True, disabled=match_uid is None,
+                      on_click=_add_clicked_player, args=(match_uid,))
+
+        # 탭 구성
+        tab1, tab4 = st.tabs([
+            "🎯 선수 발굴 (Scatter)",
+            # "📊 선수 비교 (Parallel)",
+            # "🏆 상위 유망주",
+            "👤 선수 프로필"
+        ])
+
+        # 탭 1: 선수 발굴 (Scatter Plot)
+        with tab1:
+            if len(df_filtered) == 0:
+                st.warning("⚠️ 필터 조건에 맞는 선수가 없습니다. 필터를 조정해주세요.")
+            else:
+                st.header("🎯 선수 발굴 - 차트에서 클릭하여 분석")
+
+                # 필터 요약 및 리셋 버튼
+                col_info, col_reset = st.columns([4, 1])
+
+                with col_info:
+                    if selected_position != 'All':
+                        st.info(
+                            f"📌 **{selected_position}** 포지션 {len(df_filtered):,}명 | 💡 **왼쪽 차트에서 선수를 클릭**하면 오른쪽에 능력치가 표시됩니다!")
+                    else:
+                        st.info(f"📌 전체 포지션 {len(df_filtered):,}명 | 💡 **왼쪽 차트에서 선수를 클릭**하면 오른쪽에 능력치가 표시됩니다!")
+
+                with col_reset:
+                    # 콜백에서 초기화하므로 별도 rerun 없이 fragment 재실행에 바로 반영
+                    st.button("🔄 선택 초기화", use_container_width=True, on_click=_reset_clicked_players)
+
+                st.markdown("---")
+
+                # 메인 레이아웃: 왼쪽 순위 바 차트, 오른쪽 레이더 차트 (동일 비율)
+                col_ranking, col_radar = st.columns([1, 1])
+
+                # 왼쪽: 실시간 순위 바 차트
+                with col_ranking:
+                    ranking_panel()
+
+                # 오른쪽: 레이더 차트
+                with col_radar:
+                    radar_panel()
+
+        # 탭 2: 선수 비교 (Parallel Coordinates)
+        # with tab2:
+        #     st.header("📊 선수 비교 - 평행 좌표계")
+        #
+        #     # 선택된 선수가 없으면 안내 메시지
+        #     if len(st.session_state.clicked_players) == 0:
+        #         st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
+        #         st.info("👈 **선수 발굴** 탭에서 비교할 선수를 클릭하면 여기서 비교할 수 있습니다.")
+        #     else:
+        #         # 선택된 선수들만 필터링
+        #         top_compare = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)]
+        #
+        #         if len(top_compare) == 0:
+        #             st.warning("⚠️ 선택된 선수가 현재 필터 조건에 맞지 않습니다.")
+        #         else:
+        #             st.info(
+        #                 f"💡 **선택된 {len(top_compare)}명의 선수**를 평행 좌표계로 비교합니다. "
+        #                 "각 축에서 드래그하여 범위를 지정하면 해당 조건에 맞는 선수만 필터링됩니다."
+        #             )
+        #
+        #             # 포지션별 핵심 스텟 선택
+        #             if selected_position == 'Goalkeeper':
+        #                 compare_attrs = ['Reflexes', 'Handling', 'OneOnOnes', 'CommandOfArea', 'Kicking', 'Agility',
+        #                                  'Talent_Score_Normalized']
+        #             elif selected_position == 'Defender':
+        #                 compare_attrs = ['Marking', 'Tackling', 'Heading', 'Positioning', 'Pace', 'Strength',
+        #                                  'Anticipation', 'Talent_Score_Normalized']
+        #             elif selected_position == 'Midfielder':
+        #                 compare_attrs = ['Passing', 'Vision', 'Technique', 'Stamina', 'Workrate', 'Dribbling',
+        #                                  'FirstTouch', 'Talent_Score_Normalized']
+        #             elif selected_position == 'Forward':
+        #                 compare_attrs = ['Finishing', 'Dribbling', 'Pace', 'Acceleration', 'Composure', 'OffTheBall',
+        #                                  'Technique', 'Talent_Score_Normalized']
+        #             else:
+        #                 compare_attrs = ['Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating',
+        #                                  'Pace', 'Passing', 'Finishing', 'Talent_Score_Normalized']
+        #
+        #             # 존재하는 컬럼만 사용
+        #             compare_attrs = [a for a in compare_attrs if a in top_compare.columns]
+        #
+        #             # 데이터 준비
+        #             compare_data = top_compare[compare_attrs + ['Name', 'Position_Category']].copy()
+        #
+        #             # 선수별 색상 정의
+        #             player_colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
+        #
+        #             # 라인 차트 기반 평행좌표계 (hover 지원)
+        #             fig_parallel = go.Figure()
+        #
+        #             # 각 축의 범위 계산
+        #             attr_ranges = {}
+        #             for attr in compare_attrs:
+        #                 attr_ranges[attr] = {
+        #                     'min': top_compare[attr].min(),
+        #                     'max': top_compare[attr].max()
+        #                 }
+        #
+        #             # 정규화 함수 (0-1 범위로)
+        #             def normalize_value(value, attr):
+        #                 min_val = attr_ranges[attr]['min']
+        #                 max_val = attr_ranges[attr]['max']
+        #                 if max_val == min_val:
+        #                     return 0.5
+        #                 return (value - min_val) / (max_val - min_val)
+        #
+        #             # 각 선수별 라인 추가
+        #             for idx, (_, player_row) in enumerate(top_compare.iterrows()):
+        #                 player_name = player_row['Name']
+        #
+        #                 # 정규화된 y값
+        #                 y_values = [normalize_value(player_row[attr], attr) for attr in compare_attrs]
+        #
+        #                 # 실제 값 (hover용)
+        #                 actual_values = [player_row[attr] for attr in compare_attrs]
+        #
+        #                 fig_parallel.add_trace(go.Scatter(
+        #                     x=compare_attrs,
+        #                     y=y_values,
+        #                     mode='lines+markers',
+        #                     name=player_name,
+        #                     line=dict(color=player_colors[idx % len(player_colors)], width=3),
+        #                     marker=dict(size=10, color=player_colors[idx % len(player_colors)]),
+        #                     customdata=[[actual_values[i]] for i in range(len(compare_attrs))],
+        #                     hovertemplate='<b>%{customdata[0]:.1f}</b><extra></extra>'
+        #                 ))
+        #
+        #             # x축 레이블 설정
+        #             fig_parallel.update_layout(
+        #                 title=f'선택된 {len(top_compare)}명 선수 비교 - {selected_position if selected_position != "All" else "전체 포지션"}',
+        #                 height=500,
+        #                 margin=dict(l=50, r=50, t=80, b=120),
+        #                 xaxis=dict(
+        #                     tickangle=45,
+        #                     tickfont=dict(size=11)
+        #                 ),
+        #                 yaxis=dict(
+        #                     title='정규화된 값 (0-1)',
+        #                     range=[-0.05, 1.05],
+        #                     showgrid=True,
+        #                     gridcolor='lightgray'
+        #                 ),
+        #                 legend=dict(
+        #                     orientation="h",
+        #                     yanchor="top",
+        #                     y=-0.25,
+        #                     xanchor="center",
+        #                     x=0.5
+        #                 ),
+        #                 hovermode='x unified',
+        #                 hoverlabel=dict(
+        #                     bgcolor='rgba(240,240,240,0.5)',
+        #                     font_size=12,
+        #                     namelength=-1
+        #                 )
+        #             )
+        #
+        #             # 각 축에 실제 범위 표시 (상단/하단에 주석)
+        #             for i, attr in enumerate(compare_attrs):
+        #                 # 최대값 표시 (상단)
+        #                 fig_parallel.add_annotation(
+        #                     x=attr, y=1.08,
+        #                     text=f"{attr_ranges[attr]['max']:.1f}",
+        #                     showarrow=False,
+        #                     font=dict(size=9, color='gray')
+        #                 )
+        #                 # 최소값 표시 (하단)
+        #                 fig_parallel.add_annotation(
+        #                     x=attr, y=-0.08,
+        #                     text=f"{attr_ranges[attr]['min']:.1f}",
+        #                     showarrow=False,
+        #                     font=dict(size=9, color='gray')
+        #                 )
+        #
+        #             st.plotly_chart(fig_parallel, use_container_width=True)
+        #
+        #             st.caption("💡 **Tip**: 마우스를 라인 위에 올리면 선수 이름과 해당 능력치 값을 확인할 수 있습니다.")
+        #
+        #             # 비교 대상 선수 리스트
+        #             st.subheader("📋 비교 대상 선수 목록")
+        #
+        #             # 중복 컬럼 제거 (Age가 compare_attrs에 이미 포함됨)
+        #             base_cols = ['Name', 'Position_Category']
+        #             display_cols = base_cols + [col for col in compare_attrs if col not in base_cols]
+        #             display_df = top_compare[display_cols].copy()
+        #             display_df = display_df.round(2)
+        #
+        #             st.dataframe(display_df, use_container_width=True, height=300)
+        #
+        #             # 선수별 상세 비교
+        #             st.markdown("---")
+        #             st.subheader("🔍 선수별 상세 비교")
+        #
+        #             # 2-3명 선택하여 레이더 차트로 직접 비교
+        #             selected_players_tab2 = st.multiselect(
+        #                 "비교할 선수 선택 (최대 3명)",
+        #                 options=top_compare['Name'].tolist(),
+        #                 default=top_compare['Name'].tolist()[:min(3, len(top_compare))],
+        #                 max_selections=3,
+        #                 help="선택한 선수들의 능력치를 레이더 차트로 비교합니다"
+        #             )
+        #
+        #             if len(selected_players_tab2) > 0:
+        #                 col1, col2 = st.columns(2)
+        #
+        #                 with col1:
+        #                     # 5개 대분류 레이더 차트
+        #                     st.markdown("#### 능력치 프로필 비교 (5개 대분류)")
+        #
+        #                     fig_compare_radar = go.Figure()
+        #
+        #                     categories = ['공격력', '수비력', '기술', '멘탈', '신체']
+        #                     colors = ['#636EFA', '#EF553B', '#00CC96']
+        #
+        #                     for idx, player_name in enumerate(selected_players_tab2):
+        #                         player_data = top_compare[top_compare['Name'] == player_name].iloc[0]
+        #
+        #                         attacking_attrs = ['Finishing', 'LongShots', 'Heading', 'OffTheBall']
+        #                         defending_attrs = ['Marking', 'Tackling', 'Positioning', 'Anticipation']
+        #                         technical_attrs = ['Dribbling', 'Passing', 'FirstTouch', 'Technique', 'Crossing']
+        #                         mental_attrs = ['Composure', 'Vision', 'Decisions', 'Determination', 'Workrate']
+        #                         physical_attrs = ['Pace', 'Acceleration', 'Stamina', 'Strength', 'Agility']
+        #
+        #                         values = [
+        #                             player_data[[a for a in attacking_attrs if a in df_filtered.columns]].mean(),
+        #                             player_data[[a for a in defending_attrs if a in df_filtered.columns]].mean(),
+        #                             player_data[[a for a in technical_attrs if a in df_filtered.columns]].mean(),
+        #                             player_data[[a for a in mental_attrs if a in df_filtered.columns]].mean(),
+        #                             player_data[[a for a in physical_attrs if a in df_filtered.columns]].mean()
+        #                         ]
+        #
+        #                         fig_compare_radar.add_trace(go.Scatterpolar(
+        #                             r=values,
+        #                             theta=categories,
+        #                             fill='toself',
+        #                             name=player_name,
+        #                             line_color=colors[idx % 3],
+        #                             fillcolor=f'rgba{tuple(list(int(colors[idx % 3][i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}'
+        #                         ))
+        #
+        #                     fig_compare_radar.update_layout(
+        #                         polar=dict(
+        #                             radialaxis=dict(
+        #                                 visible=True,
+        #                                 range=[0, 20]
+        #                             )
+        #                         ),
+        #                         height=500,
+        #                         showlegend=True
+        #                     )
+        #
+        #                     st.plotly_chart(fig_compare_radar, use_container_width=True)
+        #
+        #                 with col2:
+        #                     # 포지션별 핵심 스텟 비교 바 차트
+        #                     st.markdown("#### 핵심 스텟 비교")
+        #
+        #                     # 포지션별 핵심 스텟 3-4개 선택
+        #                     if selected_position == 'Goalkeeper':
+        #                         key_stats = ['Reflexes', 'Handling', 'OneOnOnes', 'Kicking']
+        #                     elif selected_position == 'Defender':
+        #                         key_stats = ['Marking', 'Tackling', 'Pace', 'Strength']
+        #                     elif selected_position == 'Midfielder':
+        #                         key_stats = ['Passing', 'Vision', 'Stamina', 'Technique']
+        #                     elif selected_position == 'Forward':
+        #                         key_stats = ['Finishing', 'Pace', 'Dribbling', 'Composure']
+        #                     else:
+        #                         key_stats = ['Overall_Rating', 'Technical_Rating', 'Mental_Rating', 'Physical_Rating']
+        #
+        #                     # 존재하는 컬럼만 사용
+        #                     key_stats = [s for s in key_stats if s in top_compare.columns]
+        #
+        #                     fig_bar_compare = go.Figure()
+        #
+        #                     for player_name in selected_players_tab2:
+        #                         player_data = top_compare[top_compare['Name'] == player_name].iloc[0]
+        #                         values = [player_data[stat] for stat in key_stats]
+        #
+        #                         fig_bar_compare.add_trace(go.Bar(
+        #                             name=player_name,
+        #                             x=key_stats,
+        #                             y=values,
+        #                             text=[f'{v:.1f}' for v in values],
+        #                             textposition='auto'
+        #                         ))
+        #
+        #                     fig_bar_compare.update_layout(
+        #                         barmode='group',
+        #                         height=500,
+        #                         yaxis=dict(range=[0, 20]),
+        #                         xaxis_title="능력치",
+        #                         yaxis_title="수치",
+        #                         showlegend=True
+        #                     )
+        #
+        #                     st.plotly_chart(fig_bar_compare, use_container_width=True)
+
+        # 탭 3: 상위 유망주
+        # with tab3:
+        #     st.header("🏆 선택된 유망주 랭킹")
+        #
+        #     # 선택된 선수가 없으면 안내 메시지
+        #     if len(st.session_state.clicked_players) == 0:
+        #         st.warning("⚠️ 선수 발굴 탭에서 선수를 먼저 선택해주세요.")
+        #         st.info("👈 **선수 발굴** 탭에서 유망주를 클릭하면 여기서 상세 정보를 볼 수 있습니다.")
+        #     else:
+        #         # 선택된 선수들만 필터링
+        #         selected_talents = df_filtered[df_filtered['Name'].isin(st.session_state.clicked_players)]
+        #
+        #         if len(selected_talents) == 0:
+        #             st.warning("⚠️ 선택된 선수가 현재 필터 조건에 맞지 않습니다.")
+        #         else:
+        #             st.subheader(f"선택된 {len(selected_talents)}명의 유망주")
+        #
+        #             # 선택된 선수들 바 차트
+        #             fig_bar = px.bar(
+        #                 selected_talents.sort_values('Talent_Score_Normalized', ascending=True),
+        #                 x='Talent_Score_Normalized',
+        #                 y='Name',
+        #                 orientation='h',
+        #                 color='Age',
+        #                 title='선택된 유망주 순위',
+        #                 labels={
+        #                     'Talent_Score_Normalized': '유망주 점수',
+        #                     'Name': '선수명',
+        #                     'Age': '나이'
+        #                 },
+        #                 color_continuous_scale='RdYlGn_r',
+        #                 hover_data=['Position_Category', 'Overall_Rating']
+        #             )
+        #
+        #             fig_bar.update_layout(
+        #                 height=max(300, len(selected_talents) * 50),
+        #                 yaxis={'categoryorder': 'total ascending'}
+        #             )
+        #
+        #             st.plotly_chart(fig_bar, use_container_width=True)
+        #
+        #             # 상위 유망주 테이블
+        #             st.subheader("선택된 유망주 상세 리스트")
+        #
+        #             display_cols = [
+        #                 'Name', 'Age', 'Position_Category', 'Overall_Rating',
+        #                 'Technical_Rating', 'Mental_Rating', 'Physical_Rating',
+        #                 'Talent_Score_Normalized'
+        #             ]
+        #
+        #             display_df = selected_talents[display_cols].copy()
+        #             display_df.columns = [
+        #                 '이름', '나이', '포지션', '종합능력치',
+        #                 '기술', '정신', '신체', '유망주점수'
+        #             ]
+        #
+        #             # 숫자 포맷팅
+        #             for col in ['종합능력치', '기술', '정신', '신체', '유망주점수']:
+        #                 display_df[col] = display_df[col].round(2)
+        #
+        #             st.dataframe(
+        #                 display_df.sort_values('유망주점수', ascending=False),
+        #                 use_container_width=True,
+        #                 height=400
+        #             )
+        #
+        #             # CSV 다운로드
+        #             csv = selected_talents.to_csv(index=False).encode('utf-8-sig')
+        #             st.download_button(
+        #                 label="📥 선택된 유망주 데이터 다운로드 (CSV)",
+        #                 data=csv,
+        #                 file_name='selected_talents.csv',
+        #                 mime='text/csv',
+        #             )
+
+        # 탭 4: 선수 프로필 (상세 분석)
+        with tab4:
+            profile_panel()
+
+    player_panels()
+
+    # 순위 내보내기 (백그라운드 작업, 같은 조건의 파일은 캐시에서 바로 제공)
+    st.markdown("---")
+    show_export_panel(
+        df, processor, df_filtered, metadata.total_rows, selected_dataset, dataset_version,
+        (age_min, age_max), selected_position, {**stat_filters, **profile_filters}
+    )
 
     # 푸터
     st.markdown("---")
@@ -1288,3 +1297,325 @@ def show_page():
         unsafe_allow_html=True
     )
 
+
+def _reset_clicked_players():
+    """선수 선택 초기화 (버튼 콜백)"""
+    st.session_state.clicked_players = []
+    # 클릭 컴포넌트는 마지막 클릭을 계속 반환하므로, 초기화 후 같은 막대를 다시 클릭해도 새 클릭으로 처리
+    st.session_state.pop('last_ranking_click', None)
+
+
+def _reset_name_search_match():
+    """검색어가 바뀌면 이전 검색 결과 선택을 지워 새 결과의 첫 번째 선수가 기본 선택되도록 함 (입력 콜백)"""
+    st.session_state.pop('name_search_match', None)
+
+
+def _add_clicked_player(player_uid):
+    """검색한 선수(UID)를 선택 목록에 추가 (버튼 콜백, 차트 클릭과 같이 최대 5명)"""
+    clicked_players = st.session_state.clicked_players
+    if player_uid is None or player_uid in clicked_players:
+        return
+    if len(clicked_players) >= 5:
+        clicked_players.pop(0)
+    clicked_players.append(player_uid)
+
+
+EXPORT_FORMAT_LABELS = {'csv': 'CSV', 'parquet': 'Parquet', 'xlsx': 'Excel (XLSX)'}
+
+
+def show_export_panel(df, processor, df_filtered, total_rows, dataset_name, dataset_version, age_range, position,
+                      filters):
+    """
+    순위 내보내기 패널
+
+    파일 생성은 export_manager의 작업 스레드에서 chunk 단위로 진행되며,
+    진행 중에는 패널(fragment)만 1초마다 다시 실행하여 진행률을 갱신합니다.
+    SQLite 데이터셋(df가 None)은 조회 결과 DataFrame을 그대로 원본으로 사용합니다.
+    """
+    st.subheader("📥 순위 내보내기")
+
+    col_scope, col_format, col_button = st.columns([3, 2, 1])
+    with col_scope:
+        scope = st.radio(
+            "내보낼 범위",
+            options=['filter', 'top'],
+            format_func=lambda s: f"현재 필터 결과 전체 ({len(df_filtered):,}명)" if s == 'filter'
+            else "나이/포지션 조건 상위 N명",
+            horizontal=True,
+            key='export_scope'
+        )
+        top_n = None
+        if scope == 'top':
+            top_n = st.number_input("상위 N명", min_value=10, max_value=max(total_rows, 10),
+                                    value=min(1000, max(total_rows, 10)), step=100, key='export_top_n')
+    with col_format:
+        fmt = st.selectbox("파일 형식", options=available_formats(),
+                           format_func=EXPORT_FORMAT_LABELS.get, key='export_format')
+    with col_button:
+        st.write("")
+        start_clicked = st.button("내보내기", use_container_width=True, key='export_start')
+
+    if start_clicked:
+        if scope == 'filter':
+            key = export_key(dataset_name, dataset_version, scope, age_range, position, filters, fmt)
+            source = df_filtered if df is None else df
+            positions = ranking_positions(source, source.index.get_indexer(df_filtered.index))
+        else:
+            key = export_key(dataset_name, dataset_version, scope, age_range, position, int(top_n), fmt)
+            top_df = processor.get_top_talents(n=int(top_n), age_range=age_range, position=position)
+            source = top_df if df is None else df
+            positions = source.index.get_indexer(top_df.index)
+        job = export_manager.submit(source, positions, fmt, key, file_stem=f"{dataset_name}_{scope}")
+        st.session_state.export_job_id = job.id
+
+    job_id = st.session_state.get('export_job_id')
+    job = export_manager.get(job_id) if job_id else None
+    if job is None:
+        st.caption("💡 필터 조건이 같으면 이전에 만든 파일을 바로 내려받을 수 있습니다.")
+        return
+
+    @st.fragment(run_every=None if job.finished else 1)
+    def export_status():
+        if job.status == 'failed':
+            st.error(f"❌ 내보내기 실패: {job.error}")
+        elif job.status == 'done' and not os.path.exists(job.path):
+            st.warning("⚠️ 내보낸 파일이 캐시에서 정리되었습니다. 다시 내보내기를 눌러주세요.")
+        elif job.status == 'done':
+            with open(job.path, 'rb') as f:
+                st.download_button(
+                    label=f"📥 {job.file_name} 다운로드 ({job.total_rows:,}명)",
+                    data=f,
+                    file_name=job.file_name,
+                    mime=job.mime_type,
+                    key='export_download'
+                )
+        else:
+            st.progress(job.progress, text=f"파일 생성 중... {job.rows_written:,} / {job.total_rows:,}명")
+            if st.session_state.get('export_polling') != job.id:
+                st.session_state.export_polling = job.id
+        if job.finished and st.session_state.get('export_polling') == job.id:
+            # 완료 후 한 번 전체 재실행하여 진행률 갱신(run_every)을 멈춤
+            st.session_state.export_polling = None
+            st.rerun()
+
+    export_status()
+
+
+# ---------------------------------------------------------------------------
+# 선수 프로필 탭 차트 생성 함수 (선택된 선수 조합으로만 결정되므로 figure_cache로 캐싱)
+# ---------------------------------------------------------------------------
+
+PROFILE_COLORS = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A']
+
+
+def _profile_fill_color(idx):
+    color = PROFILE_COLORS[idx % 5]
+    return f'rgba{tuple(list(int(color[i:i + 2], 16) for i in (1, 3, 5)) + [0.2])}'
+
+
+def build_ranking_chart(df_display, score_column, score_label, colors_bar):
+    """선수 순위 수평 바 차트 (df_display: 표시 순서대로 Display_Name/점수 컬럼 포함)"""
+    fig_ranking = go.Figure()
+
+    fig_ranking.add_trace(go.Bar(
+        y=df_display['Display_Name'],
+        x=df_display[score_column],
+        orientation='h',
+        marker=dict(
+            color=colors_bar,
+            line=dict(width=1, color='white')
+        ),
+        text=df_display[score_column].round(1),
+        textposition='inside',
+        textfont=dict(color='white', size=11),
+        hovertemplate=(
+                "<b>%{y}</b><br>" +
+                f"{score_label}: " + "%{x:.1f}<br>" +
+                "<extra></extra>"
+        ),
+        customdata=df_display[['Name', 'Age', 'Position_Category', 'Overall_Rating']].values
+    ))
+
+    fig_ranking.update_layout(
+        height=550,
+        margin=dict(t=10, b=50, l=180, r=20),
+        xaxis=dict(
+            title=score_label,
+            range=[0, 105],
+            showgrid=True,
+            gridcolor='lightgray',
+            title_standoff=10
+        ),
+        yaxis=dict(
+            title="",
+            autorange="reversed",  # 1등이 위에
+            tickfont=dict(size=10),
+            tickmode='array',
+            tickvals=list(range(len(df_display))),
+            ticktext=df_display['Display_Name'].tolist()
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',  # 배경 투명
+        paper_bgcolor='rgba(0,0,0,0)',
+        template='plotly_dark',
+        showlegend=False
+    )
+
+    return fig_ranking
+
+
+def build_category_radar(all_player_values, categories):
+    """5대 분류 레이더 차트"""
+    fig_radar_compare = go.Figure()
+
+    for idx, pv in enumerate(all_player_values):
+        fig_radar_compare.add_trace(go.Scatterpolar(
+            r=pv['values'],
+            theta=categories,
+            fill='toself',
+            name=pv['name'],
+            line_color=PROFILE_COLORS[idx % 5],
+            fillcolor=_profile_fill_color(idx),
+            line_width=2
+        ))
+
+    fig_radar_compare.update_layout(
+        polar=dict(
+            bgcolor='rgba(240,240,240,0.5)',
+            radialaxis=dict(
+                visible=True,
+                range=[0, 20],
+                tickmode='linear',
+                tick0=0,
+                dtick=5
+            )
+        ),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        height=450,
+        title="5대 분류 레이더 차트"
+    )
+    return fig_radar_compare
+
+
+def build_category_bar(all_player_values, categories):
+    """5대 분류 그룹 바 차트"""
+    fig_bar_5cat = go.Figure()
+
+    for pv in all_player_values:
+        fig_bar_5cat.add_trace(go.Bar(
+            name=pv['name'],
+            x=categories,
+            y=pv['values'],
+            text=[f'{v:.1f}' for v in pv['values']],
+            textposition='auto'
+        ))
+
+    fig_bar_5cat.update_layout(
+        barmode='group',
+        height=450,
+        yaxis=dict(range=[0, 20], title="점수"),
+        xaxis_title="분류",
+        title="5대 분류 바 차트 비교",
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5)
+    )
+    return fig_bar_5cat
+
+
+def build_key_stat_radar(selected_for_profile, key_attrs, first_position):
+    """포지션별 핵심 스텟 레이더 차트"""
+    fig_key_radar = go.Figure()
+
+    for idx, (_, player_row) in enumerate(selected_for_profile.iterrows()):
+        key_values = [player_row[attr] for attr in key_attrs]
+
+        fig_key_radar.add_trace(go.Scatterpolar(
+            r=key_values,
+            theta=key_attrs,
+            fill='toself',
+            name=player_row['Name'],
+            line_color=PROFILE_COLORS[idx % 5],
+            fillcolor=_profile_fill_color(idx),
+            line_width=2
+        ))
+
+    fig_key_radar.update_layout(
+        polar=dict(
+            bgcolor='rgba(240,240,240,0.5)',
+            radialaxis=dict(visible=True, range=[0, 20])
+        ),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        height=450,
+        title=f"{first_position} 핵심 스텟 레이더"
+    )
+    return fig_key_radar
+
+
+def build_key_stat_bar(selected_for_profile, key_attrs, first_position):
+    """포지션별 핵심 스텟 바 차트"""
+    fig_key_bar = go.Figure()
+
+    for _, player_row in selected_for_profile.iterrows():
+        key_values = [player_row[attr] for attr in key_attrs]
+
+        fig_key_bar.add_trace(go.Bar(
+            name=player_row['Name'],
+            x=key_attrs,
+            y=key_values,
+            text=[f'{v:.1f}' for v in key_values],
+            textposition='auto'
+        ))
+
+    fig_key_bar.update_layout(
+        barmode='group',
+        height=450,
+        yaxis=dict(range=[0, 20], title="점수"),
+        xaxis_title="능력치",
+        title=f"{first_position} 핵심 스텟 바 차트",
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5)
+    )
+    return fig_key_bar
+
+
+def build_attribute_heatmap(compare_df, color_scale, title, height):
+    """능력치 × 선수 히트맵"""
+    fig_heat = px.imshow(
+        compare_df.values,
+        labels=dict(x="선수", y="능력치", color="점수"),
+        x=compare_df.columns.tolist(),
+        y=compare_df.index.tolist(),
+        color_continuous_scale=color_scale,
+        title=title
+    )
+    fig_heat.update_layout(height=height)
+    return fig_heat
+
+
+def build_score_bar(score_df):
+    """종합 점수 비교 바 차트"""
+    fig_score = go.Figure()
+
+    for _, row in score_df.iterrows():
+        fig_score.add_trace(go.Bar(
+            name=row['Name'],
+            x=['종합능력', '기술', '정신', '신체', '유망주점수'],
+            y=[row['Overall_Rating'], row['Technical_Rating'], row['Mental_Rating'],
+               row['Physical_Rating'], row['Talent_Score_Normalized'] / 5],  # 유망주점수 스케일 조정
+            text=[f'{row["Overall_Rating"]:.1f}', f'{row["Technical_Rating"]:.1f}',
+                  f'{row["Mental_Rating"]:.1f}', f'{row["Physical_Rating"]:.1f}',
+                  f'{row["Talent_Score_Normalized"]:.1f}'],
+            textposition='auto'
+        ))
+
+    fig_score.update_layout(
+        barmode='group',
+        height=500,
+        margin=dict(t=30, b=120, l=50, r=50),
+        yaxis=dict(range=[0, 25], title="점수"),
+        xaxis_title="분류",
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="top", y=-0.15, xanchor="center", x=0.5)
+    )
+    return fig_score